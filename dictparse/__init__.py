@@ -1 +1 @@
-from .parser import DictionaryParser, Param, NameSpace
+from .parser import DictionaryParser, Param, NameSpace, FrozenNameSpace
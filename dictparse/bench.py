@@ -0,0 +1,234 @@
+""" Replay captured payloads against a parser to load-test it offline
+
+Usage:
+    python -m dictparse.bench payloads.jsonl --parser myapp.parsers:user_parser --mode thread --workers 8
+
+Each line of the file is a JSON object passed to parse_dict. The parser is given as 'module:attribute', where the
+attribute is a DictionaryParser or a function returning one.
+"""
+from __future__ import annotations
+
+from .parser import DictionaryParser
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import argparse
+import importlib
+import json
+import sys
+import time
+
+
+MODES: Tuple[str, ...] = ("single", "thread", "process")
+
+# The parser used by each worker process, loaded once by _init_process
+_process_parser: Optional[DictionaryParser] = None
+
+
+def load_parser(spec: str) -> DictionaryParser:
+    """ Import a parser given as 'module:attribute', calling the attribute if it is not a DictionaryParser
+
+    Args:
+        spec: The module and attribute separated by a colon, e.g. 'myapp.parsers:user_parser'
+    Returns:
+        DictionaryParser
+    """
+
+    module_name, _, attr = spec.partition(":")
+    if not module_name or not attr:
+        raise ValueError(f"Invalid parser '{spec}', must be of the form 'module:attribute'")
+    obj: Any = getattr(importlib.import_module(module_name), attr)
+    if not isinstance(obj, DictionaryParser):
+        obj = obj()
+    if not isinstance(obj, DictionaryParser):
+        raise TypeError(f"'{spec}' is not a DictionaryParser or a function returning one")
+    return obj
+
+
+def load_payloads(lines: Iterable[str]) -> List[Any]:
+    """ Decode the JSON payload on each non-blank line """
+    return [json.loads(line) for line in lines if line.strip()]
+
+
+def _replay(parser: DictionaryParser, payloads: Sequence[Any], strict: bool) -> Tuple[List[int], Dict[str, int]]:
+    """ Parse each payload, returning the latency of each parse in nanoseconds and the rejections per exception type.
+        Exceptions other than ParserException, such as a failing action, are counted in the same way, so one bad
+        payload in captured traffic does not abort the run
+    """
+
+    latencies: List[int] = []
+    rejected: Dict[str, int] = {}
+    clock = time.perf_counter_ns
+    for data in payloads:
+        start: int = clock()
+        try:
+            parser.parse_dict(data, strict=strict)
+        except Exception as e:
+            rejected[type(e).__name__] = rejected.get(type(e).__name__, 0) + 1
+        latencies.append(clock() - start)
+    return latencies, rejected
+
+
+def _init_process(spec: str) -> None:
+    global _process_parser
+    _process_parser = load_parser(spec)
+
+
+def _replay_in_process(payloads: Sequence[Any], strict: bool) -> Tuple[List[int], Dict[str, int]]:
+    return _replay(_process_parser, payloads, strict)
+
+
+class BenchReport(object):
+
+    def __init__(self, mode: str, workers: int, elapsed: float, latencies: List[int], rejected: Dict[str, int]):
+        """ The result of a benchmark run
+
+        Args:
+            mode: The mode the payloads were replayed in
+            workers: The number of threads or processes
+            elapsed: The wall clock time of the run in seconds
+            latencies: The latency of each parse in nanoseconds
+            rejected: The number of rejected payloads, per exception type name
+        """
+        self.mode = mode
+        self.workers = workers
+        self.elapsed = elapsed
+        self.parses: int = len(latencies)
+        self.rejected = rejected
+        self._sorted: List[int] = sorted(latencies)
+
+    @property
+    def throughput(self) -> float:
+        """ Parses per second """
+        return self.parses / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, p: float) -> float:
+        """ The latency in microseconds at percentile p (0 - 100), using the nearest rank """
+        if not self._sorted:
+            return 0.0
+        rank: int = max(1, -(-len(self._sorted) * p // 100))
+        return self._sorted[int(rank) - 1] / 1000
+
+    def rejection_rates(self) -> Dict[str, float]:
+        """ The fraction of payloads rejected, per exception type name """
+        return {name: count / self.parses for name, count in self.rejected.items()} if self.parses else {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "workers": self.workers,
+            "parses": self.parses,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "p50_us": self.percentile(50),
+            "p99_us": self.percentile(99),
+            "rejected": dict(sorted(self.rejected.items())),
+            "rejection_rates": dict(sorted(self.rejection_rates().items())),
+        }
+
+    def __str__(self) -> str:
+        lines: List[str] = [
+            f"{self.parses} parses in {self.elapsed:.3f}s ({self.mode}, {self.workers} worker(s))",
+            f"throughput  {self.throughput:>12.1f} parses/s",
+            f"p50         {self.percentile(50):>12.1f} us",
+            f"p99         {self.percentile(99):>12.1f} us",
+        ]
+        rates: Dict[str, float] = self.rejection_rates()
+        for name, count in sorted(self.rejected.items()):
+            lines.append(f"rejected {name}: {count} ({rates[name]:.2%})")
+        return "\n".join(lines)
+
+
+def run(
+        parser: str,
+        payloads: Sequence[Any],
+        mode: str = "single",
+        workers: int = 1,
+        repeat: int = 1,
+        strict: Optional[bool] = False
+) -> BenchReport:
+    """ Replay payloads against a parser, measuring the latency of each parse_dict call
+
+    In 'thread' mode the workers share one parser, in 'process' mode each worker process imports its own.
+
+    Args:
+        parser: The parser as 'module:attribute', see load_parser
+        payloads: The decoded payloads
+        mode: 'single', 'thread' or 'process'
+        workers: The number of threads or processes, ignored in 'single' mode
+        repeat: The number of times to replay the payloads
+        strict: Passed to parse_dict
+    Returns:
+        BenchReport
+    """
+
+    if mode not in MODES:
+        raise ValueError(f"Invalid value '{mode}' for parameter 'mode', must be one of {list(MODES)}")
+    if workers < 1 or repeat < 1:
+        raise ValueError("Parameters 'workers' and 'repeat' must be positive")
+
+    workload: List[Any] = list(payloads) * repeat
+    if mode == "single":
+        workers = 1
+    # Payloads are split into one contiguous chunk per worker
+    size: int = -(-len(workload) // workers) or 1
+    chunks: List[List[Any]] = [workload[i:i + size] for i in range(0, len(workload), size)]
+
+    results: List[Tuple[List[int], Dict[str, int]]]
+    if mode == "single":
+        p: DictionaryParser = load_parser(parser)
+        start: float = time.perf_counter()
+        results = [_replay(p, workload, bool(strict))]
+    elif mode == "thread":
+        p = load_parser(parser)
+        with ThreadPoolExecutor(workers) as executor:
+            start = time.perf_counter()
+            results = list(executor.map(lambda c: _replay(p, c, bool(strict)), chunks))
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_process, initargs=(parser,)) as executor:
+            # Start the workers before timing, so process start up is not measured
+            list(executor.map(_replay_in_process, [[]] * workers, [False] * workers))
+            start = time.perf_counter()
+            results = list(executor.map(_replay_in_process, chunks, [bool(strict)] * len(chunks)))
+    elapsed: float = time.perf_counter() - start
+
+    latencies: List[int] = []
+    rejected: Dict[str, int] = {}
+    for chunk_latencies, chunk_rejected in results:
+        latencies.extend(chunk_latencies)
+        for name, count in chunk_rejected.items():
+            rejected[name] = rejected.get(name, 0) + count
+    return BenchReport(mode, workers, elapsed, latencies, rejected)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(
+        prog="python -m dictparse.bench",
+        description="Replay JSONL payloads against a parser, reporting throughput, latency and rejections"
+    )
+    arg_parser.add_argument("payloads", help="A file with one JSON payload per line, or - for stdin")
+    arg_parser.add_argument("--parser", required=True, help="The parser as 'module:attribute'")
+    arg_parser.add_argument("--mode", choices=MODES, default="single")
+    arg_parser.add_argument("--workers", type=int, default=4, help="Threads or processes (default 4)")
+    arg_parser.add_argument("--repeat", type=int, default=1, help="Times to replay the payloads (default 1)")
+    arg_parser.add_argument("--strict", action="store_true", help="Parse with strict=True")
+    arg_parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = arg_parser.parse_args(argv)
+
+    if args.payloads == "-":
+        payloads: List[Any] = load_payloads(sys.stdin)
+    else:
+        with open(args.payloads, encoding="utf-8") as f:
+            payloads = load_payloads(f)
+
+    # Allow the parser module to be imported from the current directory, as with python -m
+    if "" not in sys.path:
+        sys.path.insert(0, "")
+
+    report: BenchReport = run(args.parser, payloads, args.mode, args.workers, args.repeat, args.strict)
+    print(json.dumps(report.to_dict(), indent=2) if args.json else report)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
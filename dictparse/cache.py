@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from .parser import FrozenNameSpace, Param
+
+from collections import OrderedDict, namedtuple
+from typing import Any, Dict, Hashable, Optional, Tuple
+import sys
+import threading
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "bypassed", "maxsize", "currsize", "maxbytes", "currbytes"])
+
+_SCALARS: frozenset = frozenset((str, int, bool, bytes, type(None)))
+
+
+class _Unhashable(Exception):
+    """ Raised internally when a value cannot be turned into a cache key """
+
+
+def _freeze(v: Any) -> Hashable:
+    """ Return a hashable structural key for v, tagging each value with its type so 1, 1.0 and True differ """
+
+    t: type = type(v)
+    if t in _SCALARS:
+        return t, v
+    if t is float:
+        # 0.0 == -0.0 but str() differs, so signed zeros are keyed by their repr
+        return (t, v) if v else (t, repr(v))
+    if t is list or t is tuple:
+        return t, tuple([_freeze(i) for i in v])
+    if t is dict:
+        return t, tuple([(_freeze(k), _freeze(i)) for k, i in v.items()])
+    if t is set or t is frozenset:
+        return t, frozenset([_freeze(i) for i in v])
+    raise _Unhashable
+
+
+class ResultCache(object):
+
+    def __init__(self, maxsize: int, maxbytes: Optional[int] = None):
+        """ A thread-safe LRU cache of parse results, bounded by entry count and approximate memory
+
+        Args:
+            maxsize: The maximum number of cached results
+            maxbytes: The maximum approximate size in bytes of the cached keys and values, defaults to unbounded
+        """
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError(f"Invalid value '{maxsize}' for parameter 'cache_size', must be a positive int")
+        if maxbytes is not None and (not isinstance(maxbytes, int) or maxbytes < 1):
+            raise ValueError(f"Invalid value '{maxbytes}' for parameter 'cache_bytes', must be a positive int")
+
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self.bypassed: int = 0
+        self._bytes: int = 0
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(data: Dict[str, Any], names: Dict[str, Param]) -> Optional[Tuple]:
+        """ Build a key from the values of the declared keys in data, ignoring undeclared keys.
+            Returns None if a value cannot be keyed
+        """
+        try:
+            return tuple([_freeze(data.get(n)) for n in names])
+        except _Unhashable:
+            return None
+
+    def get(self, key: Tuple) -> Optional[FrozenNameSpace]:
+        """ Return the cached FrozenNameSpace for key or None, recording a hit or a miss """
+        with self._lock:
+            entry: Optional[Tuple[FrozenNameSpace, int]] = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Tuple, ns: FrozenNameSpace) -> FrozenNameSpace:
+        """ Cache and return ns, evicting the least recently used entries until the cache is within its bounds.
+            If an equal key was cached concurrently, the existing result is returned
+        """
+        size: int = sys.getsizeof(key) + sys.getsizeof(ns._values) + sum(sys.getsizeof(v) for v in ns._values)
+
+        if self.maxbytes is not None and size > self.maxbytes:
+            return ns
+
+        with self._lock:
+            if key in self._entries:
+                return self._entries[key][0]
+            self._entries[key] = (ns, size)
+            self._bytes += size
+            while len(self._entries) > self.maxsize or (self.maxbytes is not None and self._bytes > self.maxbytes):
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._bytes -= evicted
+        return ns
+
+    def bypass(self) -> None:
+        """ Record a parse that could not use the cache """
+        self.bypassed += 1
+
+    def clear(self) -> None:
+        """ Remove all cached results, keeping the statistics """
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def info(self) -> CacheInfo:
+        """ Return the cache statistics """
+        with self._lock:
+            return CacheInfo(
+                self.hits, self.misses, self.bypassed, self.maxsize, len(self._entries), self.maxbytes, self._bytes
+            )
@@ -0,0 +1,302 @@
+from .parser import (
+    _TRUE_STRINGS,
+    _FALSE_STRINGS,
+    _STRICT_INT,
+    _STRICT_FLOAT,
+    _MUTABLE_DEFAULT_TYPES,
+    _copies_shallow,
+    _Rule,
+    _MutuallyExclusiveRule,
+    _RequiredIfRule,
+    _CompareRule
+)
+
+from typing import Any, List, TYPE_CHECKING
+import ast
+
+if TYPE_CHECKING:
+    from .parser import DictionaryParser
+
+
+def _literal(v: Any, what: str) -> str:
+    """ Return the source representation of v, raising a ValueError if it cannot be round-tripped as a literal """
+
+    src: str = repr(v)
+    try:
+        ok: bool = ast.literal_eval(src) == v
+    except (ValueError, SyntaxError):
+        ok = False
+    if not ok:
+        raise ValueError(f"Cannot generate source for {what} '{src}', it must be a Python literal")
+    return src
+
+
+def _rule_source(rule: _Rule, constants: List[str]) -> List[str]:
+    """ Return the lines checking a cross-field rule, where the value of the parameter at position i is f{i} """
+
+    def present(n: str) -> str:
+        return f"data.get({n!r}) not in ('', None)"
+
+    def missing(n: str) -> str:
+        return f"data.get({n!r}) in ('', None)"
+
+    lines: List[str] = []
+    if isinstance(rule, _MutuallyExclusiveRule):
+        lines.append(f"    present = tuple([n for n in {rule.names!r} if data.get(n) not in ('', None)])")
+        lines.append("    if len(present) > 1:")
+        lines.append("        raise ParserConstraintError(present, 'only one of them may be given')")
+        if rule.required:
+            lines.append("    if not present:")
+            lines.append(f"        raise ParserConstraintError({rule.names!r}, 'one of them is required')")
+    elif isinstance(rule, _RequiredIfRule):
+        if rule.other_index is None:
+            trigger: str = present(rule.other)
+        else:
+            constant: str = f"_RULE_VALUE_{len(constants)}"
+            constants.append(f"{constant} = {_literal(rule.value, 'required_if value')}")
+            trigger = f"f{rule.other_index} == {constant}"
+        lines.append(f"    if {trigger} and {missing(rule.name)}:")
+        lines.append(f"        raise ParserRequiredKeyError({rule.name!r})")
+    elif isinstance(rule, _CompareRule):
+        a: str = f"f{rule.left_index}"
+        b: str = f"f{rule.right_index}"
+        lines.append(f"    if {a} is not None and {b} is not None:")
+        lines.append("        try:")
+        lines.append(f"            ok = {a} {rule.op} {b}")
+        lines.append("        except TypeError:")
+        lines.append("            ok = False")
+        lines.append("        if not ok:")
+        lines.append(
+            f"            raise ParserConstraintError({(rule.left, rule.right)!r}, "
+            f"{'expected ' + rule.left + ' ' + rule.op + ' ' + rule.right!r})"
+        )
+    else:
+        raise ValueError(f"Cannot generate source for rule '{type(rule).__name__}'")
+    return lines
+
+
+def _numeric_source(param: Any, i: int, constants: List[str]) -> List[str]:
+    """ Return the lines converting the int or float value v of a parameter with strict_numeric, minimum or maximum,
+        performing the same checks as the coercer built by _numeric_coercer
+    """
+
+    name: str = repr(param.name)
+    type_name: str = param.type_.__name__
+    lines: List[str] = []
+    if not param.strict_numeric:
+        lines.append("        try:")
+        lines.append(f"            v = {type_name}(v)")
+        lines.append("        except (ValueError, TypeError, OverflowError):")
+        lines.append(f"            raise ParserTypeError({name}, v, {type_name})")
+    else:
+        pattern: str = f"_NUMERIC_RE_{i}"
+        constants.append(f"{pattern} = re.compile({(_STRICT_INT if param.type_ is int else _STRICT_FLOAT)!r})")
+        lines.append("        t = type(v)")
+        if param.type_ is int:
+            lines.append("        if t is int:")
+            lines.append("            pass")
+            lines.append(f"        elif t is str and ((v.isdigit() and v.isascii()) or {pattern}.fullmatch(v)):")
+            lines.append("            try:")
+            lines.append("                v = int(v)")
+            lines.append("            except ValueError:")
+            lines.append(f"                raise ParserTypeError({name}, v, int)")
+            lines.append("        elif t is float and v.is_integer():")
+            lines.append("            v = int(v)")
+            lines.append("        else:")
+            lines.append(f"            raise ParserTypeError({name}, v, int)")
+        else:
+            lines.append("        if t is float:")
+            lines.append("            n = v")
+            lines.append(f"        elif t is int or (t is str and {pattern}.fullmatch(v)):")
+            lines.append("            try:")
+            lines.append("                n = float(v)")
+            lines.append("            except (ValueError, OverflowError):")
+            lines.append(f"                raise ParserTypeError({name}, v, float)")
+            lines.append("        else:")
+            lines.append(f"            raise ParserTypeError({name}, v, float)")
+            lines.append("        if n - n != 0:")
+            lines.append(f"            raise ParserTypeError({name}, v, float)")
+            lines.append("        v = n")
+
+    # Written as 'not low <= v' so that nan is rejected, as in parse_dict
+    bounds: List[str] = []
+    if param.minimum is not None:
+        bounds.append(_literal(param.minimum, "minimum"))
+    bounds.append("v")
+    if param.maximum is not None:
+        bounds.append(_literal(param.maximum, "maximum"))
+    if len(bounds) > 1:
+        lines.append(f"        if not {' <= '.join(bounds)}:")
+        lines.append(f"            raise ParserRangeError({name}, v, {param.minimum!r}, {param.maximum!r})")
+    return lines
+
+
+def generate_source(parser: "DictionaryParser", func_name: str = "parse") -> str:
+    """ Generate the source of a standalone Python module that validates data the same way as parser.parse_dict
+
+    The module contains a single function `func_name(data, strict=False, action=None, ignore_required=None)` with the
+    checks for each parameter unrolled into straight-line code. The function returns a dict mapping each parameter's
+    `dest` to its parsed value, raising the same exceptions as DictionaryParser.parse_dict.
+
+    Args:
+        parser: The DictionaryParser to generate the module from
+        func_name: The name of the generated function, defaults to 'parse'
+    Returns:
+        str
+    """
+
+    if not func_name.isidentifier():
+        raise ValueError(f"Invalid value '{func_name}' for parameter 'func_name', must be a valid identifier")
+
+    params: list = list(parser._params.values())
+    constants: List[str] = []
+    body: List[str] = []
+    uses_regex: bool = False
+    uses_copy: bool = False
+    uses_bool: bool = False
+
+    constants.append(f"_KEYS = frozenset({_literal(tuple(parser._params), 'keys')})")
+
+    if parser._resolve:
+        # Aliases and style-insensitive keys are resolved to parameter names before any checks
+        constants.append(f"_INDEX = {_literal(parser._key_index, 'aliases')}")
+        lookup: str = "k"
+        if parser.ignore_key_style:
+            constants.append("_STYLE = str.maketrans('', '', '_-')")
+            lookup = "k.translate(_STYLE).lower() if isinstance(k, str) else k"
+        body.append("    src = {}")
+        body.append("    for k, v in data.items():")
+        body.append(f"        n = _INDEX.get({lookup})")
+        body.append("        if n is None:")
+        body.append("            if strict:")
+        body.append("                raise ParserInvalidKeyError(k)")
+        body.append("            continue")
+        body.append("        if k == n or n not in src:")
+        body.append("            src[n] = v")
+        body.append("    data = src")
+
+    for r in parser._required_keys:
+        name: str = repr(r)
+        body.append(f"    if {name} not in data and not (ignore_required and {name} in ignore_required):")
+        body.append(f"        raise ParserRequiredKeyError({name})")
+
+    body.append("    if strict:")
+    body.append("        for k in data:")
+    body.append("            if k not in _KEYS:")
+    body.append("                raise ParserInvalidKeyError(k)")
+
+    for i, param in enumerate(params):
+
+        for rule in parser._rules.get(i, ()):
+            body.extend(_rule_source(rule, constants))
+
+        if param.action:
+            raise ValueError(f"Cannot generate source for parameter '{param.name}', 'action' callables are not supported")
+        if param._elements:
+            raise ValueError(
+                f"Cannot generate source for parameter '{param.name}', element and length validation is not supported"
+            )
+
+        if param.default_factory is not None:
+            raise ValueError(f"Cannot generate source for parameter '{param.name}', 'default_factory' is not supported")
+
+        name = repr(param.name)
+        default: str = f"_DEFAULT_{i}"
+        constants.append(f"{default} = {_literal(param.default, 'default')}")
+        if type(param.default) in _MUTABLE_DEFAULT_TYPES:
+            # Copied like DictionaryParser does, so results never share a mutable default
+            if _copies_shallow(param.default):
+                default = f"{default}.copy()"
+            else:
+                uses_copy = True
+                default = f"copy.deepcopy({default})"
+
+        body.append("")
+        body.append(f"    # {param.name}")
+        body.append(f"    v = data.get({name})")
+        body.append("    if v is None or v == '':")
+        body.append(f"        f{i} = {default}")
+
+        if param.regex:
+            uses_regex = True
+            constants.append(f"_RE_{i} = re.compile({param.regex!r})")
+            body.append(f"    elif _RE_{i}.match(str(v)) is None:")
+            body.append(f"        f{i} = {default}")
+
+        body.append("    else:")
+
+        if param.type_ is bool:
+            uses_bool = True
+            body.append("        s = str(v).lower()")
+            body.append("        if s in _TRUE:")
+            body.append("            v = True")
+            body.append("        elif s in _FALSE:")
+            body.append("            v = False")
+            body.append("        else:")
+            body.append(f"            raise ParserTypeError({name}, v, bool)")
+        elif param._coerce is not None:
+            uses_regex = uses_regex or bool(param.strict_numeric)
+            body.extend(_numeric_source(param, i, constants))
+        elif param.type_:
+            type_name: str = param.type_.__name__
+            body.append("        try:")
+            body.append(f"            v = {type_name}(v)")
+            body.append("        except (ValueError, TypeError, OverflowError):")
+            body.append(f"            raise ParserTypeError({name}, v, {type_name})")
+
+        if param.choices:
+            choices: str = f"_CHOICES_{i}"
+            lookup = choices
+            constants.append(f"{choices} = {_literal(list(param.choices), 'choices')}")
+            if param.type_ in (str, int, float, bool):
+                lookup = f"_CHOICE_SET_{i}"
+                constants.append(f"{lookup} = frozenset({choices})")
+            body.append(f"        if v not in {lookup}:")
+            body.append(f"            raise ParserInvalidChoiceError({name}, v, {choices})")
+
+        body.append("        if action is not None:")
+        body.append("            v = action(v)")
+        body.append(f"        f{i} = v")
+
+    for rule in parser._rules.get(len(params), ()):
+        body.extend(_rule_source(rule, constants))
+
+    body.append("")
+    body.append("    return {")
+    for i, param in enumerate(params):
+        body.append(f"        {param.dest!r}: f{i},")
+    body.append("    }")
+
+    if uses_bool:
+        constants.append(f"_TRUE = frozenset({tuple(sorted(_TRUE_STRINGS))!r})")
+        constants.append(f"_FALSE = frozenset({tuple(sorted(_FALSE_STRINGS))!r})")
+
+    header: List[str] = [
+        f'""" Generated by dictparse from DictionaryParser(description={parser.description!r}), do not edit """',
+        "",
+        "from dictparse.exceptions import (",
+        "    ParserTypeError,",
+        "    ParserInvalidChoiceError,",
+        "    ParserRequiredKeyError,",
+        "    ParserInvalidKeyError,",
+        "    ParserInvalidDataTypeError,",
+        "    ParserConstraintError,",
+        "    ParserRangeError",
+        ")",
+    ]
+    if uses_regex or uses_copy:
+        header.append("")
+    if uses_copy:
+        header.append("import copy")
+    if uses_regex:
+        header.append("import re")
+
+    signature: List[str] = [
+        f"def {func_name}(data, strict=False, action=None, ignore_required=None):",
+        "    if not isinstance(data, dict):",
+        "        raise ParserInvalidDataTypeError(data)",
+        "    if action is not None and not callable(action):",
+        "        raise TypeError(f\"Invalid type for parameter 'action', '{type(action)}' is not callable\")",
+    ]
+
+    return "\n".join(header + ["", ""] + constants + ["", ""] + signature + body) + "\n"
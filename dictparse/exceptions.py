@@ -1,66 +1,100 @@
-from typing import Any, Union, Optional
+from __future__ import annotations
+
+from itertools import islice
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Union, Optional
+
+
+_TYPE_NAMES: dict = {
+    str: "str",
+    int: "int",
+    float: "float",
+    bool: "bool",
+    list: "list",
+    tuple: "list",
+    set: "list",
+    dict: "dict",
+}
+
+# The maximum number of choices included in the message of a ParserInvalidChoiceError
+MAX_CHOICES_IN_MESSAGE: int = 10
 
 
 class ParserException(Exception):
+    """ Base class for all parser exceptions. Subclasses store their arguments and only format the message when the
+        exception is converted to a string, so raising and catching them is cheap
+    """
+
+    def __str__(self) -> str:
+        return self._format()
 
-    def __init__(self, msg: str):
-        super().__init__(msg)
+    def _format(self) -> str:
+        return super().__str__()
 
     @staticmethod
     def _get_type_str(v: Any, from_type: Optional[bool] = False) -> Union[str, None]:
-        m: dict = {
-            str: "str",
-            int: "int",
-            float: "float",
-            bool: "bool",
-            list: "list",
-            tuple: "list",
-            set: "list",
-            dict: "dict",
-        }
         if from_type:
-            return m.get(v, None)
+            return _TYPE_NAMES.get(v, None)
         else:
-            return m.get(type(v))
+            return _TYPE_NAMES.get(type(v))
 
 
 class ParserTypeError(ParserException):
     """ Raised when a key cannot be converted to the type defined in DictionaryParser.add_param    """
 
     def __init__(self, param: str, value: Any, expected: Optional[type] = None):
+        super().__init__(param, value, expected)
         self.param = param
         self.value = value
-        super().__init__(
+        self.expected = expected
+
+    def _format(self) -> str:
+        return (
             f"Invalid value '{self.value}' for parameter '{self.param}', expected "
-            f"'{self._get_type_str(expected, from_type=True)}' not '{self._get_type_str(self.value)}'"
+            f"'{self._get_type_str(self.expected, from_type=True)}' not '{self._get_type_str(self.value)}'"
         )
 
 
-
 class ParserDuplicateKeyError(ParserException):
     """ Raised when a duplicate key name is added to DictionaryParser.add_param """
 
     def __init__(self, param: str):
+        super().__init__(param)
         self.param = param
-        super().__init__(f"Duplicate key '{self.param}'")
+
+    def _format(self) -> str:
+        return f"Duplicate key '{self.param}'"
 
 
 class ParserRequiredKeyError(ParserException):
     """ Raised when a required key is not found """
 
     def __init__(self, param: str):
+        super().__init__(param)
         self.param = param
-        super().__init__(f"Missing required parameter '{self.param}'")
+
+    def _format(self) -> str:
+        return f"Missing required parameter '{self.param}'"
 
 
 class ParserInvalidChoiceError(ParserException):
     """ Raised when the key value is not in the list of choices added in DictionaryParser.add_param """
 
     def __init__(self, param: str, value: Any, choices: Union[list, set, tuple]):
+        super().__init__(param, value, choices)
         self.param = param
         self.value = value
         self.choices = choices
-        super().__init__(f"Parameter '{self.param}' must be one of '{list(choices)}', not '{self.value}'")
+
+    def _format(self) -> str:
+        if len(self.choices) <= MAX_CHOICES_IN_MESSAGE:
+            choices: str = str(list(self.choices))
+        else:
+            shown: str = ", ".join(repr(c) for c in islice(self.choices, MAX_CHOICES_IN_MESSAGE))
+            choices = f"[{shown}, ... {len(self.choices) - MAX_CHOICES_IN_MESSAGE} more]"
+        return f"Parameter '{self.param}' must be one of '{choices}', not '{self.value}'"
 
 
 class ParserInvalidKeyError(ParserException):
@@ -69,14 +103,92 @@ class ParserInvalidKeyError(ParserException):
     """
 
     def __init__(self, param: str):
+        super().__init__(param)
         self.param = param
-        super().__init__(f"Invalid parameter '{self.param}'")
+
+    def _format(self) -> str:
+        return f"Invalid parameter '{self.param}'"
 
 
 class ParserInvalidDataTypeError(ParserException, TypeError):
     """ Raised when `parse_params` is not given a dict or dict-like object for `data` """
 
     def __init__(self, data: Any):
+        super().__init__(data)
         self.param = data
-        super().__init__(f"Invalid type for 'data', must be a dict or dict-like object, not "
-                         f"'{self._get_type_str(data)}'")
+
+    def _format(self) -> str:
+        return f"Invalid type for 'data', must be a dict or dict-like object, not '{self._get_type_str(self.param)}'"
+
+
+class ParserConstraintError(ParserException):
+    """ Raised when the data does not satisfy a constraint added with DictionaryParser.add_constraint or
+        DictionaryParser.mutually_exclusive
+    """
+
+    def __init__(self, params: tuple, constraint: str):
+        super().__init__(params, constraint)
+        self.params = params
+        self.constraint = constraint
+
+    def _format(self) -> str:
+        return f"Invalid parameters {', '.join(repr(p) for p in self.params)}, {self.constraint}"
+
+
+class ParserLengthError(ParserException):
+    """ Raised when the length of a value is outside the min_length and max_length added in DictionaryParser.add_param """
+
+    def __init__(self, param: str, length: int, min_length: Optional[int] = None, max_length: Optional[int] = None):
+        super().__init__(param, length, min_length, max_length)
+        self.param = param
+        self.length = length
+        self.min_length = min_length
+        self.max_length = max_length
+
+    def _format(self) -> str:
+        if self.max_length is None:
+            bounds: str = f"of at least {self.min_length}"
+        elif self.min_length is None:
+            bounds = f"of at most {self.max_length}"
+        else:
+            bounds = f"between {self.min_length} and {self.max_length}"
+        return f"Parameter '{self.param}' must have a length {bounds}, not {self.length}"
+
+
+class ParserPatternError(ParserException):
+    """ Raised when an element of a value does not match the element_regex added in DictionaryParser.add_param """
+
+    def __init__(self, param: str, value: Any, pattern: str):
+        super().__init__(param, value, pattern)
+        self.param = param
+        self.value = value
+        self.pattern = pattern
+
+    def _format(self) -> str:
+        return f"Elements of parameter '{self.param}' must match '{self.pattern}', not '{self.value}'"
+
+
+class ParserRangeError(ParserException):
+    """ Raised when a number is outside the minimum and maximum added in DictionaryParser.add_param """
+
+    def __init__(
+            self,
+            param: str,
+            value: Any,
+            minimum: Optional[Union[int, float]] = None,
+            maximum: Optional[Union[int, float]] = None
+    ):
+        super().__init__(param, value, minimum, maximum)
+        self.param = param
+        self.value = value
+        self.minimum = minimum
+        self.maximum = maximum
+
+    def _format(self) -> str:
+        if self.maximum is None:
+            bounds: str = f"at least {self.minimum}"
+        elif self.minimum is None:
+            bounds = f"at most {self.maximum}"
+        else:
+            bounds = f"between {self.minimum} and {self.maximum}"
+        return f"Parameter '{self.param}' must be {bounds}, not {self.value}"
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+from .exceptions import ParserException
+from .parser import DictionaryParser, NameSpace, FrozenNameSpace, _normalize_key
+
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl
+import json
+
+
+# Values for the `source` argument of the decorators
+SOURCES: Tuple[str, ...] = ("auto", "json", "form", "args")
+
+_MULTI_VALUE_TYPES: Tuple[type, ...] = (list, tuple, set)
+
+_JSON_HEADERS: List[Tuple[str, str]] = [("Content-Type", "application/json")]
+_ASGI_JSON_HEADERS: List[Tuple[bytes, bytes]] = [(b"content-type", b"application/json")]
+
+_INVALID_JSON: str = "Invalid JSON body"
+
+
+def _check_source(source: str) -> None:
+    if source not in SOURCES:
+        raise ValueError(f"Invalid value '{source}' for parameter 'source', must be one of {list(SOURCES)}")
+
+
+def _pick_source(source: str, content_type: str) -> str:
+    """ Choose where to read the data from, for source='auto' this depends on the content type of the request """
+
+    if source != "auto":
+        return source
+    content_type = content_type.split(";", 1)[0].strip().lower()
+    if content_type == "application/json" or content_type.endswith("+json"):
+        return "json"
+    if content_type == "application/x-www-form-urlencoded":
+        return "form"
+    return "args"
+
+
+def _from_pairs(parser: DictionaryParser, pairs: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """ Build a dict from the key value pairs of a query string or form, keeping every value of parameters with a type
+        of list, tuple or set and the first value of the others. Keys are matched to parameters like parse_dict does,
+        including aliases and ignore_key_style
+    """
+
+    data: Dict[str, Any] = {}
+    for k, v in pairs:
+        name: Optional[str] = parser._key_index.get(_normalize_key(k) if parser.ignore_key_style else k)
+        param: Any = parser._params.get(name) if name is not None else None
+        if param is not None and param.type_ in _MULTI_VALUE_TYPES:
+            # The values of every key matching the parameter are collected under its name
+            data.setdefault(name, []).append(v)
+        elif k not in data:
+            data[k] = v
+    return data
+
+
+def _decode(parser: DictionaryParser, source: str, body: bytes, query: str) -> Any:
+    """ Decode the data of a request, raising a ValueError if the body is not valid JSON """
+
+    if source == "json":
+        return json.loads(body) if body else {}
+    if source == "form":
+        return _from_pairs(parser, parse_qsl(body.decode("utf-8", "replace"), keep_blank_values=True))
+    return _from_pairs(parser, parse_qsl(query, keep_blank_values=True))
+
+
+def _error_body(message: str) -> bytes:
+    return json.dumps({"error": message}).encode("utf-8")
+
+
+def wsgi(
+        parser: DictionaryParser,
+        source: str = "auto",
+        strict: Optional[bool] = False,
+        frozen: Optional[bool] = False,
+        arg: str = "params"
+) -> Callable[[Callable], Callable]:
+    """ Decorate a WSGI application, parsing each request with a shared parser and passing the NameSpace to the
+        application as the keyword argument `arg`. Invalid requests get a 400 response with a JSON body of the form
+        {"error": message} and the application is not called
+
+    Args:
+        parser: The parser, built once and shared by every request
+        source: Where to read the data from, 'json' (the request body), 'form' (a urlencoded body), 'args' (the query
+                string) or 'auto' (the default) to choose from the content type of the request
+        strict: Passed to parse_dict
+        frozen: Passed to parse_dict
+        arg: The name of the keyword argument the NameSpace is passed as, defaults to 'params'
+    Returns:
+        A decorator taking a WSGI application called as app(environ, start_response, params=...)
+    """
+
+    _check_source(source)
+
+    def decorator(func: Callable) -> Callable:
+
+        @wraps(func)
+        def app(environ: Dict[str, Any], start_response: Callable) -> Any:
+            s: str = _pick_source(source, environ.get("CONTENT_TYPE", ""))
+            body: bytes = b""
+            if s != "args":
+                try:
+                    length: int = int(environ.get("CONTENT_LENGTH") or 0)
+                except ValueError:
+                    length = 0
+                if length > 0:
+                    body = environ["wsgi.input"].read(length)
+            try:
+                data: Any = _decode(parser, s, body, environ.get("QUERY_STRING", ""))
+            except ValueError:
+                start_response("400 Bad Request", _JSON_HEADERS)
+                return [_error_body(_INVALID_JSON)]
+            try:
+                params: Union[NameSpace, FrozenNameSpace] = parser.parse_dict(data, strict=strict, frozen=frozen)
+            except ParserException as e:
+                start_response("400 Bad Request", _JSON_HEADERS)
+                return [_error_body(str(e))]
+            return func(environ, start_response, **{arg: params})
+
+        return app
+
+    return decorator
+
+
+def asgi(
+        parser: DictionaryParser,
+        source: str = "auto",
+        strict: Optional[bool] = False,
+        frozen: Optional[bool] = False,
+        arg: str = "params"
+) -> Callable[[Callable], Callable]:
+    """ Decorate an ASGI application, parsing each HTTP request with a shared parser and passing the NameSpace to the
+        application as the keyword argument `arg`. Invalid requests get a 400 response with a JSON body of the form
+        {"error": message} and the application is not called. Other scopes, such as 'lifespan', are passed through
+
+    Args:
+        parser: The parser, built once and shared by every request
+        source: Where to read the data from, 'json', 'form', 'args' or 'auto', see wsgi
+        strict: Passed to parse_dict
+        frozen: Passed to parse_dict
+        arg: The name of the keyword argument the NameSpace is passed as, defaults to 'params'
+    Returns:
+        A decorator taking an ASGI application called as app(scope, receive, send, params=...)
+    """
+
+    _check_source(source)
+
+    def decorator(func: Callable[..., Awaitable]) -> Callable[..., Awaitable]:
+
+        @wraps(func)
+        async def app(scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+            if scope["type"] != "http":
+                return await func(scope, receive, send)
+
+            content_type: bytes = b""
+            for k, v in scope.get("headers", ()):
+                if k.lower() == b"content-type":
+                    content_type = v
+                    break
+            s: str = _pick_source(source, content_type.decode("latin-1"))
+
+            body: bytes = b""
+            if s != "args":
+                chunks: List[bytes] = []
+                more: bool = True
+                while more:
+                    message: Dict[str, Any] = await receive()
+                    chunks.append(message.get("body", b""))
+                    more = message.get("more_body", False)
+                body = b"".join(chunks)
+
+            error: Optional[str] = None
+            try:
+                data: Any = _decode(parser, s, body, scope.get("query_string", b"").decode("latin-1"))
+            except ValueError:
+                error = _INVALID_JSON
+            else:
+                try:
+                    params: Union[NameSpace, FrozenNameSpace] = parser.parse_dict(data, strict=strict, frozen=frozen)
+                except ParserException as e:
+                    error = str(e)
+            if error is not None:
+                await send({"type": "http.response.start", "status": 400, "headers": _ASGI_JSON_HEADERS})
+                await send({"type": "http.response.body", "body": _error_body(error)})
+                return
+            return await func(scope, receive, send, **{arg: params})
+
+        return app
+
+    return decorator
+
+
+def flask(
+        parser: DictionaryParser,
+        source: str = "auto",
+        strict: Optional[bool] = False,
+        frozen: Optional[bool] = False,
+        arg: str = "params"
+) -> Callable[[Callable], Callable]:
+    """ Decorate a Flask view, parsing each request with a shared parser and passing the NameSpace to the view as the
+        keyword argument `arg`. Invalid requests get a 400 response with a JSON body of the form {"error": message}
+        and the view is not called. Flask is only imported when a decorated view is called
+
+    Args:
+        parser: The parser, built once and shared by every request
+        source: Where to read the data from, 'json', 'form', 'args' or 'auto', see wsgi
+        strict: Passed to parse_dict
+        frozen: Passed to parse_dict
+        arg: The name of the keyword argument the NameSpace is passed as, defaults to 'params'
+    Returns:
+        A decorator taking a Flask view function
+    """
+
+    _check_source(source)
+
+    def decorator(func: Callable) -> Callable:
+
+        @wraps(func)
+        def view(*args: Any, **kwargs: Any) -> Any:
+            from flask import request, jsonify
+
+            s: str = _pick_source(source, request.content_type or "")
+            if s == "json":
+                data: Any = request.get_json(force=True, silent=True)
+                if data is None:
+                    if request.get_data():
+                        return jsonify(error=_INVALID_JSON), 400
+                    data = {}
+            else:
+                data = _from_pairs(parser, list((request.form if s == "form" else request.args).items(multi=True)))
+            try:
+                params: Union[NameSpace, FrozenNameSpace] = parser.parse_dict(data, strict=strict, frozen=frozen)
+            except ParserException as e:
+                return jsonify(error=str(e)), 400
+            kwargs[arg] = params
+            return func(*args, **kwargs)
+
+        return view
+
+    return decorator
@@ -1,16 +1,271 @@
+from __future__ import annotations
+
 from .exceptions import (
     ParserTypeError,
     ParserInvalidChoiceError,
     ParserRequiredKeyError,
     ParserInvalidKeyError,
     ParserDuplicateKeyError,
-    ParserInvalidDataTypeError
+    ParserInvalidDataTypeError,
+    ParserConstraintError,
+    ParserLengthError,
+    ParserPatternError,
+    ParserRangeError
 )
 
-from typing import Optional, Callable, List, Any, Union, Dict, Type, Sequence, Tuple, Set
-from distutils.util import strtobool
 import keyword
-import re
+
+# typing (which imports re) is only needed by type checkers, annotations are not evaluated at runtime
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional, Callable, List, Any, Union, Dict, Type, Tuple, Set, Sequence, Iterable
+    from .cache import ResultCache, CacheInfo
+    from .profiling import ProfileReport
+
+
+# Attribute and method names of NameSpace and FrozenNameSpace which cannot be used for 'name' or 'dest'
+_RESERVED_NAMES: frozenset = frozenset((
+    "get", "get_param", "to_dict", "to_json", "to_tuple", "from_namespace", "_fields", "_params", "_values", "_index", "_make",
+    "_replace", "_lazy"
+))
+
+# Sentinel for arguments which were not supplied, where None is a valid value
+_MISSING: object = object()
+
+_TRUE_STRINGS: frozenset = frozenset(("y", "yes", "t", "true", "on", "1"))
+_FALSE_STRINGS: frozenset = frozenset(("n", "no", "f", "false", "off", "0"))
+
+
+def _strtobool(v: str) -> bool:
+    """ Convert a string representation of truth to True or False, raises a ValueError if v is not recognised """
+
+    v = v.lower()
+    if v in _TRUE_STRINGS:
+        return True
+    elif v in _FALSE_STRINGS:
+        return False
+    raise ValueError(f"Invalid truth value '{v}'")
+
+
+def _convert(name: str, type_: Type, value: Any) -> Any:
+    """ Convert value to type_, raising a ParserTypeError if it cannot be converted, including values of the wrong
+        shape such as a list for an int or a number for a list
+    """
+
+    try:
+        if type_ is bool:
+            return _strtobool(str(value))
+        return type_(value)
+    except (ValueError, TypeError, OverflowError):
+        raise ParserTypeError(name, value, type_)
+
+
+def _is_choice(value: Any, choices: Union[list, set, tuple]) -> bool:
+    try:
+        return value in choices
+    except TypeError:
+        # An unhashable value cannot be in a set of choices
+        return False
+
+
+# parse_dict runs regex matching and actions through these functions, so DictionaryParser.profile can attribute the
+# memory they allocate to a stage by their code objects
+def _match(pattern: Any, value: Any) -> bool:
+    return pattern.match(str(value)) is not None
+
+
+def _apply(action: Callable, value: Any) -> Any:
+    return action(value)
+
+
+def _to_bool(v: Any) -> bool:
+    return _strtobool(str(v))
+
+
+# Types which can be given as the element type of a list, tuple or set, e.g. list[int]
+_ELEMENT_TYPES: Tuple[type, ...] = (str, int, float, bool)
+_SEQUENCE_TYPES: Tuple[type, ...] = (list, tuple, set)
+
+# Typecodes of the arrays returned for parameters added with array=True
+_ARRAY_TYPECODES: Dict[type, str] = {int: "q", float: "d"}
+
+
+def _split_type(type_: Any) -> Tuple[Any, Optional[Any]]:
+    """ Split a parameterized type such as list[int], List[int], set[str] or tuple[float, ...] into the container type
+        and the element type. Other types are returned unchanged, with an element type of None
+    """
+
+    origin: Any = getattr(type_, "__origin__", None)
+    if origin not in _SEQUENCE_TYPES:
+        return type_, None
+    args: tuple = getattr(type_, "__args__", None) or ()
+    if origin is tuple and len(args) == 2 and args[1] is Ellipsis:
+        args = args[:1]
+    if len(args) != 1:
+        raise TypeError(f"Parameter 'type_' must have a single element type, not '{type_}'")
+    # Unparameterized typing.List has a TypeVar as its argument on older versions of Python
+    return origin, args[0] if isinstance(args[0], type) else None
+
+
+# Strict grammars for numeric strings: ASCII digits only, no whitespace, underscores, nan or inf
+_STRICT_INT: str = r"[+-]?[0-9]+"
+_STRICT_FLOAT: str = r"[+-]?(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?"
+
+
+def _numeric_coercer(
+        name: str,
+        type_: Union[Type[int], Type[float]],
+        strict: bool,
+        minimum: Optional[Union[int, float]],
+        maximum: Optional[Union[int, float]]
+) -> Callable[[Any], Union[int, float]]:
+    """ Build the function converting the value of an int or float parameter and checking its range, raising a
+        ParserTypeError or ParserRangeError. In strict mode, strings must match the strict grammar and are converted
+        without being stripped or copied, floats for an int parameter must be integers and floats must be finite
+    """
+
+    if strict:
+        # re is only imported once a strict numeric parameter exists
+        import re
+
+        fullmatch: Callable = re.compile(_STRICT_INT if type_ is int else _STRICT_FLOAT).fullmatch
+
+    bounded: bool = minimum is not None or maximum is not None
+    low: Union[int, float] = minimum if minimum is not None else float("-inf")
+    high: Union[int, float] = maximum if maximum is not None else float("inf")
+
+    def coerce_int(value: Any) -> int:
+        t: type = type(value)
+        try:
+            if t is int:
+                v: int = value
+            elif t is str and ((value.isdigit() and value.isascii()) or fullmatch(value)):
+                # int() may still reject strings longer than sys.get_int_max_str_digits()
+                v = int(value)
+            elif t is float and value.is_integer():
+                v = int(value)
+            else:
+                raise ValueError
+        except ValueError:
+            raise ParserTypeError(name, value, int)
+        if bounded and not low <= v <= high:
+            raise ParserRangeError(name, v, minimum, maximum)
+        return v
+
+    def coerce_float(value: Any) -> float:
+        t: type = type(value)
+        try:
+            if t is float:
+                v: float = value
+            elif t is int or (t is str and fullmatch(value)):
+                v = float(value)
+            else:
+                raise ValueError
+        except (ValueError, OverflowError):
+            raise ParserTypeError(name, value, float)
+        if v - v != 0:
+            # nan or inf
+            raise ParserTypeError(name, value, float)
+        if bounded and not low <= v <= high:
+            raise ParserRangeError(name, v, minimum, maximum)
+        return v
+
+    def coerce(value: Any) -> Union[int, float]:
+        try:
+            v: Union[int, float] = type_(value)
+        except (ValueError, TypeError, OverflowError):
+            raise ParserTypeError(name, value, type_)
+        # Written as 'not low <= v <= high' so that nan is rejected
+        if not low <= v <= high:
+            raise ParserRangeError(name, v, minimum, maximum)
+        return v
+
+    if not strict:
+        return coerce
+    return coerce_int if type_ is int else coerce_float
+
+
+# Types of default values which are copied for each result, so results never share a mutable default
+_MUTABLE_DEFAULT_TYPES: frozenset = frozenset((list, dict, set, bytearray))
+_IMMUTABLE_TYPES: frozenset = frozenset((type(None), bool, int, float, complex, str, bytes, frozenset, range))
+
+
+def _is_immutable(v: Any) -> bool:
+    t: type = type(v)
+    return t in _IMMUTABLE_TYPES or (t is tuple and all(_is_immutable(i) for i in v))
+
+
+def _copies_shallow(default: Any) -> bool:
+    """ Test if a mutable default can be copied with its copy method, because its elements are immutable """
+    return all(_is_immutable(i) for i in (default.values() if type(default) is dict else default))
+
+
+def _copy_factory(default: Any) -> Optional[Callable[[], Any]]:
+    """ Return a function creating a copy of a mutable default, or None if the default can be shared """
+
+    if type(default) not in _MUTABLE_DEFAULT_TYPES:
+        return None
+    if _copies_shallow(default):
+        return default.copy
+
+    import copy
+
+    return lambda: copy.deepcopy(default)
+
+
+class _LazyDefault(object):
+    """ Placeholder for a default created by a factory, only called when the value is accessed """
+
+    __slots__ = ("factory",)
+
+    def __init__(self, factory: Callable[[], Any]):
+        self.factory = factory
+
+
+def _resolve_default(v: Any) -> Any:
+    return v.factory() if type(v) is _LazyDefault else v
+
+
+def _resolve_at(values: List[Any], i: int) -> Any:
+    """ Return the parsed value at index i, replacing a lazy default with the value of its factory so a rule which
+        reads it does not make the namespace call the factory a second time
+    """
+    v: Any = values[i]
+    if type(v) is _LazyDefault:
+        v = values[i] = v.factory()
+    return v
+
+
+# Characters ignored when matching keys with DictionaryParser(ignore_key_style=True)
+_KEY_STYLE_TABLE: dict = str.maketrans("", "", "_-")
+
+
+def _normalize_key(k: str) -> str:
+    """ Normalize a key for style-insensitive matching, so userId, user_id and USER-ID are equal """
+    return k.translate(_KEY_STYLE_TABLE).lower()
+
+
+def _json_default(v: Any) -> Any:
+    """ Encode sets and arrays as JSON arrays """
+    if isinstance(v, (set, frozenset)):
+        return list(v)
+    if hasattr(v, "tolist"):
+        return v.tolist()
+    raise TypeError(f"Object of type '{type(v).__name__}' is not JSON serializable")
+
+
+_json_encoder: Optional[Any] = None
+
+
+def _dump_json(fields: Sequence[str], values: Sequence[Any]) -> bytes:
+    """ Encode fields and values as a compact JSON object, using a shared encoder """
+
+    global _json_encoder
+    if _json_encoder is None:
+        # json is only imported once a NameSpace is serialized
+        import json
+        _json_encoder = json.JSONEncoder(separators=(",", ":"), default=_json_default)
+    return _json_encoder.encode(dict(zip(fields, values))).encode("utf-8")
 
 
 class Param(object):
@@ -26,7 +281,18 @@ class Param(object):
             description: Optional[str] = None,
             default: Optional[Any] = None,
             regex: Optional[str] = None,
-            value: Optional[Any] = None
+            value: Optional[Any] = None,
+            aliases: Optional[Union[List[str], Tuple[str], Set[str]]] = None,
+            element_type: Optional[Union[Type[str], Type[int], Type[float], Type[bool]]] = None,
+            element_choices: Optional[Union[list, set, tuple]] = None,
+            element_regex: Optional[str] = None,
+            min_length: Optional[int] = None,
+            max_length: Optional[int] = None,
+            array: Optional[bool] = False,
+            minimum: Optional[Union[int, float]] = None,
+            maximum: Optional[Union[int, float]] = None,
+            strict_numeric: Optional[bool] = False,
+            default_factory: Optional[Callable[[], Any]] = None
     ):
         """ Param object
 
@@ -42,6 +308,17 @@ class Param(object):
             default: A default value for the parameter, defaults to None
             regex: A regular expression string which the parameter value must match, otherwise the value is None
             value: The parameter value, defaults to None
+            aliases: Alternative keys for the parameter in the parsed data
+            element_type: The type to convert each element of a list, tuple or set to
+            element_choices: A list, set or tuple of values which each element must be in
+            element_regex: A regular expression string which each element must match
+            min_length: The minimum length of the value
+            max_length: The maximum length of the value
+            array: If True, a list of int or float elements is returned as an array.array
+            minimum: The minimum value of an int or float parameter
+            maximum: The maximum value of an int or float parameter
+            strict_numeric: If True, an int or float parameter only accepts strings of digits and finite numbers
+            default_factory: A function called to create the default value, instead of default
         """
         self.name = name
         self.type_ = type_
@@ -51,24 +328,166 @@ class Param(object):
         self.action = action
         self.description = description
         self.default = default
+        self.default_factory = default_factory
+        # The value used when the parameter is missing. Immutable defaults are shared by every result, mutable
+        # defaults and factories are only called when the value of a result is accessed
+        factory: Optional[Callable[[], Any]] = default_factory or _copy_factory(default)
+        self._default: Any = _LazyDefault(factory) if factory is not None else default
         self.regex = regex
         self.value = value
+        self.aliases: Tuple[str, ...] = tuple(aliases) if aliases else ()
+        self._pattern = None
+        if regex:
+            # re is only imported once a regex parameter exists
+            import re
+            self._pattern = re.compile(regex)
+        self.element_type = element_type
+        self.element_choices = element_choices or []
+        self.element_regex = element_regex
+        self.min_length = min_length
+        self.max_length = max_length
+        self.array = array
+        self._element_pattern = None
+        if element_regex:
+            import re
+            self._element_pattern = re.compile(element_regex)
+        self._element_choice_set: Optional[frozenset] = None
+        if self.element_choices:
+            try:
+                self._element_choice_set = frozenset(self.element_choices)
+            except TypeError:
+                # Unhashable choices are tested one element at a time
+                pass
+        self.minimum = minimum
+        self.maximum = maximum
+        self.strict_numeric = strict_numeric
+        # Replaces the type_ conversion of numeric parameters with range checks or strict grammars
+        self._coerce: Optional[Callable] = None
+        if type_ in (int, float) and (strict_numeric or minimum is not None or maximum is not None):
+            self._coerce = _numeric_coercer(name, type_, bool(strict_numeric), minimum, maximum)
+        # True if _check_elements must be called on the converted value
+        self._elements: bool = bool(
+            element_type or element_choices or element_regex or array or min_length is not None or max_length is not None
+        )
+
+    def _check_length(self, value: Any) -> None:
+        if self.min_length is not None or self.max_length is not None:
+            length: int = len(value)
+            if (self.min_length is not None and length < self.min_length) or \
+                    (self.max_length is not None and length > self.max_length):
+                raise ParserLengthError(self.name, length, self.min_length, self.max_length)
+
+    def _check_elements(self, value: Any) -> Any:
+        """ Check the length and elements of a converted value, returning it with its elements converted to
+            element_type. Whole-value operations (map, set, array) are used so that homogeneous values, such as a
+            list of ints for list[int], are validated without a Python loop per element
+        """
+
+        name: str = self.name
+        # Converting the elements of a set can merge them, e.g. {'1', 1}, so its length is checked afterwards.
+        # Other values are checked first, so an oversized value is rejected before its elements are converted
+        if self.type_ is not set:
+            self._check_length(value)
+
+        element_type: Optional[type] = self.element_type
+        if element_type is not None:
+            types: set = set(map(type, value))
+            if len(types) > 1 or (types and element_type not in types):
+                convert: Callable = _to_bool if element_type is bool else element_type
+                try:
+                    value = self.type_(map(convert, value))
+                except (ValueError, TypeError, OverflowError):
+                    for v in value:
+                        try:
+                            convert(v)
+                        except (ValueError, TypeError, OverflowError):
+                            raise ParserTypeError(name, v, element_type)
+                    raise
+
+        if self.type_ is set:
+            self._check_length(value)
+
+        if self.element_choices:
+            try:
+                valid: bool = self._element_choice_set is not None and self._element_choice_set.issuperset(value)
+            except TypeError:
+                valid = False
+            if not valid:
+                for v in value:
+                    if v not in self.element_choices:
+                        raise ParserInvalidChoiceError(name, v, self.element_choices)
+
+        if self._element_pattern is not None:
+            match: Callable = self._element_pattern.match
+            if not all(map(match, map(str, value))):
+                for v in value:
+                    if not match(str(v)):
+                        raise ParserPatternError(name, v, self.element_regex)
+
+        if self.array:
+            from array import array
+
+            try:
+                value = array(_ARRAY_TYPECODES[element_type], value)
+            except OverflowError:
+                raise ParserTypeError(name, value, element_type)
+
+        return value
+
+    def _from_json(self, value: Any) -> Any:
+        """ Convert a value decoded from JSON back to the tuple, set or array the parameter is parsed to """
+        if type(value) is list:
+            if self.array:
+                from array import array
+
+                return array(_ARRAY_TYPECODES[self.element_type], value)
+            if self.type_ is tuple or self.type_ is set:
+                return self.type_(value)
+        return value
+
+    def _with_value(self, value: Any) -> Param:
+        """ Return a shallow copy of the Param holding value, leaving the parser's Param untouched """
+        param: Param = Param.__new__(Param)
+        param.__dict__.update(self.__dict__)
+        param.value = value
+        return param
 
 
 class NameSpace(object):
 
-    def __init__(self, params: List[Param]):
+    def __init__(self, params: List[Param], values: Optional[List[Any]] = None):
         """ NameSpace object
 
         Args:
             params: A list of Param objects
+            values: A list of parsed values in the same order as params, defaults to the value of each Param
         """
+        if values is None:
+            values = [param.value for param in params]
         self._fields: List[str] = []
         self._params: Dict[str, Param] = {}
-        for param in params:
+        # Factories of defaults which have not been accessed yet, keyed by field
+        self._lazy: Optional[Dict[str, Callable[[], Any]]] = None
+        for param, value in zip(params, values):
             self._fields.append(param.dest or param.name)
             self._params.update({param.dest or param.name: param})
-            setattr(self, param.dest or param.name, param.value)
+            if type(value) is _LazyDefault:
+                if self._lazy is None:
+                    self._lazy = {}
+                self._lazy[param.dest or param.name] = value.factory
+            else:
+                setattr(self, param.dest or param.name, value)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes which are not set, so creates defaults on first access
+        lazy: Optional[Dict[str, Callable[[], Any]]] = self.__dict__.get("_lazy")
+        if lazy:
+            factory: Optional[Callable[[], Any]] = lazy.pop(name, None)
+            if factory is not None:
+                value: Any = factory()
+                setattr(self, name, value)
+                return value
+        raise AttributeError(f"'NameSpace' object has no attribute '{name}'")
 
     def get(self, name: str, default: Optional[Any] = None) -> Union[None, Any]:
         """ Get a parameter, returns the parameter value or None, unless a default is supplied """
@@ -76,7 +495,10 @@ class NameSpace(object):
 
     def get_param(self, name: str, default: Optional[Any] = None) -> Union[Param, Any]:
         """ Get a Param, returns the Param object or None, unless a default is supplied """
-        return self._params.get(name, default)
+        param: Optional[Param] = self._params.get(name)
+        if param is None:
+            return default
+        return param._with_value(getattr(self, name))
 
     def to_dict(self, exclude: Optional[Union[List[str], Tuple[str], Set[str]]] = None) -> dict:
         """ Returns the NameSpace as a dictionary
@@ -89,22 +511,332 @@ class NameSpace(object):
             k: getattr(self, k) for k in self._fields if k not in exclude
         }
 
+    def to_json(self) -> bytes:
+        """ Returns the NameSpace as compact UTF-8 encoded JSON. Tuples and sets are encoded as arrays """
+        return _dump_json(self._fields, self.to_tuple())
+
+    def to_tuple(self) -> tuple:
+        """ Returns a tuple of the values in the order the parameters were added to the parser. This is the most
+            compact form for serialization, use DictionaryParser.from_tuple to create a FrozenNameSpace from it
+        """
+        return tuple([getattr(self, k) for k in self._fields])
+
+    def __getstate__(self) -> dict:
+        # The Param objects belong to the parser, so are not pickled. get_param returns None after unpickling.
+        # Defaults are created first, as their factories may not be picklable
+        for name in list(self._lazy or ()):
+            getattr(self, name)
+        state: dict = self.__dict__.copy()
+        del state["_params"]
+        state["_lazy"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._params = {}
+        self._lazy = None
+
+
+class FrozenNameSpace(object):
+
+    __slots__ = ("_fields", "_values", "_index")
+
+    def __init__(self, fields: Sequence[str], values: Sequence[Any]):
+        """ An immutable, hashable and picklable NameSpace backed by a tuple of values.
+            Unlike NameSpace it holds no references to the parser's Param objects
+
+        Args:
+            fields: The parameter names, in the same order as values
+            values: The parameter values
+        """
+        fields = tuple(fields)
+        values = tuple(values)
+        if len(fields) != len(values):
+            raise ValueError(f"Expected {len(fields)} values for fields {fields}, got {len(values)}")
+        object.__setattr__(self, "_fields", fields)
+        object.__setattr__(self, "_values", values)
+        object.__setattr__(self, "_index", {f: i for i, f in enumerate(fields)})
+
+    @classmethod
+    def _make(cls, fields: Tuple[str, ...], index: Dict[str, int], values: Tuple[Any, ...]) -> FrozenNameSpace:
+        """ Create a FrozenNameSpace without validation, sharing the fields and index of the parser """
+        ns: FrozenNameSpace = cls.__new__(cls)
+        object.__setattr__(ns, "_fields", fields)
+        object.__setattr__(ns, "_values", values)
+        object.__setattr__(ns, "_index", index)
+        return ns
+
+    @classmethod
+    def from_namespace(cls, ns: NameSpace) -> FrozenNameSpace:
+        """ Create a FrozenNameSpace from a NameSpace """
+        return cls(ns._fields, [getattr(ns, f) for f in ns._fields])
+
+    def __getattr__(self, name: str) -> Any:
+        if name in FrozenNameSpace.__slots__:
+            raise AttributeError(name)
+        i: Optional[int] = self._index.get(name)
+        if i is None:
+            raise AttributeError(f"'FrozenNameSpace' object has no attribute '{name}'")
+        return self._values[i]
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("FrozenNameSpace objects are immutable, use _replace to create an updated copy")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("FrozenNameSpace objects are immutable")
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, FrozenNameSpace):
+            return NotImplemented
+        return self._fields == other._fields and self._values == other._values
+
+    def __hash__(self) -> int:
+        return hash((self._fields, self._values))
+
+    def __reduce__(self) -> tuple:
+        return FrozenNameSpace, (self._fields, self._values)
+
+    def __repr__(self) -> str:
+        return f"FrozenNameSpace({', '.join(f'{f}={v!r}' for f, v in zip(self._fields, self._values))})"
+
+    def get(self, name: str, default: Optional[Any] = None) -> Union[None, Any]:
+        """ Get a parameter, returns the parameter value or None, unless a default is supplied """
+        i: Optional[int] = self._index.get(name)
+        if i is None:
+            return default
+        return self._values[i]
+
+    def to_dict(self, exclude: Optional[Union[List[str], Tuple[str], Set[str]]] = None) -> dict:
+        """ Returns the FrozenNameSpace as a dictionary
+
+        Args:
+            exclude (list): A list of keys to exclude from the returned dictionary
+        """
+        if not exclude:
+            return dict(zip(self._fields, self._values))
+        return {
+            k: v for k, v in zip(self._fields, self._values) if k not in exclude
+        }
+
+    def to_json(self) -> bytes:
+        """ Returns the FrozenNameSpace as compact UTF-8 encoded JSON. Tuples and sets are encoded as arrays """
+        return _dump_json(self._fields, self._values)
+
+    def to_tuple(self) -> tuple:
+        """ Returns the tuple of values, use DictionaryParser.from_tuple to create a FrozenNameSpace from it """
+        return self._values
+
+    def _replace(self, **kwargs: Any) -> FrozenNameSpace:
+        """ Return a new FrozenNameSpace with the given parameters replaced by new values """
+        values: list = list(self._values)
+        for k, v in kwargs.items():
+            i: Optional[int] = self._index.get(k)
+            if i is None:
+                raise ValueError(f"Got unexpected field name '{k}'")
+            values[i] = v
+        return FrozenNameSpace._make(self._fields, self._index, tuple(values))
+
+
+def _present(data: Dict[str, Any], name: str) -> bool:
+    """ Test if data has a value for name, empty strings and None are treated as missing like in parse_dict """
+    return data.get(name) not in ("", None)
+
+
+class _Rule(object):
+    """ A cross-field rule checked by parse_dict. `position` is the number of parameters which must be parsed before
+        the rule can be checked, rules at position 0 only depend on the presence of keys in the data
+    """
+
+    position: int = 0
+    # The indices of the parameters whose parsed values the rule reads
+    dependencies: Tuple[int, ...] = ()
+
+    def check(self, data: Dict[str, Any], values: List[Any]) -> None:
+        raise NotImplementedError
+
+
+class _MutuallyExclusiveRule(_Rule):
+
+    def __init__(self, names: Tuple[str, ...], required: bool):
+        self.names = names
+        self.required = required
+
+    def check(self, data: Dict[str, Any], values: List[Any]) -> None:
+        present: Tuple[str, ...] = tuple([n for n in self.names if _present(data, n)])
+        if len(present) > 1:
+            raise ParserConstraintError(present, "only one of them may be given")
+        if self.required and not present:
+            raise ParserConstraintError(self.names, "one of them is required")
+
+
+class _RequiredIfRule(_Rule):
+
+    def __init__(self, name: str, other: str, other_index: Optional[int], value: Any):
+        self.name = name
+        self.other = other
+        self.other_index = other_index
+        self.value = value
+        if other_index is not None:
+            self.position = other_index + 1
+            self.dependencies = (other_index,)
+
+    def check(self, data: Dict[str, Any], values: List[Any]) -> None:
+        if self.other_index is None:
+            triggered: bool = _present(data, self.other)
+        else:
+            triggered = _resolve_at(values, self.other_index) == self.value
+        if triggered and not _present(data, self.name):
+            raise ParserRequiredKeyError(self.name)
+
+
+class _CompareRule(_Rule):
+
+    def __init__(self, left: str, op: str, right: str, left_index: int, right_index: int, func: Callable):
+        self.left = left
+        self.op = op
+        self.right = right
+        self.left_index = left_index
+        self.right_index = right_index
+        self.func = func
+        self.position = max(left_index, right_index) + 1
+        self.dependencies = (left_index, right_index)
+
+    def check(self, data: Dict[str, Any], values: List[Any]) -> None:
+        a: Any = _resolve_at(values, self.left_index)
+        b: Any = _resolve_at(values, self.right_index)
+        if a is None or b is None:
+            return
+        try:
+            ok: bool = self.func(a, b)
+        except TypeError:
+            ok = False
+        if not ok:
+            raise ParserConstraintError((self.left, self.right), f"expected {self.left} {self.op} {self.right}")
+
+
+# Values for DictionaryParser(order=...)
+_ORDERS: Tuple[str, ...] = ("declared", "cost", "adaptive")
+
+# The number of parses between re-ordering the checks of a parser with order='adaptive'
+REORDER_INTERVAL: int = 1000
+
+_CONTAINER_TYPES: frozenset = frozenset((list, tuple, set, dict))
+
+
+def _cost(param: Param) -> int:
+    """ The relative cost of checking a parameter value before its action, used to order the checks """
+
+    cost: int = 0
+    if param.choices:
+        cost += 1
+    if param._pattern:
+        cost += 2
+    if param.type_ in _CONTAINER_TYPES:
+        cost += 4
+    elif param.type_:
+        cost += 2
+    if param.min_length is not None or param.max_length is not None:
+        cost += 1
+    if param.element_type or param.element_choices or param.element_regex or param.array:
+        cost += 8
+    return cost
+
+
+class _ParsePlan(object):
+    """ The order in which parse_dict checks parameters when the parser is not using the declared order """
+
+    def __init__(self, params: Dict[str, Param], rules: Dict[int, List[_Rule]], rejections: Dict[str, int]):
+        """ Parameters are sorted by cost per rejection, so with no rejections recorded the cheapest are checked first.
+            Rules are checked as soon as the values they read are final: presence-only rules first, rules reading
+            parameters without actions after the checks, and the rest after the actions
+
+        Args:
+            params: The parameters of the parser
+            rules: The cross-field rules of the parser, keyed by position
+            rejections: The number of payloads rejected by each parameter
+        """
+
+        indexed: List[Tuple[int, str, Param]] = [(i, name, param) for i, (name, param) in enumerate(params.items())]
+        self.checks: List[Tuple[int, str, Param]] = sorted(
+            indexed,
+            key=lambda p: (_cost(p[2]) + 1) / (rejections.get(p[1], 0) + 1)
+        )
+
+        with_actions: Set[int] = {i for i, _, param in indexed if param.action}
+        self.early_rules: List[_Rule] = []
+        self.checked_rules: List[_Rule] = []
+        self.late_rules: List[_Rule] = []
+        for position in sorted(rules):
+            for rule in rules[position]:
+                if not rule.dependencies:
+                    self.early_rules.append(rule)
+                elif with_actions.isdisjoint(rule.dependencies):
+                    self.checked_rules.append(rule)
+                else:
+                    self.late_rules.append(rule)
+
 
 class DictionaryParser(object):
     """ Dictionary parser class """
 
     _valid_types: List[type] = [str, int, float, bool, list, tuple, set, dict]
 
-    def __init__(self, description: Optional[str] = None):
+    def __init__(
+            self,
+            description: Optional[str] = None,
+            cache_size: Optional[int] = None,
+            cache_bytes: Optional[int] = None,
+            ignore_key_style: Optional[bool] = False,
+            order: Optional[str] = "declared"
+    ):
+        """ DictionaryParser object
+
+        Args:
+            description: A description of the parser
+            cache_size: Enables a result cache holding up to cache_size results of parse_dict, keyed by the values of
+                        the declared parameters. Cached results are read-only NameSpace objects shared between callers,
+                        so results holding a list, set or dict are never cached
+            cache_bytes: The approximate maximum memory in bytes used by the result cache, defaults to unbounded
+            ignore_key_style: If True, keys in the parsed data match parameter names and aliases regardless of case,
+                              underscores and hyphens, e.g. 'userId', 'user_id' and 'USER-ID' all match 'user_id'
+            order: The order parse_dict checks parameters in. 'declared' (the default) parses each parameter in the
+                   order it was added. 'cost' runs the cheap checks (presence, regex, conversion and choices) of
+                   every parameter before any action, cheapest first, so payloads which are rejected do not run
+                   actions. 'adaptive' is 'cost' with parameters which often reject payloads checked earlier
+        """
+        if order not in _ORDERS:
+            raise ValueError(f"Invalid value '{order}' for parameter 'order', must be one of {list(_ORDERS)}")
         self.description = description
+        self.ignore_key_style = ignore_key_style
         self._required_keys: List[str] = []
         self._params: Dict[str, Param] = {}
+        # Maps each accepted key (normalized if ignore_key_style) to its parameter name
+        self._key_index: Dict[str, str] = {}
+        self._resolve: bool = bool(ignore_key_style)
+        self._dests: Tuple[str, ...] = ()
+        self._dest_index: Dict[str, int] = {}
+        self._has_actions: bool = False
+        self._has_factories: bool = False
+        # True if a rule reads a parameter with a default factory, whose value it resolves while parsing
+        self._factory_rules: bool = False
+        # True if a parameter is converted to a list, set or dict, which a cached result would share between callers
+        self._mutable_results: bool = False
+        # Cross-field rules, keyed by the number of parameters parsed before they are checked
+        self._rules: Dict[int, List[_Rule]] = {}
+        self.order = order
+        self._plan: Optional[_ParsePlan] = None
+        self._rejections: Dict[str, int] = {}
+        self._parses: int = 0
+        self._cache: Optional[ResultCache] = None
+        if cache_size:
+            from .cache import ResultCache
+            self._cache = ResultCache(cache_size, cache_bytes)
 
     @staticmethod
     def _is_valid_name(n: str) -> bool:
         """ Test to see if the value for 'name' or 'dest' is allowed when calling add_param """
 
-        if n in ("get", "get_param", "to_dict"):
+        if n in _RESERVED_NAMES:
             return False
         elif n.startswith("__") and n.endswith("__"):
             return False
@@ -122,6 +854,18 @@ class DictionaryParser(object):
             dest: Optional[str] = None,
             choices: Optional[Union[list, set, tuple]] = None,
             action: Optional[Callable] = None,
+            aliases: Optional[Union[List[str], Tuple[str], Set[str]]] = None,
+            element_type: Optional[Union[Type[str], Type[int], Type[float], Type[bool]]] = None,
+            element_choices: Optional[Union[list, set, tuple]] = None,
+            element_regex: Optional[str] = None,
+            min_length: Optional[int] = None,
+            max_length: Optional[int] = None,
+            array: Optional[bool] = False,
+            minimum: Optional[Union[int, float]] = None,
+            maximum: Optional[Union[int, float]] = None,
+            strict_numeric: Optional[bool] = False,
+            default: Optional[Any] = None,
+            default_factory: Optional[Callable[[], Any]] = None
     ):
         """ Validate params when calling add_param """
 
@@ -150,6 +894,54 @@ class DictionaryParser(object):
         if action and not callable(action):
             raise TypeError("Parameter 'action' must be callable")
 
+        if aliases:
+            if not isinstance(aliases, (list, tuple, set)):
+                raise TypeError(f"Parameter 'aliases' must be of type 'list', 'tuple' or 'set', not '{type(aliases)}'")
+            for alias in aliases:
+                if not isinstance(alias, str):
+                    raise TypeError(f"Aliases must be of type 'str', not '{type(alias)}'")
+
+        if element_type or element_choices or element_regex or array:
+            if type_ not in _SEQUENCE_TYPES:
+                raise TypeError(f"Element validation requires a 'type_' of 'list', 'tuple' or 'set', not '{type_}'")
+            if element_type and element_type not in _ELEMENT_TYPES:
+                raise TypeError(f"Parameter 'element_type' must be one of '{list(_ELEMENT_TYPES)}', not '{element_type}'")
+            if element_choices and not isinstance(element_choices, (list, tuple, set)):
+                raise TypeError(
+                    f"Parameter 'element_choices' must be of type 'list', 'tuple' or 'set', not '{type(element_choices)}'"
+                )
+            if array and (type_ is not list or element_type not in _ARRAY_TYPECODES):
+                raise TypeError("Parameter 'array' requires a 'type_' of list[int] or list[float]")
+
+        for arg, length in (("min_length", min_length), ("max_length", max_length)):
+            if length is None:
+                continue
+            if not isinstance(length, int) or isinstance(length, bool) or length < 0:
+                raise ValueError(f"Parameter '{arg}' must be a non-negative int, not '{length}'")
+            if type_ not in (str, list, tuple, set, dict):
+                raise TypeError(f"Parameter '{arg}' requires a 'type_' of 'str', 'list', 'tuple', 'set' or 'dict'")
+        if min_length is not None and max_length is not None and min_length > max_length:
+            raise ValueError("Parameter 'min_length' must not be greater than 'max_length'")
+
+        for arg, bound in (("minimum", minimum), ("maximum", maximum)):
+            if bound is None:
+                continue
+            if not isinstance(bound, (int, float)) or isinstance(bound, bool) or bound != bound:
+                raise ValueError(f"Parameter '{arg}' must be an int or float, not '{bound}'")
+            if type_ not in (int, float):
+                raise TypeError(f"Parameter '{arg}' requires a 'type_' of 'int' or 'float'")
+        if minimum is not None and maximum is not None and minimum > maximum:
+            raise ValueError("Parameter 'minimum' must not be greater than 'maximum'")
+
+        if strict_numeric and type_ not in (int, float):
+            raise TypeError("Parameter 'strict_numeric' requires a 'type_' of 'int' or 'float'")
+
+        if default_factory is not None:
+            if not callable(default_factory):
+                raise TypeError("Parameter 'default_factory' must be callable")
+            if default is not None:
+                raise ValueError("Cannot specify both 'default' and 'default_factory'")
+
     def add_param(
             self,
             name: str,
@@ -160,7 +952,18 @@ class DictionaryParser(object):
             action: Optional[Callable] = None,
             description: Optional[str] = None,
             default: Optional[Any] = None,
-            regex: Optional[str] = None
+            regex: Optional[str] = None,
+            aliases: Optional[Union[List[str], Tuple[str], Set[str]]] = None,
+            element_type: Optional[Union[Type[str], Type[int], Type[float], Type[bool]]] = None,
+            element_choices: Optional[Union[list, set, tuple]] = None,
+            element_regex: Optional[str] = None,
+            min_length: Optional[int] = None,
+            max_length: Optional[int] = None,
+            array: Optional[bool] = False,
+            minimum: Optional[Union[int, float]] = None,
+            maximum: Optional[Union[int, float]] = None,
+            strict_numeric: Optional[bool] = False,
+            default_factory: Optional[Callable[[], Any]] = None
     ) -> None:
         """ Add a key to the parser
 
@@ -175,11 +978,39 @@ class DictionaryParser(object):
             description: A description of the parameter
             default: A default value for the parameter, defaults to None
             regex: A regular expression string which the parameter value must match, otherwise the value is None
+            aliases: A list, set or tuple of alternative keys for the parameter, e.g. ['userId', 'USER_ID']
+            element_type: The type to convert each element of a list, tuple or set to (str, int, float, bool). Can
+                          also be given with type_, e.g. type_=list[int]. Raises ParserTypeError for invalid elements
+            element_choices: A list, set or tuple of values which each element must be in, otherwise raises
+                             ParserInvalidChoiceError
+            element_regex: A regular expression string which each element must match, otherwise raises
+                           ParserPatternError
+            min_length: The minimum length of a str, list, tuple, set or dict, otherwise raises ParserLengthError
+            max_length: The maximum length of a str, list, tuple, set or dict, otherwise raises ParserLengthError
+            array: If True, a list[int] or list[float] is returned as a compact array.array
+            minimum: The minimum value of an int or float parameter, otherwise raises ParserRangeError
+            maximum: The maximum value of an int or float parameter, otherwise raises ParserRangeError
+            strict_numeric: If True, an int or float parameter raises ParserTypeError for strings which are not plain
+                            ASCII numbers (e.g. ' 1', '1_000', 'nan', 'inf'), for nan and infinite floats, and for
+                            floats which are not integers when type_ is int
+            default_factory: A function called with no arguments to create the default value, instead of default.
+                             It is only called when the value of a missing parameter is accessed. A list, dict, set or
+                             bytearray given as default is copied in the same way, so results never share it
         Returns:
             None
         """
 
-        self._validate_add_key_params(name, type_, dest, choices, action)
+        type_, split_element_type = _split_type(type_)
+        if split_element_type is not None:
+            if element_type is not None and element_type is not split_element_type:
+                raise TypeError(f"Conflicting element types '{split_element_type}' and '{element_type}'")
+            element_type = split_element_type
+
+        self._validate_add_key_params(
+            name, type_, dest, choices, action, aliases,
+            element_type, element_choices, element_regex, min_length, max_length, array, minimum, maximum, strict_numeric,
+            default, default_factory
+        )
 
         if name in self._params:
             raise ParserDuplicateKeyError(name)
@@ -193,21 +1024,282 @@ class DictionaryParser(object):
             action=action,
             description=description,
             default=default,
-            regex=regex
+            regex=regex,
+            aliases=aliases,
+            element_type=element_type,
+            element_choices=element_choices,
+            element_regex=element_regex,
+            min_length=min_length,
+            max_length=max_length,
+            array=array,
+            minimum=minimum,
+            maximum=maximum,
+            strict_numeric=strict_numeric,
+            default_factory=default_factory
         )
 
+        self._add(param)
+
+    def _add(self, param: Param) -> None:
+        """ Add a validated Param to the parser """
+
+        keys: List[str] = [param.name, *param.aliases]
+        if self.ignore_key_style:
+            keys = [_normalize_key(k) for k in keys]
+        for k in keys:
+            if self._key_index.get(k, param.name) != param.name:
+                raise ParserDuplicateKeyError(k)
+        for k in keys:
+            self._key_index[k] = param.name
+        if param.aliases:
+            self._resolve = True
+
         if param.required:
-            self._required_keys.append(name)
+            self._required_keys.append(param.name)
+
+        if param.action:
+            self._has_actions = True
+
+        if type(param._default) is _LazyDefault:
+            self._has_factories = True
+
+        if param.type_ in (list, set, dict):
+            self._mutable_results = True
+
+        self._params.update({param.name: param})
+        self._dest_index = {**self._dest_index, param.dest: len(self._dests)}
+        self._dests = self._dests + (param.dest,)
+        self._plan = None
+
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _index_of(self, name: str) -> int:
+        """ Return the position of a parameter, raising a ValueError if it has not been added """
+        for i, n in enumerate(self._params):
+            if n == name:
+                return i
+        raise ValueError(f"Unknown parameter '{name}', parameters must be added before constraints which use them")
+
+    def _add_rule(self, rule: _Rule) -> None:
+        self._rules.setdefault(rule.position, []).append(rule)
+        params: List[Param] = list(self._params.values())
+        if any(type(params[i]._default) is _LazyDefault for i in rule.dependencies):
+            self._factory_rules = True
+        self._plan = None
+        if self._cache is not None:
+            self._cache.clear()
+
+    def add_constraint(self, left: str, op: str, right: str) -> None:
+        """ Add a constraint comparing the parsed values of two parameters, raising a ParserConstraintError from
+            parse_dict if it is not satisfied. The constraint is skipped if either value is None, and is checked as
+            soon as both parameters have been parsed, before the remaining parameters
+
+        Args:
+            left: The name of the parameter on the left of the comparison
+            op: The comparison, one of '<', '<=', '>', '>=', '==', '!='
+            right: The name of the parameter on the right of the comparison
+        Returns:
+            None
+        """
+
+        import operator
+
+        funcs: Dict[str, Callable] = {
+            "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge, "==": operator.eq, "!=": operator.ne
+        }
+        if op not in funcs:
+            raise ValueError(f"Invalid value '{op}' for parameter 'op', must be one of {list(funcs)}")
+
+        self._add_rule(_CompareRule(left, op, right, self._index_of(left), self._index_of(right), funcs[op]))
+
+    def require_if(self, name: str, other: str, value: Optional[Any] = _MISSING) -> None:
+        """ Make a parameter required when another parameter is given, raising a ParserRequiredKeyError from
+            parse_dict if it is missing
+
+        Args:
+            name: The name of the dependent parameter
+            other: The name of the parameter it depends on
+            value: If supplied, name is only required when the parsed value of other equals value, otherwise it is
+                   required whenever other is given
+        Returns:
+            None
+        """
+
+        self._index_of(name)
+        other_index: int = self._index_of(other)
+        self._add_rule(_RequiredIfRule(name, other, None if value is _MISSING else other_index, value))
+
+    def mutually_exclusive(self, *names: str, required: Optional[bool] = False) -> None:
+        """ Allow at most one of the given parameters, raising a ParserConstraintError from parse_dict if more than
+            one is given. These constraints are checked before any parameter is parsed
+
+        Args:
+            names: The names of the parameters, at least two
+            required: If True, exactly one of the parameters must be given
+        Returns:
+            None
+        """
+
+        if len(names) < 2:
+            raise ValueError("At least two parameter names are required")
+        for name in names:
+            self._index_of(name)
+        self._add_rule(_MutuallyExclusiveRule(tuple(names), bool(required)))
+
+    def _resolve_keys(self, data: Dict[str, Any], strict: Optional[bool]) -> Dict[str, Any]:
+        """ Return a dict of the values in data keyed by parameter name, matching aliases and, if ignore_key_style is
+            set, keys of any style. A key matching the parameter name exactly takes precedence over its aliases
+        """
+
+        index: Dict[str, str] = self._key_index
+        normalize: bool = bool(self.ignore_key_style)
+        resolved: Dict[str, Any] = {}
+        for k, v in data.items():
+            name: Optional[str] = index.get(_normalize_key(k) if normalize and isinstance(k, str) else k)
+            if name is None:
+                if strict:
+                    raise ParserInvalidKeyError(k)
+                continue
+            if k == name or name not in resolved:
+                resolved[name] = v
+        return resolved
+
+    def _parse_declared(self, data: Dict[str, Any], action: Optional[Callable]) -> List[Any]:
+        """ Parse each parameter in the order it was added, checking rules as soon as their parameters are parsed """
+
+        values: List[Any] = []
+        rules: Dict[int, List[_Rule]] = self._rules
+
+        for i, (name, param) in enumerate(self._params.items()):
+
+            if rules and i in rules:
+                for rule in rules[i]:
+                    rule.check(data, values)
+
+            value: Any = data.get(name)
+
+            if value in ("", None):
+                values.append(param._default)
+                continue
+
+            if param._pattern and not _match(param._pattern, value):
+                values.append(param._default)
+                continue
+
+            if param._coerce is not None:
+                value = param._coerce(value)
+            elif param.type_:
+                value = _convert(name, param.type_, value)
+
+            if param._elements:
+                value = param._check_elements(value)
+
+            if param.action:
+                value = _apply(param.action, value)
+
+            if param.choices and not _is_choice(value, param.choices):
+                raise ParserInvalidChoiceError(name, value, param.choices)
+
+            if action:
+                value = _apply(action, value)
 
-        self._params.update({name: param})
+            values.append(value)
+
+        if rules and len(values) in rules:
+            for rule in rules[len(values)]:
+                rule.check(data, values)
+
+        return values
+
+    def _parse_planned(self, data: Dict[str, Any], action: Optional[Callable]) -> List[Any]:
+        """ Parse the parameters in the order of the parse plan, running the presence, regex, conversion and choices
+            checks of every parameter before any action. Values are returned in the order the parameters were added
+        """
+
+        plan: Optional[_ParsePlan] = self._plan
+        if plan is None:
+            plan = self._plan = _ParsePlan(self._params, self._rules, self._rejections)
+
+        values: List[Any] = [None] * len(self._params)
+        deferred: List[Tuple[int, str, Param, Any]] = []
+
+        try:
+            for rule in plan.early_rules:
+                rule.check(data, values)
+
+            for i, name, param in plan.checks:
+                value: Any = data.get(name)
+
+                if value in ("", None):
+                    values[i] = param._default
+                    continue
+
+                if param._pattern and not _match(param._pattern, value):
+                    values[i] = param._default
+                    continue
+
+                if param._coerce is not None:
+                    value = param._coerce(value)
+                elif param.type_:
+                    value = _convert(name, param.type_, value)
+
+                if param._elements:
+                    value = param._check_elements(value)
+
+                if param.action:
+                    deferred.append((i, name, param, value))
+                    continue
+
+                if param.choices and not _is_choice(value, param.choices):
+                    raise ParserInvalidChoiceError(name, value, param.choices)
+
+                values[i] = _apply(action, value) if action else value
+
+        except (ParserTypeError, ParserInvalidChoiceError, ParserLengthError, ParserPatternError, ParserRangeError) as e:
+            if self.order == "adaptive":
+                self._record_rejection(e.param)
+            raise
+
+        for rule in plan.checked_rules:
+            rule.check(data, values)
+
+        for i, name, param, value in deferred:
+            value = _apply(param.action, value)
+            if param.choices and not _is_choice(value, param.choices):
+                raise ParserInvalidChoiceError(name, value, param.choices)
+            values[i] = _apply(action, value) if action else value
+
+        for rule in plan.late_rules:
+            rule.check(data, values)
+
+        if self.order == "adaptive":
+            self._record_rejection(None)
+
+        return values
+
+    def _record_rejection(self, name: Optional[str]) -> None:
+        """ Count a parse for order='adaptive', and the parameter which rejected it if any, re-ordering the checks
+            every REORDER_INTERVAL parses. Counts are not locked, so are approximate when a parser is shared by threads
+        """
+        if name is not None:
+            self._rejections[name] = self._rejections.get(name, 0) + 1
+        self._parses += 1
+        if self._parses % REORDER_INTERVAL == 0:
+            self._plan = None
+
+    def rejection_stats(self) -> Dict[str, int]:
+        """ Returns the number of payloads rejected by the checks of each parameter, recorded when order='adaptive' """
+        return dict(self._rejections)
 
     def parse_dict(
             self,
             data: Dict[str, Any],
             strict: Optional[bool] = False,
             action: Optional[Callable] = None,
-            ignore_required: Optional[Union[List[str], Tuple[str], Set[str]]] = None
-    ) -> NameSpace:
+            ignore_required: Optional[Union[List[str], Tuple[str], Set[str]]] = None,
+            frozen: Optional[bool] = False
+    ) -> Union[NameSpace, FrozenNameSpace]:
         """ Parse a dictionary or dictionary-like object, returning a NameSpace object
 
         Args:
@@ -216,8 +1308,9 @@ class DictionaryParser(object):
             action: A function to apply to all values (applied after type conversion)
             ignore_required: A list (or any kind of list-like sequence) of strings to ignore if the required parameter
                              has been set to True when adding a parameter to the parser
+            frozen: If True, returns a FrozenNameSpace, defaults to False. Always True when the result cache is enabled
         Returns:
-            NameSpace
+            NameSpace or FrozenNameSpace
         """
 
         ignore_required: list = list(ignore_required) if ignore_required else []
@@ -228,6 +1321,9 @@ class DictionaryParser(object):
         if action and not callable(action):
             raise TypeError(f"Invalid type for parameter 'action', '{type(action)}' is not callable")
 
+        if self._resolve:
+            data = self._resolve_keys(data, strict)
+
         for r in self._required_keys:
             if r not in data:
                 if r in ignore_required:
@@ -240,41 +1336,149 @@ class DictionaryParser(object):
                 if k not in self._params.keys():
                     raise ParserInvalidKeyError(k)
 
-        for name, param in self._params.items():
+        cache: Optional[ResultCache] = self._cache
+        key: Optional[tuple] = None
+        if cache is not None:
+            # Actions may have side effects which a cache hit would skip
+            if action or self._has_actions or self._mutable_results:
+                cache.bypass()
+            else:
+                key = cache.key(data, self._params)
+                if key is None:
+                    cache.bypass()
+                else:
+                    cached: Optional[FrozenNameSpace] = cache.get(key)
+                    if cached is not None:
+                        return cached
 
-            value: Any = data.get(name)
+        if self.order != "declared":
+            values: List[Any] = self._parse_planned(data, action)
+        else:
+            values = self._parse_declared(data, action)
 
-            if value in ("", None):
-                param.value = param.default
-                continue
+        if cache is not None or frozen:
+            if self._has_factories:
+                # Defaults created by a factory or copied belong to one result, so the result is not cached
+                if key is not None and (self._factory_rules or _LazyDefault in set(map(type, values))):
+                    key = None
+                # FrozenNameSpace values cannot be created on access
+                values = [_resolve_default(v) for v in values]
+            ns: FrozenNameSpace = FrozenNameSpace._make(self._dests, self._dest_index, tuple(values))
+            # Values of parameters without a type_ may still be containers, which are never shared
+            if key is not None and all(map(_is_immutable, values)):
+                return cache.put(key, ns)
+            return ns
 
-            if param.regex:
-                match = re.match(param.regex, str(value))
-                if not match:
-                    param.value = param.default
-                    continue
+        return NameSpace(list(self._params.values()), values)
 
-            if param.type_:
-                if param.type_ == bool:
-                    try:
-                        value = bool(strtobool(str(value)))
-                    except ValueError:
-                        raise ParserTypeError(name, value, param.type_)
-                else:
-                    try:
-                        value = param.type_(value)
-                    except ValueError:
-                        raise ParserTypeError(name, value, param.type_)
+    def from_tuple(self, values: Sequence[Any]) -> FrozenNameSpace:
+        """ Create a FrozenNameSpace from the values returned by NameSpace.to_tuple, without parsing them again
 
-            if param.action:
-                value = param.action(value)
+        Args:
+            values: A sequence of values in the order the parameters were added to the parser
+        Returns:
+            FrozenNameSpace
+        """
+        values = tuple(values)
+        if len(values) != len(self._dests):
+            raise ValueError(f"Expected {len(self._dests)} values, got {len(values)}")
+        return FrozenNameSpace._make(self._dests, self._dest_index, values)
 
-            if param.choices and value not in param.choices:
-                raise ParserInvalidChoiceError(name, value, param.choices)
+    def from_json(self, data: Union[bytes, str]) -> FrozenNameSpace:
+        """ Create a FrozenNameSpace from JSON returned by NameSpace.to_json, without parsing the values again.
+            Keys not added to the parser are ignored and missing keys are None. Arrays are converted back to the
+            tuple, set or array.array of their parameter
 
-            if action:
-                value = action(value)
+        Args:
+            data: A JSON object as bytes or str
+        Returns:
+            FrozenNameSpace
+        """
+        import json
+
+        obj: Any = json.loads(data)
+        if not isinstance(obj, dict):
+            raise ParserInvalidDataTypeError(obj)
+        return FrozenNameSpace._make(
+            self._dests,
+            self._dest_index,
+            tuple([param._from_json(obj.get(param.dest)) for param in self._params.values()])
+        )
+
+    def to_json_schema(self) -> dict:
+        """ Export the parameters to a JSON Schema document describing the expected data. Actions and cross-field
+            constraints are not exported
+
+        Returns:
+            dict
+        """
+
+        from .schema import to_json_schema
+
+        return to_json_schema(self)
+
+    @classmethod
+    def from_json_schema(cls, schema: Union[dict, str, bytes]) -> DictionaryParser:
+        """ Create a parser from a JSON Schema document of type 'object'. The parameters are built once per document,
+            so loading an identical document again is cheap, but each call returns a new parser which may be modified
+
+        Args:
+            schema: A JSON Schema document as a dict, or encoded as JSON
+        Returns:
+            DictionaryParser
+        """
+
+        from .schema import from_json_schema
+
+        return from_json_schema(schema, cls)
+
+    def profile(
+            self,
+            data_iter: Iterable[Dict[str, Any]],
+            strict: Optional[bool] = False,
+            action: Optional[Callable] = None
+    ) -> ProfileReport:
+        """ Parse a representative workload with tracemalloc, reporting the bytes allocated per parse by each stage
+            (NameSpace construction, type conversion, regex matching, actions and exception creation)
+
+        Args:
+            data_iter: An iterable of dicts to parse, rejected payloads are counted per exception type
+            strict: Passed to parse_dict
+            action: Passed to parse_dict
+        Returns:
+            ProfileReport
+        """
+
+        from .profiling import profile
+
+        return profile(self, data_iter, strict=strict, action=action)
+
+    def cache_info(self) -> Optional[CacheInfo]:
+        """ Returns the result cache statistics (hits, misses, bypassed, maxsize, currsize, maxbytes, currbytes),
+            or None if the cache is not enabled
+        """
+        if self._cache is None:
+            return None
+        return self._cache.info()
+
+    def cache_clear(self) -> None:
+        """ Remove all results from the result cache """
+        if self._cache is not None:
+            self._cache.clear()
+
+    def to_source(self, func_name: str = "parse") -> str:
+        """ Generate the source of a standalone module containing a straight-line version of parse_dict
+
+        The generated function returns a dict of the parsed values keyed by `dest`. Parameters with an `action` cannot
+        be generated and raise a ValueError, as do element and length validation, default factories, and defaults,
+        choices or numeric bounds that are not Python literals.
+
+        Args:
+            func_name: The name of the generated function, defaults to 'parse'
+        Returns:
+            str
+        """
 
-            param.value = value
+        from .codegen import generate_source
 
-        return NameSpace(list(self._params.values()))
+        return generate_source(self, func_name)
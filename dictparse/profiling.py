@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+from .exceptions import ParserException
+from . import exceptions, parser as parser_module
+
+from typing import Any, Callable, Dict, Iterable, Optional, TYPE_CHECKING
+import sys
+import tracemalloc
+
+if TYPE_CHECKING:
+    from .parser import DictionaryParser
+
+
+STAGES: tuple = ("namespace", "conversion", "regex", "action", "exception", "other")
+
+_FILES: frozenset = frozenset((parser_module.__file__, exceptions.__file__))
+
+
+def _codes(*objs: Any) -> Iterable[Any]:
+    """ Yield the code objects of functions, and of the methods of classes, including nested functions """
+    for obj in objs:
+        funcs: Iterable[Any] = vars(obj).values() if isinstance(obj, type) else (obj,)
+        stack: list = [getattr(getattr(attr, "__func__", attr), "__code__", None) for attr in funcs]
+        while stack:
+            code: Any = stack.pop()
+            if code is not None:
+                yield code
+                stack.extend(c for c in code.co_consts if hasattr(c, "co_code"))
+
+
+def _stage_codes() -> Dict[Any, str]:
+    """ Map the code objects of the functions implementing each stage of parse_dict to the stage. Functions
+        called from these, such as exception constructors, are attributed to their own stage
+    """
+    stages: Dict[Any, str] = {}
+    for stage, objs in (
+            ("namespace", (parser_module.NameSpace, parser_module.FrozenNameSpace)),
+            ("conversion", (
+                parser_module._convert,
+                parser_module._strtobool,
+                parser_module._to_bool,
+                parser_module._numeric_coercer,
+                parser_module.Param._check_elements,
+                parser_module.Param._check_length
+            )),
+            ("regex", (parser_module._match,)),
+            ("action", (parser_module._apply,)),
+    ):
+        for code in _codes(*objs):
+            stages[code] = stage
+    return stages
+
+
+class StageStats(object):
+
+    def __init__(self, name: str, parses: int, allocated: int, events: int):
+        """ Memory allocated by one stage of parse_dict
+
+        Args:
+            name: The name of the stage
+            parses: The number of parses in the workload
+            allocated: The total bytes allocated by the stage
+            events: The number of statements executed in the stage which allocated memory
+        """
+        self.name = name
+        self.allocated = allocated
+        self.events = events
+        self.bytes_per_parse: float = allocated / parses if parses else 0.0
+        self.events_per_parse: float = events / parses if parses else 0.0
+
+
+class ProfileReport(object):
+
+    def __init__(self, parses: int, rejected: Dict[str, int], stages: Dict[str, StageStats]):
+        """ The result of DictionaryParser.profile
+
+        Args:
+            parses: The number of payloads parsed
+            rejected: The number of payloads rejected, per exception type name
+            stages: The memory allocated by each stage
+        """
+        self.parses = parses
+        self.rejected = rejected
+        self.stages = stages
+
+    @property
+    def bytes_per_parse(self) -> float:
+        """ The mean bytes allocated per parse, over all stages """
+        return sum(s.bytes_per_parse for s in self.stages.values())
+
+    @property
+    def events_per_parse(self) -> float:
+        """ The mean number of allocating statements per parse, over all stages """
+        return sum(s.events_per_parse for s in self.stages.values())
+
+    def __str__(self) -> str:
+        lines: list = [
+            f"{self.parses} parses, {sum(self.rejected.values())} rejected",
+            f"{'stage':<12}{'bytes/parse':>14}{'allocs/parse':>14}",
+        ]
+        for s in self.stages.values():
+            lines.append(f"{s.name:<12}{s.bytes_per_parse:>14.1f}{s.events_per_parse:>14.2f}")
+        lines.append(f"{'total':<12}{self.bytes_per_parse:>14.1f}{self.events_per_parse:>14.2f}")
+        for name, count in sorted(self.rejected.items()):
+            lines.append(f"rejected {name}: {count}")
+        return "\n".join(lines)
+
+
+class _Tracer(object):
+    """ Attributes the memory allocated while each line of dictparse code runs to the stage of its function, using
+        the traced peak so that temporaries freed within the line (such as str() conversions) are counted
+    """
+
+    def __init__(self):
+        self.allocated: Dict[str, int] = dict.fromkeys(STAGES, 0)
+        self.events: Dict[str, int] = dict.fromkeys(STAGES, 0)
+        self._stages: Dict[Any, str] = _stage_codes()
+        self._stage: Optional[str] = None
+        self._start: int = 0
+        # True from an exception event until the next line runs, while frames are unwound
+        self._unwinding: bool = False
+        # reset_peak was added in Python 3.9, before which only net allocations per line can be measured
+        self._reset_peak: Optional[Callable] = getattr(tracemalloc, "reset_peak", None)
+        # Bound once, creating a bound method per trace event would be measured as an allocation
+        self._trace_lines: Callable = self.trace_lines
+
+    def _classify(self, frame: Any) -> Optional[str]:
+        code: Any = frame.f_code
+        if code.co_filename not in _FILES:
+            return None
+        if code.co_filename == exceptions.__file__:
+            return "exception"
+        return self._stages.get(code, "other")
+
+    def _record(self, frame: Any, stage: Optional[str] = None, charge: Optional[str] = None) -> None:
+        """ Attribute the memory allocated since the last event to the current stage, or to charge if given, then
+            start measuring the given stage, or the stage of the line about to run in frame
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        if self._reset_peak is None:
+            peak = current
+        charge = charge or self._stage
+        if charge is not None and peak > self._start:
+            self.allocated[charge] += peak - self._start
+            self.events[charge] += 1
+        self._stage = stage or (self._classify(frame) if frame is not None else None)
+        self._start = tracemalloc.get_traced_memory()[0]
+        # Reset last, so the peak does not include the memory used by get_traced_memory itself
+        if self._reset_peak is not None:
+            self._reset_peak()
+
+    def trace_calls(self, frame: Any, event: str, arg: Any) -> Optional[Callable]:
+        filename: str = frame.f_code.co_filename
+        if filename == exceptions.__file__:
+            # The exception object was allocated by the raising line, before its __init__ was called
+            self._record(frame, "exception", "exception")
+        if filename in _FILES:
+            return self._trace_lines
+        return None
+
+    def trace_lines(self, frame: Any, event: str, arg: Any) -> Optional[Callable]:
+        if event == "line":
+            self._unwinding = False
+            self._record(frame)
+        elif event == "exception":
+            # The rest of the raising line and unwinding, including the traceback, are attributed to the exception
+            # until the next line runs
+            self._unwinding = True
+            self._record(frame, "exception", "exception")
+        elif event == "return":
+            self._record(frame.f_back, "exception" if self._unwinding else None)
+        return self._trace_lines
+
+    def stop(self) -> None:
+        self._record(None)
+
+
+def profile(
+        parser: DictionaryParser,
+        data_iter: Iterable[Dict[str, Any]],
+        strict: Optional[bool] = False,
+        action: Optional[Callable] = None
+) -> ProfileReport:
+    """ Run a workload through parser.parse_dict, reporting the memory allocated per parse by each stage
+
+    Stages are 'namespace' (building the returned NameSpace), 'conversion' (type conversion), 'regex' (regex matching
+    including the str() conversion of the value), 'action' (actions added with add_param or passed to parse_dict),
+    'exception' (creating exceptions for rejected payloads) and 'other'. Allocations are measured with tracemalloc
+    while a trace function runs, so parsing is much slower than normal while profiling.
+
+    Args:
+        parser: The DictionaryParser to profile
+        data_iter: An iterable of dicts to parse
+        strict: Passed to parse_dict
+        action: Passed to parse_dict
+    Returns:
+        ProfileReport
+    """
+
+    parses: int = 0
+    rejected: Dict[str, int] = {}
+    tracer: _Tracer = _Tracer()
+    tracing: bool = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+
+    previous: Optional[Callable] = sys.gettrace()
+    try:
+        for data in data_iter:
+            parses += 1
+            sys.settrace(tracer.trace_calls)
+            try:
+                parser.parse_dict(data, strict=strict, action=action)
+            except ParserException as e:
+                rejected[type(e).__name__] = rejected.get(type(e).__name__, 0) + 1
+            finally:
+                sys.settrace(previous)
+                tracer.stop()
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+
+    return ProfileReport(
+        parses,
+        rejected,
+        {s: StageStats(s, parses, tracer.allocated[s], tracer.events[s]) for s in STAGES}
+    )
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from .parser import DictionaryParser, Param
+from .schema import build_parser, _param_from_property
+
+from collections import OrderedDict, namedtuple
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+import json
+import sys
+import threading
+import weakref
+
+
+RegistryInfo = namedtuple(
+    "RegistryInfo",
+    ["hits", "misses", "evictions", "maxsize", "currsize", "maxbytes", "currbytes", "params", "param_refs", "param_bytes"]
+)
+
+
+def _parser_bytes(parser: DictionaryParser) -> int:
+    """ The approximate size of a parser, excluding its Params which may be shared with other parsers """
+
+    size: int = sys.getsizeof(parser) + sys.getsizeof(parser.__dict__)
+    for v in (parser._params, parser._key_index, parser._dests, parser._dest_index, parser._required_keys, parser._rules):
+        size += sys.getsizeof(v)
+    return size
+
+
+def _param_bytes(param: Param) -> int:
+    """ The approximate size of a Param and its attributes """
+    return sys.getsizeof(param) + sys.getsizeof(param.__dict__) + sum(sys.getsizeof(v) for v in param.__dict__.values())
+
+
+class _Shard(object):
+    """ An LRU cache of parsers with its own lock, so threads using parsers in different shards do not contend """
+
+    def __init__(self, maxsize: int, maxbytes: Optional[int]):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.bytes: int = 0
+        self.param_refs: int = 0
+        self.entries: OrderedDict = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: Union[str, bytes]) -> Optional[DictionaryParser]:
+        with self.lock:
+            entry: Optional[Tuple[DictionaryParser, int]] = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Union[str, bytes], parser: DictionaryParser) -> DictionaryParser:
+        size: int = _parser_bytes(parser)
+        with self.lock:
+            if key in self.entries:
+                # Built concurrently by another thread, keep the parser already shared
+                return self.entries[key][0]
+            self.entries[key] = (parser, size)
+            self.bytes += size
+            self.param_refs += len(parser._params)
+            while len(self.entries) > 1 and (
+                    len(self.entries) > self.maxsize or (self.maxbytes is not None and self.bytes > self.maxbytes)
+            ):
+                _, (evicted, evicted_size) = self.entries.popitem(last=False)
+                self.bytes -= evicted_size
+                self.param_refs -= len(evicted._params)
+                self.evictions += 1
+        return parser
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.bytes = 0
+            self.param_refs = 0
+
+
+class ParserRegistry(object):
+
+    def __init__(
+            self,
+            maxsize: int = 1024,
+            maxbytes: Optional[int] = None,
+            shards: int = 16,
+            cls: Type[DictionaryParser] = DictionaryParser
+    ):
+        """ A thread-safe cache of parsers built from serialized definitions, for processes serving many schemas
+
+        Definitions are JSON Schema documents, as written by DictionaryParser.to_json_schema. Parsers are kept in
+        shards, each an LRU cache with its own lock, and identical parameter definitions are shared by every parser
+        which uses them. Parsers returned by the registry are shared and must not be modified with add_param.
+
+        Args:
+            maxsize: The maximum number of cached parsers
+            maxbytes: The maximum approximate size in bytes of the cached parsers, excluding their shared Params,
+                      defaults to unbounded
+            shards: The number of shards. Each holds an equal part of maxsize and maxbytes, so a shard may evict a
+                    parser before the registry is full, but the registry never holds more than maxsize parsers
+            cls: The parser class to create
+        """
+        if not isinstance(maxsize, int) or maxsize < 1:
+            raise ValueError(f"Invalid value '{maxsize}' for parameter 'maxsize', must be a positive int")
+        if maxbytes is not None and (not isinstance(maxbytes, int) or maxbytes < 1):
+            raise ValueError(f"Invalid value '{maxbytes}' for parameter 'maxbytes', must be a positive int")
+        if not isinstance(shards, int) or shards < 1:
+            raise ValueError(f"Invalid value '{shards}' for parameter 'shards', must be a positive int")
+
+        shards = min(shards, maxsize, maxbytes or maxsize)
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.cls = cls
+        # The remainders are spread over the first shards, so the shard limits add up to maxsize and maxbytes
+        self._shards: List[_Shard] = [
+            _Shard(
+                maxsize // shards + (i < maxsize % shards),
+                maxbytes // shards + (i < maxbytes % shards) if maxbytes is not None else None
+            )
+            for i in range(shards)
+        ]
+        # Params are not modified by parse_dict, so one Param can be used by any number of parsers
+        self._params: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
+        self._params_lock = threading.Lock()
+
+    def _param(self, name: str, prop: Any, required: bool) -> Param:
+        """ Return the shared Param for a property, creating it if no cached parser uses an identical definition """
+
+        key: Tuple[str, bool, str] = (name, required, json.dumps(prop, sort_keys=True))
+        with self._params_lock:
+            param: Optional[Param] = self._params.get(key)
+        if param is None:
+            param = _param_from_property(name, prop, required)
+            with self._params_lock:
+                param = self._params.setdefault(key, param)
+        return param
+
+    def get(self, definition: Union[dict, str, bytes]) -> DictionaryParser:
+        """ Return the parser for a definition, building and caching it if it is not cached. Definitions given as
+            str or bytes are looked up without being decoded, so keep them as stored rather than decoding them
+
+        Args:
+            definition: A JSON Schema document as a dict, or encoded as JSON
+        Returns:
+            DictionaryParser
+        """
+
+        if isinstance(definition, (str, bytes)):
+            key: Union[str, bytes] = definition
+        else:
+            # Keys are not sorted, as the order of the properties is the order of the parameters
+            key = json.dumps(definition)
+
+        shard: _Shard = self._shards[hash(key) % len(self._shards)]
+        parser: Optional[DictionaryParser] = shard.get(key)
+        if parser is None:
+            parser = shard.put(key, build_parser(json.loads(key), self.cls, self._param))
+        return parser
+
+    def clear(self) -> None:
+        """ Remove all cached parsers, keeping the statistics """
+        for shard in self._shards:
+            shard.clear()
+
+    def info(self) -> RegistryInfo:
+        """ Return the registry statistics. `params` is the number of distinct Params used by the cached parsers and
+            `param_refs` the number of parameters of the cached parsers, so param_refs / params is the sharing ratio
+        """
+
+        totals: Dict[str, int] = dict.fromkeys(("hits", "misses", "evictions", "currsize", "currbytes", "param_refs"), 0)
+        for shard in self._shards:
+            with shard.lock:
+                totals["hits"] += shard.hits
+                totals["misses"] += shard.misses
+                totals["evictions"] += shard.evictions
+                totals["currsize"] += len(shard.entries)
+                totals["currbytes"] += shard.bytes
+                totals["param_refs"] += shard.param_refs
+        with self._params_lock:
+            params: List[Param] = list(self._params.values())
+
+        return RegistryInfo(
+            totals["hits"],
+            totals["misses"],
+            totals["evictions"],
+            self.maxsize,
+            totals["currsize"],
+            self.maxbytes,
+            totals["currbytes"],
+            len(params),
+            totals["param_refs"],
+            sum(_param_bytes(p) for p in params)
+        )
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+from .parser import DictionaryParser, Param
+
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Type, Union
+import json
+
+
+# The maximum number of parsers cached by from_json_schema
+SCHEMA_CACHE_SIZE: int = 1024
+
+_JSON_TYPES: Dict[type, str] = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",
+    tuple: "array",
+    set: "array",
+    dict: "object",
+}
+
+_PYTHON_TYPES: Dict[str, type] = {
+    "string": str,
+    "integer": int,
+    "number": float,
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+
+# JSON Schema length keywords for each type, as (minimum, maximum)
+_LENGTH_KEYWORDS: Dict[type, tuple] = {
+    str: ("minLength", "maxLength"),
+    list: ("minItems", "maxItems"),
+    tuple: ("minItems", "maxItems"),
+    set: ("minItems", "maxItems"),
+    dict: ("minProperties", "maxProperties"),
+}
+
+
+def _anchor(regex: str) -> str:
+    """ Anchor a regex at the start of the value, as DictionaryParser matches them with re.match """
+    return regex if regex.startswith("^") else f"^(?:{regex})"
+
+
+def _unanchor(regex: str) -> str:
+    """ Allow a JSON Schema pattern, which matches anywhere in the value, to be used with re.match """
+    return regex if regex.startswith("^") else f"(?s:.*?)(?:{regex})"
+
+
+def _to_json_value(v: Any) -> Any:
+    """ Convert tuples and sets to lists so they can be encoded as JSON """
+    if isinstance(v, (tuple, set, frozenset)):
+        return list(v)
+    return v
+
+
+def _from_json_value(v: Any, type_: Optional[Type]) -> Any:
+    """ Convert a JSON array back to the tuple or set of a parameter with that type, reversing _to_json_value """
+    if type_ in (tuple, set) and isinstance(v, list):
+        return type_(v)
+    return v
+
+
+def to_json_schema(parser: DictionaryParser) -> dict:
+    """ Export the parameters of parser to a JSON Schema document
+
+    Regular expressions are anchored at the start of the value, as DictionaryParser matches them with re.match.
+    The Python type, dest, aliases, array output and strict numeric parsing of a parameter are kept in the
+    'x-python-type', 'x-dest', 'x-aliases', 'x-array' and 'x-strict-numeric' keywords as they cannot be expressed in
+    JSON Schema.
+
+    Args:
+        parser: The DictionaryParser to export
+    Returns:
+        dict
+    """
+
+    properties: Dict[str, dict] = {}
+    for name, param in parser._params.items():
+        prop: dict = {}
+        if param.type_:
+            prop["type"] = _JSON_TYPES[param.type_]
+            if param.type_ in (tuple, set):
+                prop["x-python-type"] = param.type_.__name__
+            if param.type_ is set:
+                prop["uniqueItems"] = True
+        if param.choices:
+            prop["enum"] = [_to_json_value(c) for c in param.choices]
+        if param.regex:
+            prop["pattern"] = _anchor(param.regex)
+        if param.element_type or param.element_choices or param.element_regex:
+            items: dict = {}
+            if param.element_type:
+                items["type"] = _JSON_TYPES[param.element_type]
+            if param.element_choices:
+                items["enum"] = [_to_json_value(c) for c in param.element_choices]
+            if param.element_regex:
+                items["pattern"] = _anchor(param.element_regex)
+            prop["items"] = items
+        if param.min_length is not None:
+            prop[_LENGTH_KEYWORDS[param.type_][0]] = param.min_length
+        if param.max_length is not None:
+            prop[_LENGTH_KEYWORDS[param.type_][1]] = param.max_length
+        if param.array:
+            prop["x-array"] = True
+        if param.minimum is not None:
+            prop["minimum"] = param.minimum
+        if param.maximum is not None:
+            prop["maximum"] = param.maximum
+        if param.strict_numeric:
+            prop["x-strict-numeric"] = True
+        if param.default is not None:
+            prop["default"] = _to_json_value(param.default)
+        if param.description:
+            prop["description"] = param.description
+        if param.dest != param.name:
+            prop["x-dest"] = param.dest
+        if param.aliases:
+            prop["x-aliases"] = list(param.aliases)
+        properties[name] = prop
+
+    schema: dict = {"type": "object"}
+    if parser.description:
+        schema["description"] = parser.description
+    schema["properties"] = properties
+    if parser._required_keys:
+        schema["required"] = list(parser._required_keys)
+    return schema
+
+
+def _check_name(n: Any, what: str) -> str:
+    if not isinstance(n, str) or not DictionaryParser._is_valid_name(n):
+        raise ValueError(f"Invalid value '{n}' for {what}. Must comply with Python variable naming rules")
+    return n
+
+
+def _param_from_property(name: str, prop: Any, required: bool) -> Param:
+    """ Build a Param from a JSON Schema property, validating only what JSON Schema cannot guarantee """
+
+    if not isinstance(prop, dict):
+        raise ValueError(f"Invalid schema for property '{name}', must be an object")
+
+    type_: Optional[Type] = None
+    if "type" in prop:
+        type_ = _PYTHON_TYPES.get(prop["type"]) if isinstance(prop["type"], str) else None
+        if type_ is None:
+            raise ValueError(f"Unsupported type '{prop['type']}' for property '{name}'")
+        if type_ is list and prop.get("x-python-type") in ("tuple", "set"):
+            type_ = tuple if prop["x-python-type"] == "tuple" else set
+
+    choices: Optional[list] = prop.get("enum")
+    if choices is not None and not isinstance(choices, list):
+        raise ValueError(f"Invalid 'enum' for property '{name}', must be an array")
+    if choices is not None:
+        choices = [_from_json_value(c, type_) for c in choices]
+
+    regex: Optional[str] = prop.get("pattern")
+    if regex is not None:
+        regex = _unanchor(regex)
+
+    element_type: Optional[type] = None
+    element_choices: Optional[list] = None
+    element_regex: Optional[str] = None
+    items: Any = prop.get("items")
+    if items is not None and type_ in (list, tuple, set):
+        if not isinstance(items, dict):
+            raise ValueError(f"Invalid 'items' for property '{name}', must be an object")
+        if "type" in items:
+            element_type = _PYTHON_TYPES.get(items["type"]) if isinstance(items["type"], str) else None
+            if element_type not in (str, int, float, bool):
+                raise ValueError(f"Unsupported items type '{items['type']}' for property '{name}'")
+        element_choices = items.get("enum")
+        if element_choices is not None and not isinstance(element_choices, list):
+            raise ValueError(f"Invalid items 'enum' for property '{name}', must be an array")
+        if items.get("pattern") is not None:
+            element_regex = _unanchor(items["pattern"])
+
+    lengths: list = [None, None]
+    if type_ in _LENGTH_KEYWORDS:
+        for i, keyword in enumerate(_LENGTH_KEYWORDS[type_]):
+            if keyword in prop:
+                if not isinstance(prop[keyword], int) or isinstance(prop[keyword], bool) or prop[keyword] < 0:
+                    raise ValueError(f"Invalid '{keyword}' for property '{name}', must be a non-negative integer")
+                lengths[i] = prop[keyword]
+        if lengths[0] is not None and lengths[1] is not None and lengths[0] > lengths[1]:
+            minimum, maximum = _LENGTH_KEYWORDS[type_]
+            raise ValueError(f"Invalid '{minimum}' for property '{name}', must not be greater than '{maximum}'")
+
+    dest: Optional[str] = prop.get("x-dest")
+    if dest is not None:
+        _check_name(dest, f"'x-dest' of property '{name}'")
+
+    aliases: Any = prop.get("x-aliases")
+    if aliases is not None and (not isinstance(aliases, list) or not all(isinstance(a, str) for a in aliases)):
+        raise ValueError(f"Invalid 'x-aliases' for property '{name}', must be an array of strings")
+
+    bounds: list = [None, None]
+    if type_ in (int, float):
+        for i, keyword in enumerate(("minimum", "maximum")):
+            if keyword in prop:
+                if not isinstance(prop[keyword], (int, float)) or isinstance(prop[keyword], bool):
+                    raise ValueError(f"Invalid '{keyword}' for property '{name}', must be a number")
+                bounds[i] = prop[keyword]
+        if bounds[0] is not None and bounds[1] is not None and bounds[0] > bounds[1]:
+            raise ValueError(f"Invalid 'minimum' for property '{name}', must not be greater than 'maximum'")
+
+    return Param(
+        name,
+        type_=type_,
+        dest=dest,
+        required=required,
+        choices=choices,
+        description=prop.get("description"),
+        default=_from_json_value(prop.get("default"), type_),
+        regex=regex,
+        aliases=aliases,
+        element_type=element_type,
+        element_choices=element_choices,
+        element_regex=element_regex,
+        min_length=lengths[0],
+        max_length=lengths[1],
+        array=bool(prop.get("x-array")) and type_ is list and element_type in (int, float),
+        minimum=bounds[0],
+        maximum=bounds[1],
+        strict_numeric=bool(prop.get("x-strict-numeric")) and type_ in (int, float)
+    )
+
+
+def build_parser(
+        schema: Any,
+        cls: Type[DictionaryParser] = DictionaryParser,
+        make_param: Callable[[str, Any, bool], Param] = _param_from_property
+) -> DictionaryParser:
+    """ Create a parser from a decoded JSON Schema document without caching it
+
+    Args:
+        schema: A decoded JSON Schema document
+        cls: The parser class to create
+        make_param: Called with the name, schema and required flag of each property to create its Param
+    Returns:
+        DictionaryParser
+    """
+
+    if not isinstance(schema, dict) or schema.get("type", "object") != "object":
+        raise ValueError("Invalid schema, must be a JSON Schema document of type 'object'")
+
+    properties: Any = schema.get("properties", {})
+    required: Any = schema.get("required", [])
+    if not isinstance(properties, dict) or not isinstance(required, list):
+        raise ValueError("Invalid schema, 'properties' must be an object and 'required' an array")
+
+    for r in required:
+        if r not in properties:
+            raise ValueError(f"Required property '{r}' is not defined in 'properties'")
+
+    parser: DictionaryParser = cls(description=schema.get("description"))
+    for name, prop in properties.items():
+        _check_name(name, "property name")
+        parser._add(make_param(name, prop, name in required))
+    return parser
+
+
+@lru_cache(maxsize=SCHEMA_CACHE_SIZE)
+def _build(cls: Type[DictionaryParser], document: str) -> DictionaryParser:
+    """ Build the template parser of a document. Templates are never returned, so callers cannot modify them """
+    return build_parser(json.loads(document), cls)
+
+
+def _copy_parser(template: DictionaryParser) -> DictionaryParser:
+    """ Create a parser with the Params of template. Params are not modified by parse_dict, so they are shared """
+
+    parser: DictionaryParser = type(template)(description=template.description)
+    for param in template._params.values():
+        parser._add(param)
+    return parser
+
+
+def from_json_schema(schema: Union[dict, str, bytes], cls: Type[DictionaryParser] = DictionaryParser) -> DictionaryParser:
+    """ Create a parser from a JSON Schema document. The document is validated and its Params built once per identical
+    document, and each call returns a new parser using them, so callers may add parameters and constraints to it
+
+    Supports documents of type 'object' whose properties use the keywords type, enum, pattern, default, description,
+    items (with type, enum and pattern), minimum, maximum, the length keywords minLength, maxLength, minItems,
+    maxItems, minProperties and maxProperties, and the 'x-python-type', 'x-dest', 'x-aliases', 'x-array' and
+    'x-strict-numeric' keywords written by to_json_schema. Other keywords are ignored.
+
+    Args:
+        schema: A JSON Schema document as a dict, or encoded as JSON
+        cls: The parser class to create
+    Returns:
+        DictionaryParser
+    """
+
+    if not isinstance(schema, dict):
+        schema = json.loads(schema)
+    # Keys are not sorted, as the order of the properties is the order of the parameters
+    return _copy_parser(_build(cls, json.dumps(schema)))
@@ -1,30 +1,29 @@
 from app.users import create_user
 
-from flask import Flask, request
+from flask import Flask
 from respond import JSONResponse
 from dictparse import DictionaryParser
+from dictparse.integrations import flask
 
 
-def create_app():
+# Built once when the module is imported and shared by every request
+parser = DictionaryParser(description="Create a new user")
 
-    app = Flask(__name__)
+parser.add_param("name", str, required=True)
+parser.add_param("age", int)
+parser.add_param("password", str, required=True, action=lambda x: x.encode("utf-8"))
+parser.add_param("interests", list, action=lambda x: [i.strip() for i in x])
+parser.add_param("level", float, default=1.5)
+parser.add_param("stage", str, choices=["alpha", "beta"])
 
-    @app.route("/", methods=["POST"])
-    def post():
 
-        parser = DictionaryParser(description="Create a new user")
+def create_app():
 
-        parser.add_param("name", str, required=True)
-        parser.add_param("age", int)
-        parser.add_param("password", str, required=True, action=lambda x: x.encode("utf-8"))
-        parser.add_param("interests", list, action=lambda x: [i.strip() for i in x])
-        parser.add_param("level", float, default=1.5)
-        parser.add_param("stage", str, choices=["alpha", "beta"])
+    app = Flask(__name__)
 
-        try:
-            params = parser.parse_dict(request.get_json())
-        except Exception as e:
-            return JSONResponse.bad_request(str(e))
+    @app.route("/", methods=["POST"])
+    @flask(parser, source="json")
+    def post(params):
 
         user = create_user(
             name=params.name,
@@ -7,6 +7,8 @@ setuptools.setup(
     name="dictparse",
     version="1.4",
     packages=setuptools.find_packages(),
+    python_requires=">=3.8",
+    extras_require={"flask": ["flask"]},
     author="Julian Nash",
     author_email="julianjamesnash@gmail.com",
     description="A Python dictionary parser",
@@ -22,8 +24,10 @@ setuptools.setup(
     classifiers=[
         'Intended Audience :: Developers',
         'License :: OSI Approved :: MIT License',
-        'Programming Language :: Python :: 3.6',
-        'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
+        'Programming Language :: Python :: 3.9',
+        'Programming Language :: Python :: 3.10',
+        'Programming Language :: Python :: 3.11',
+        'Programming Language :: Python :: 3.12',
     ],
 )
\ No newline at end of file
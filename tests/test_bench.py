@@ -0,0 +1,100 @@
+from dictparse import DictionaryParser
+from dictparse.bench import BenchReport, load_parser, load_payloads, main, run
+
+from contextlib import redirect_stdout
+import io
+import json
+import os
+import tempfile
+import unittest
+
+
+def make_parser() -> DictionaryParser:
+    parser = DictionaryParser()
+    parser.add_param("name", str, required=True)
+    parser.add_param("age", int)
+    return parser
+
+
+def make_failing_parser() -> DictionaryParser:
+    parser = make_parser()
+    parser.add_param("code", str, action=lambda code: {"a": 1}[code])
+    return parser
+
+
+PARSER: DictionaryParser = make_parser()
+
+SPEC: str = f"{__name__}:make_parser"
+
+PAYLOADS: list = [{"name": "foo", "age": "32"}] * 6 + [{"age": 1}] * 3 + [{"name": "foo", "age": "x"}]
+
+
+class TestBench(unittest.TestCase):
+
+    def test_load_parser(self):
+
+        self.assertIs(load_parser(f"{__name__}:PARSER"), PARSER)
+        self.assertIsInstance(load_parser(SPEC), DictionaryParser)
+        with self.assertRaises(ValueError):
+            load_parser("make_parser")
+        with self.assertRaises(TypeError):
+            load_parser(f"{__name__}:SPEC")
+
+    def test_load_payloads(self):
+
+        self.assertEqual(load_payloads(['{"a": 1}\n', "\n", "[]"]), [{"a": 1}, []])
+
+    def test_modes(self):
+
+        for mode in ("single", "thread", "process"):
+            report = run(SPEC, PAYLOADS, mode=mode, workers=2, repeat=2)
+
+            self.assertEqual(report.parses, 20, mode)
+            self.assertEqual(report.rejected, {"ParserRequiredKeyError": 6, "ParserTypeError": 2}, mode)
+            self.assertEqual(report.rejection_rates()["ParserRequiredKeyError"], 0.3)
+            self.assertGreater(report.throughput, 0)
+            self.assertLessEqual(report.percentile(50), report.percentile(99))
+
+    def test_other_exceptions_counted(self):
+
+        payloads = [{"name": "foo", "code": "a"}, {"name": "foo", "code": "b"}, {"age": 1}]
+        for mode in ("single", "thread", "process"):
+            report = run(f"{__name__}:make_failing_parser", payloads, mode=mode, workers=2)
+
+            self.assertEqual(report.parses, 3, mode)
+            self.assertEqual(report.rejected, {"KeyError": 1, "ParserRequiredKeyError": 1}, mode)
+
+    def test_invalid_mode(self):
+
+        with self.assertRaises(ValueError):
+            run(SPEC, PAYLOADS, mode="async")
+        with self.assertRaises(ValueError):
+            run(SPEC, PAYLOADS, workers=0)
+
+    def test_percentile(self):
+
+        report = BenchReport("single", 1, 1.0, [i * 1000 for i in range(1, 101)], {})
+
+        self.assertEqual(report.percentile(50), 50.0)
+        self.assertEqual(report.percentile(99), 99.0)
+        self.assertEqual(report.percentile(100), 100.0)
+        self.assertEqual(BenchReport("single", 1, 0.0, [], {}).percentile(50), 0.0)
+
+    def test_main(self):
+
+        with tempfile.NamedTemporaryFile("w", suffix=".jsonl", delete=False) as f:
+            f.write("\n".join(json.dumps(p) for p in PAYLOADS))
+        try:
+            out = io.StringIO()
+            with redirect_stdout(out):
+                self.assertEqual(main([f.name, "--parser", SPEC, "--json", "--strict"]), 0)
+            report = json.loads(out.getvalue())
+            self.assertEqual(report["parses"], 10)
+            self.assertEqual(report["rejected"], {"ParserRequiredKeyError": 3, "ParserTypeError": 1})
+
+            out = io.StringIO()
+            with redirect_stdout(out):
+                main([f.name, "--parser", SPEC, "--mode", "thread", "--workers", "2"])
+            self.assertIn("rejected ParserTypeError: 1 (10.00%)", out.getvalue())
+        finally:
+            os.unlink(f.name)
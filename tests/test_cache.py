@@ -0,0 +1,161 @@
+from dictparse import DictionaryParser
+from dictparse.exceptions import ParserTypeError
+
+import unittest
+
+
+class TestCache(unittest.TestCase):
+
+    def test_cache_disabled_by_default(self):
+        """ Results are not cached unless cache_size is given """
+
+        parser = DictionaryParser()
+        parser.add_param("name", str)
+        parser.parse_dict({"name": "foo"})
+
+        self.assertIsNone(parser.cache_info())
+
+    def test_cache_hit_returns_shared_namespace(self):
+        """ Equal data returns the same FrozenNameSpace, ignoring undeclared keys """
+
+        parser = DictionaryParser(cache_size=8)
+        parser.add_param("name", str)
+        parser.add_param("age", int)
+        first = parser.parse_dict({"name": "foo", "age": "32"})
+        second = parser.parse_dict({"name": "foo", "age": "32", "undeclared": 1})
+
+        self.assertIs(first, second)
+        self.assertEqual(second.age, 32)
+        info = parser.cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (1, 1, 1))
+
+    def test_cache_namespace_is_read_only(self):
+        """ Raises an AttributeError when a cached result is modified """
+
+        parser = DictionaryParser(cache_size=8)
+        parser.add_param("name", str)
+        params = parser.parse_dict({"name": "foo"})
+
+        with self.assertRaises(AttributeError):
+            params.name = "bar"
+
+    def test_cache_distinguishes_types(self):
+        """ Values which compare equal but differ in type are cached separately """
+
+        parser = DictionaryParser(cache_size=8)
+        parser.add_param("value", str)
+
+        self.assertEqual(parser.parse_dict({"value": 1}).value, "1")
+        self.assertEqual(parser.parse_dict({"value": 1.0}).value, "1.0")
+        self.assertEqual(parser.parse_dict({"value": True}).value, "True")
+        self.assertEqual(parser.parse_dict({"value": -0.0}).value, "-0.0")
+        self.assertEqual(parser.parse_dict({"value": {1: "x"}}).value, "{1: 'x'}")
+        self.assertEqual(parser.parse_dict({"value": {True: "x"}}).value, "{True: 'x'}")
+        self.assertEqual(parser.parse_dict({"value": {1.0: "x"}}).value, "{1.0: 'x'}")
+        self.assertEqual(parser.cache_info().hits, 0)
+
+    def test_cache_evicts_least_recently_used(self):
+        """ The least recently used result is evicted when the cache is full """
+
+        parser = DictionaryParser(cache_size=2)
+        parser.add_param("name", str)
+        a = parser.parse_dict({"name": "a"})
+        parser.parse_dict({"name": "b"})
+        parser.parse_dict({"name": "a"})
+        parser.parse_dict({"name": "c"})
+
+        self.assertIs(parser.parse_dict({"name": "a"}), a)
+        self.assertEqual(parser.cache_info().currsize, 2)
+        self.assertEqual(parser.cache_info().hits, 2)
+
+    def test_cache_memory_bound(self):
+        """ Results are evicted to keep the cache within cache_bytes """
+
+        parser = DictionaryParser(cache_size=100, cache_bytes=2000)
+        parser.add_param("name", str)
+        for i in range(100):
+            parser.parse_dict({"name": str(i) * 20})
+
+        info = parser.cache_info()
+        self.assertLessEqual(info.currbytes, 2000)
+        self.assertLess(info.currsize, 100)
+
+    def test_cache_bypassed_with_actions(self):
+        """ Parsers with actions are not cached """
+
+        calls = []
+        parser = DictionaryParser(cache_size=8)
+        parser.add_param("name", str, action=lambda x: calls.append(x) or x)
+        parser.parse_dict({"name": "foo"})
+        parser.parse_dict({"name": "foo"})
+
+        self.assertEqual(calls, ["foo", "foo"])
+        self.assertEqual(parser.cache_info().bypassed, 2)
+
+    def test_cache_bypassed_with_parse_action(self):
+        """ Parses given an action are not cached """
+
+        parser = DictionaryParser(cache_size=8)
+        parser.add_param("name", str)
+        parser.parse_dict({"name": "foo"}, action=lambda x: x)
+
+        self.assertEqual(parser.cache_info().bypassed, 1)
+
+    def test_cache_bypassed_with_unhashable_value(self):
+        """ Values which cannot be keyed bypass the cache """
+
+        parser = DictionaryParser(cache_size=8)
+        parser.add_param("tags", list)
+        params = parser.parse_dict({"tags": iter(["a", "b"])})
+
+        self.assertEqual(params.tags, ["a", "b"])
+        self.assertEqual(parser.cache_info().bypassed, 1)
+
+    def test_cache_bypassed_with_container_types(self):
+        """ Parsers converting to containers are not cached """
+
+        parser = DictionaryParser(cache_size=8)
+        parser.add_param("tags", list)
+        parser.parse_dict({"tags": ["a"]}).tags.append("leak")
+
+        self.assertEqual(parser.parse_dict({"tags": ["a"]}).tags, ["a"])
+        self.assertEqual(parser.cache_info().bypassed, 2)
+
+    def test_cache_containers_not_shared(self):
+        """ Container values of parameters without a type are not cached """
+
+        parser = DictionaryParser(cache_size=8)
+        parser.add_param("value")
+        parser.parse_dict({"value": ["a"]}).value.append("leak")
+
+        self.assertEqual(parser.parse_dict({"value": ["a"]}).value, ["a"])
+        self.assertEqual(parser.parse_dict({"value": "a"}).value, "a")
+        self.assertIs(parser.parse_dict({"value": "a"}), parser.parse_dict({"value": "a"}))
+        self.assertEqual(parser.cache_info().currsize, 1)
+
+    def test_cache_errors_not_cached(self):
+        """ Invalid data raises on every parse """
+
+        parser = DictionaryParser(cache_size=8)
+        parser.add_param("name", str)
+        parser.add_param("age", int)
+
+        for _ in range(2):
+            with self.assertRaises(ParserTypeError):
+                parser.parse_dict({"age": "thirty"})
+
+    def test_cache_cleared_by_add_param(self):
+        """ Adding a parameter clears the cache """
+
+        parser = DictionaryParser(cache_size=8)
+        parser.add_param("name", str)
+        parser.parse_dict({"name": "foo"})
+        parser.add_param("level", int, default=1)
+
+        self.assertEqual(parser.parse_dict({"name": "foo"}).level, 1)
+
+    def test_cache_invalid_size(self):
+        """ Raises a ValueError when cache_size is negative """
+
+        with self.assertRaises(ValueError):
+            DictionaryParser(cache_size=-1)
@@ -0,0 +1,158 @@
+from dictparse import DictionaryParser
+from dictparse.exceptions import (
+    ParserException,
+    ParserTypeError,
+    ParserRequiredKeyError,
+    ParserInvalidChoiceError,
+    ParserInvalidKeyError,
+    ParserInvalidDataTypeError
+)
+
+import unittest
+
+
+def _compile(parser: DictionaryParser, func_name: str = "parse"):
+    namespace: dict = {}
+    exec(compile(parser.to_source(func_name), "<dictparse>", "exec"), namespace)
+    return namespace[func_name]
+
+
+class TestCodegen(unittest.TestCase):
+
+    def test_generated_matches_parse_dict(self):
+        """ The generated function returns the same values as parse_dict """
+
+        parser = DictionaryParser(description="Create a new user")
+        parser.add_param("name", str, required=True)
+        parser.add_param("age", int, default=18)
+        parser.add_param("active", bool)
+        parser.add_param("level", float, choices=[1.0, 1.5, 2.0])
+        parser.add_param("code", str, dest="ref", regex=r"^\d{3}$")
+        parser.add_param("tags", list, default=[])
+        parse = _compile(parser)
+
+        payloads = [
+            {"name": "foo", "age": "32", "active": "yes", "level": "1.5", "code": "123", "tags": ("a", "b")},
+            {"name": "foo", "age": "", "active": 0, "code": "12a"},
+            {"name": 1, "extra": "ignored"},
+        ]
+        for payload in payloads:
+            self.assertEqual(parse(payload), parser.parse_dict(payload).to_dict())
+
+    def test_generated_function_name(self):
+        """ The generated function is named after func_name """
+
+        parser = DictionaryParser()
+        parser.add_param("name", str)
+        parse_user = _compile(parser, "parse_user")
+        self.assertEqual(parse_user({"name": "foo"})["name"], "foo")
+
+    def test_generated_invalid_function_name(self):
+        """ Raises a ValueError when func_name is not a valid identifier """
+
+        parser = DictionaryParser()
+        parser.add_param("name", str)
+
+        with self.assertRaises(ValueError):
+            parser.to_source("parse user")
+
+    def test_generated_exceptions(self):
+        """ The generated function raises the same exceptions as parse_dict """
+
+        parser = DictionaryParser()
+        parser.add_param("name", str, required=True)
+        parser.add_param("age", int)
+        parser.add_param("active", bool)
+        parser.add_param("level", float, choices=[1.0, 1.5, 2.0])
+        parser.add_param("tags", list)
+        parse = _compile(parser)
+
+        with self.assertRaises(ParserRequiredKeyError):
+            parse({"age": 1})
+        with self.assertRaises(ParserTypeError):
+            parse({"name": "foo", "age": "thirty"})
+        with self.assertRaises(ParserTypeError):
+            parse({"name": "foo", "active": "maybe"})
+        with self.assertRaises(ParserTypeError):
+            parse({"name": "foo", "age": [1]})
+        with self.assertRaises(ParserTypeError):
+            parse({"name": "foo", "tags": 5})
+        with self.assertRaises(ParserInvalidChoiceError):
+            parse({"name": "foo", "level": 3})
+        with self.assertRaises(ParserInvalidKeyError):
+            parse({"name": "foo", "extra": 1}, strict=True)
+        with self.assertRaises(ParserInvalidDataTypeError):
+            parse(["name"])
+
+    def test_generated_ignore_required_and_action(self):
+        """ The generated function accepts the ignore_required and action arguments of parse_dict """
+
+        parser = DictionaryParser()
+        parser.add_param("name", str, required=True)
+        parser.add_param("code", str, dest="ref", regex=r"^\d{3}$")
+        parse = _compile(parser)
+        values = parse({"code": "123"}, ignore_required=["name"], action=str)
+        self.assertEqual(values["name"], None)
+        self.assertEqual(values["ref"], "123")
+
+    def test_generated_action_not_supported(self):
+        """ Raises a ValueError when a parameter has an action """
+
+        parser = DictionaryParser()
+        parser.add_param("name", str, action=str.upper)
+
+        with self.assertRaises(ValueError):
+            parser.to_source()
+
+    def test_generated_default_not_literal(self):
+        """ Raises a ValueError when a default cannot be written as a literal """
+
+        parser = DictionaryParser()
+        parser.add_param("name", str, default=object())
+
+        with self.assertRaises(ValueError):
+            parser.to_source()
+
+    def test_generated_aliases(self):
+        """ The generated function matches aliases and key styles like parse_dict """
+
+        parser = DictionaryParser(ignore_key_style=True)
+        parser.add_param("user_id", int, required=True, aliases=["uid"])
+        parse = _compile(parser)
+
+        for payload in ({"userId": "1"}, {"UID": 2, "user_id": 3}, {"uid": 4, "other": 5}):
+            self.assertEqual(parse(payload), parser.parse_dict(payload).to_dict())
+        with self.assertRaises(ParserInvalidKeyError):
+            parse({"uid": 1, "other": 2}, strict=True)
+
+    def test_generated_constraints(self):
+        """ The generated function checks constraints like parse_dict """
+
+        parser = DictionaryParser()
+        parser.add_param("start", int)
+        parser.add_param("end", int)
+        parser.add_param("method", str)
+        parser.add_param("card", str)
+        parser.add_param("email", str)
+        parser.add_param("phone", str)
+        parser.add_constraint("end", ">", "start")
+        parser.require_if("card", "method", "card")
+        parser.require_if("method", "card")
+        parser.mutually_exclusive("email", "phone", required=True)
+        parse = _compile(parser)
+
+        payload = {"start": "1", "end": "2", "method": "card", "card": "4111", "email": "a@b.c"}
+        self.assertEqual(parse(payload), parser.parse_dict(payload).to_dict())
+
+        invalid = [
+            {"start": 2, "end": 1, "email": "a@b.c"},
+            {"method": "card", "email": "a@b.c"},
+            {"card": "4111", "email": "a@b.c"},
+            {"email": "a@b.c", "phone": "123"},
+            {},
+        ]
+        for payload in invalid:
+            with self.assertRaises(ParserException) as expected:
+                parser.parse_dict(payload)
+            with self.assertRaises(type(expected.exception)):
+                parse(payload)
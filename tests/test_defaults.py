@@ -0,0 +1,182 @@
+from dictparse import DictionaryParser, FrozenNameSpace
+from dictparse.exceptions import ParserConstraintError, ParserRequiredKeyError
+
+import pickle
+import unittest
+
+
+class TestDefaults(unittest.TestCase):
+
+    def test_mutable_default_not_shared(self):
+
+        parser = DictionaryParser()
+        parser.add_param("tags", list, default=[])
+        parser.add_param("meta", dict, default={"a": [1]})
+
+        first = parser.parse_dict({})
+        first.tags.append("x")
+        first.meta["a"].append(2)
+        second = parser.parse_dict({})
+
+        self.assertEqual(second.tags, [])
+        self.assertEqual(second.meta, {"a": [1]})
+        self.assertEqual(parser._params["tags"].default, [])
+
+    def test_immutable_default_shared(self):
+
+        default = ("a", "b")
+        parser = DictionaryParser()
+        parser.add_param("tags", tuple, default=default)
+
+        self.assertIs(parser.parse_dict({}).tags, default)
+        self.assertIs(parser._params["tags"]._default, default)
+
+    def test_default_factory_called_on_access(self):
+
+        calls = []
+
+        def factory():
+            calls.append(1)
+            return []
+
+        parser = DictionaryParser()
+        parser.add_param("tags", list, default_factory=factory)
+        parser.add_param("name", str)
+
+        params = parser.parse_dict({"name": "foo"})
+        self.assertEqual(calls, [])
+
+        self.assertEqual(params.tags, [])
+        params.tags.append("x")
+        self.assertEqual(params.get("tags"), ["x"])
+        self.assertEqual(calls, [1])
+
+        self.assertEqual(parser.parse_dict({"name": "foo"}).to_dict(), {"tags": [], "name": "foo"})
+        self.assertEqual(parser.parse_dict({"tags": ["a"]}).tags, ["a"])
+        self.assertEqual(len(calls), 2)
+
+    def test_default_factory_accessors(self):
+
+        parser = DictionaryParser()
+        parser.add_param("tags", list, default_factory=list, dest="labels")
+
+        params = parser.parse_dict({})
+        self.assertEqual(params.to_tuple(), ([],))
+        self.assertEqual(params.get_param("labels").value, [])
+        self.assertEqual(parser.parse_dict({}).to_json(), b'{"labels":[]}')
+        self.assertEqual(parser.parse_dict({}).get_param("labels").value, [])
+        with self.assertRaises(AttributeError):
+            params.other
+
+    def test_frozen(self):
+
+        parser = DictionaryParser()
+        parser.add_param("tags", list, default_factory=lambda: ["a"])
+
+        params = parser.parse_dict({}, frozen=True)
+        self.assertIsInstance(params, FrozenNameSpace)
+        self.assertEqual(params.tags, ["a"])
+
+        cached = DictionaryParser(cache_size=10)
+        cached.add_param("tags", list, default_factory=lambda: ["a"])
+        self.assertEqual(cached.parse_dict({}).tags, ["a"])
+
+    def test_cached_parser(self):
+
+        calls = []
+        parser = DictionaryParser(cache_size=10)
+        parser.add_param("tags", list, default=[])
+        parser.add_param("meta", default={"a": 1})
+        parser.add_param("token", default_factory=lambda: calls.append(1) or len(calls))
+        parser.add_param("name", str)
+
+        first = parser.parse_dict({})
+        first.tags.append("x")
+        first.meta["b"] = 2
+        second = parser.parse_dict({})
+
+        self.assertEqual((second.tags, second.meta), ([], {"a": 1}))
+        self.assertEqual((first.token, second.token), (1, 2))
+        self.assertEqual(parser.cache_info().currsize, 0)
+
+        parser = DictionaryParser(cache_size=10)
+        parser.add_param("meta", default={"a": 1})
+        parser.add_param("token", default_factory=lambda: calls.append(1) or len(calls))
+        parser.add_param("name", str)
+
+        payload = {"meta": "m", "token": "t", "name": "foo"}
+        self.assertIs(parser.parse_dict(payload), parser.parse_dict(payload))
+        parser.parse_dict({"name": "foo"}).meta["b"] = 2
+        self.assertEqual(parser.parse_dict({"name": "foo"}).meta, {"a": 1})
+
+    def test_pickle(self):
+
+        parser = DictionaryParser()
+        parser.add_param("tags", list, default_factory=lambda: ["a"])
+
+        restored = pickle.loads(pickle.dumps(parser.parse_dict({})))
+        self.assertEqual(restored.tags, ["a"])
+
+    def test_constraints(self):
+
+        parser = DictionaryParser()
+        parser.add_param("low", list, default_factory=lambda: [1])
+        parser.add_param("high", list)
+        parser.add_constraint("high", ">", "low")
+
+        self.assertEqual(parser.parse_dict({"high": [2]}).low, [1])
+
+    def test_constraints_call_factory_once(self):
+
+        for order in ("declared", "cost"):
+            for frozen in (False, True):
+                calls = []
+                parser = DictionaryParser(order=order, cache_size=10)
+                parser.add_param("start", int, default_factory=lambda: calls.append(1) or len(calls))
+                parser.add_param("end", int)
+                parser.add_param("kind", str)
+                parser.add_constraint("end", ">", "start")
+                parser.require_if("kind", "start", 3)
+
+                ns = parser.parse_dict({"end": 2}, frozen=frozen)
+                self.assertEqual((ns.start, ns.start, len(calls)), (1, 1, 1))
+                with self.assertRaises(ParserConstraintError):
+                    parser.parse_dict({"end": 2}, frozen=frozen)
+                with self.assertRaises(ParserRequiredKeyError):
+                    parser.parse_dict({"end": 5}, frozen=frozen)
+                self.assertEqual(parser.cache_info().currsize, 0)
+
+    def test_ordered_parser(self):
+
+        parser = DictionaryParser(order="cost")
+        parser.add_param("tags", list, default=[])
+
+        first = parser.parse_dict({})
+        first.tags.append("x")
+        self.assertEqual(parser.parse_dict({}).tags, [])
+
+    def test_invalid(self):
+
+        parser = DictionaryParser()
+
+        with self.assertRaises(TypeError):
+            parser.add_param("tags", list, default_factory=[])
+        with self.assertRaises(ValueError):
+            parser.add_param("tags", list, default=[], default_factory=list)
+
+    def test_codegen(self):
+
+        parser = DictionaryParser()
+        parser.add_param("tags", list, default=[])
+        parser.add_param("meta", dict, default={"a": [1]})
+        namespace: dict = {}
+        exec(compile(parser.to_source(), "<dictparse>", "exec"), namespace)
+
+        first = namespace["parse"]({})
+        first["tags"].append("x")
+        first["meta"]["a"].append(2)
+        self.assertEqual(namespace["parse"]({}), {"tags": [], "meta": {"a": [1]}})
+
+        parser.add_param("other", list, default_factory=list)
+        with self.assertRaises(ValueError):
+            parser.to_source()
@@ -0,0 +1,172 @@
+from dictparse import DictionaryParser
+from dictparse.exceptions import (
+    ParserTypeError,
+    ParserInvalidChoiceError,
+    ParserLengthError,
+    ParserPatternError
+)
+
+from array import array
+from typing import List, Set
+import sys
+import unittest
+
+
+class TestElements(unittest.TestCase):
+
+    def test_element_type(self):
+
+        parser = DictionaryParser()
+        parser.add_param("ids", list, element_type=int)
+        parser.add_param("flags", set, element_type=bool)
+        parser.add_param("scores", tuple, element_type=float)
+
+        params = parser.parse_dict({"ids": ["1", 2, "3"], "flags": ["yes", "no", True], "scores": [1, "2.5"]})
+
+        self.assertEqual(params.ids, [1, 2, 3])
+        self.assertEqual(params.flags, {True, False})
+        self.assertEqual(params.scores, (1.0, 2.5))
+
+    def test_homogeneous_values(self):
+
+        parser = DictionaryParser()
+        parser.add_param("ids", list, element_type=int)
+        parser.add_param("names", list, element_type=str)
+
+        params = parser.parse_dict({"ids": list(range(1000)), "names": ["a", "b"]})
+
+        self.assertEqual(params.ids, list(range(1000)))
+        self.assertEqual(params.names, ["a", "b"])
+
+    def test_generic_types(self):
+
+        parser = DictionaryParser()
+        parser.add_param("ids", List[int])
+        parser.add_param("tags", Set[str], element_type=str)
+        if sys.version_info >= (3, 9):
+            parser.add_param("scores", tuple[float, ...])
+
+        params = parser.parse_dict({"ids": ["1"], "tags": ["a", "a"], "scores": ["1.5"]})
+
+        self.assertEqual(params.ids, [1])
+        self.assertEqual(params.tags, {"a"})
+        self.assertIs(parser._params["ids"].type_, list)
+        self.assertIs(parser._params["ids"].element_type, int)
+
+    def test_invalid_element_type(self):
+
+        parser = DictionaryParser()
+        parser.add_param("ids", list, element_type=int)
+
+        with self.assertRaises(ParserTypeError) as cm:
+            parser.parse_dict({"ids": [1, "two", 3]})
+        self.assertEqual(cm.exception.value, "two")
+        self.assertIs(cm.exception.expected, int)
+
+        with self.assertRaises(ParserTypeError):
+            parser.parse_dict({"ids": [1, None]})
+
+    def test_element_choices(self):
+
+        parser = DictionaryParser()
+        parser.add_param("langs", list, element_type=str, element_choices=["python", "bash"])
+        parser.add_param("points", list, element_choices=[[0, 0], [1, 1]])
+
+        self.assertEqual(parser.parse_dict({"langs": ["bash", "python"]}).langs, ["bash", "python"])
+        self.assertEqual(parser.parse_dict({"points": [[1, 1]]}).points, [[1, 1]])
+
+        with self.assertRaises(ParserInvalidChoiceError) as cm:
+            parser.parse_dict({"langs": ["python", "javascript"]})
+        self.assertEqual(cm.exception.value, "javascript")
+
+        with self.assertRaises(ParserInvalidChoiceError):
+            parser.parse_dict({"langs": [["python"]]})
+
+        with self.assertRaises(ParserInvalidChoiceError):
+            parser.parse_dict({"points": [[0, 0], [0, 1]]})
+
+    def test_element_regex(self):
+
+        parser = DictionaryParser()
+        parser.add_param("codes", set, element_regex=r"^\d{3}$")
+
+        self.assertEqual(parser.parse_dict({"codes": ["123", 456]}).codes, {"123", 456})
+
+        with self.assertRaises(ParserPatternError) as cm:
+            parser.parse_dict({"codes": ["123", "12a"]})
+        self.assertEqual(cm.exception.value, "12a")
+
+    def test_length(self):
+
+        parser = DictionaryParser()
+        parser.add_param("tags", list, min_length=1, max_length=3)
+        parser.add_param("name", str, max_length=5)
+        parser.add_param("ids", set, element_type=int, min_length=2)
+
+        params = parser.parse_dict({"tags": ["a"], "name": "foo", "ids": [1, 2]})
+        self.assertEqual(params.tags, ["a"])
+
+        for payload in ({"tags": []}, {"tags": [1, 2, 3, 4]}, {"name": "foobar"}, {"ids": [1, 1]}, {"ids": ["1", 1]}):
+            with self.assertRaises(ParserLengthError):
+                parser.parse_dict(payload)
+
+        with self.assertRaises(ParserLengthError) as cm:
+            parser.parse_dict({"tags": [1, 2, 3, 4]})
+        self.assertEqual(cm.exception.length, 4)
+
+    def test_array(self):
+
+        parser = DictionaryParser()
+        parser.add_param("ids", list[int] if sys.version_info >= (3, 9) else List[int], array=True)
+        parser.add_param("scores", list, element_type=float, array=True)
+
+        params = parser.parse_dict({"ids": [1, "2", 3], "scores": [0.5, 1]})
+
+        self.assertEqual(params.ids, array("q", [1, 2, 3]))
+        self.assertEqual(params.scores, array("d", [0.5, 1.0]))
+        self.assertEqual(params.to_json(), b'{"ids":[1,2,3],"scores":[0.5,1.0]}')
+
+        with self.assertRaises(ParserTypeError):
+            parser.parse_dict({"ids": [2 ** 64]})
+
+    def test_ordered_parser(self):
+
+        calls = []
+        parser = DictionaryParser(order="cost")
+        parser.add_param("tags", list, action=calls.append)
+        parser.add_param("ids", list, element_type=int, max_length=2)
+
+        with self.assertRaises(ParserLengthError):
+            parser.parse_dict({"tags": ["a"], "ids": [1, 2, 3]})
+        self.assertEqual(calls, [])
+
+    def test_invalid_add_param(self):
+
+        parser = DictionaryParser()
+
+        with self.assertRaises(TypeError):
+            parser.add_param("ids", int, element_type=int)
+        with self.assertRaises(TypeError):
+            parser.add_param("ids", list, element_type=dict)
+        with self.assertRaises(TypeError):
+            parser.add_param("ids", List[int], element_type=str)
+        with self.assertRaises(TypeError):
+            parser.add_param("ids", list, element_choices="abc")
+        with self.assertRaises(TypeError):
+            parser.add_param("ids", set, element_type=int, array=True)
+        with self.assertRaises(TypeError):
+            parser.add_param("ids", list, element_type=str, array=True)
+        with self.assertRaises(TypeError):
+            parser.add_param("ids", int, min_length=1)
+        with self.assertRaises(ValueError):
+            parser.add_param("ids", list, min_length=-1)
+        with self.assertRaises(ValueError):
+            parser.add_param("ids", list, min_length=3, max_length=2)
+
+    def test_codegen_not_supported(self):
+
+        parser = DictionaryParser()
+        parser.add_param("ids", list, element_type=int)
+
+        with self.assertRaises(ValueError):
+            parser.to_source()
@@ -0,0 +1,92 @@
+from dictparse import DictionaryParser
+from dictparse.exceptions import (
+    ParserException,
+    ParserTypeError,
+    ParserRequiredKeyError,
+    ParserInvalidChoiceError,
+    ParserInvalidKeyError,
+    ParserDuplicateKeyError,
+    ParserInvalidDataTypeError,
+    ParserConstraintError,
+    ParserLengthError,
+    ParserPatternError,
+    ParserRangeError,
+    MAX_CHOICES_IN_MESSAGE
+)
+
+import pickle
+import unittest
+
+
+class TestExceptions(unittest.TestCase):
+
+    def test_messages(self):
+
+        self.assertEqual(
+            str(ParserTypeError("age", "thirty", int)),
+            "Invalid value 'thirty' for parameter 'age', expected 'int' not 'str'"
+        )
+        self.assertEqual(str(ParserDuplicateKeyError("age")), "Duplicate key 'age'")
+        self.assertEqual(str(ParserRequiredKeyError("age")), "Missing required parameter 'age'")
+        self.assertEqual(str(ParserInvalidKeyError("age")), "Invalid parameter 'age'")
+        self.assertEqual(
+            str(ParserInvalidChoiceError("language", "javascript", ["python", "bash"])),
+            "Parameter 'language' must be one of '['python', 'bash']', not 'javascript'"
+        )
+        self.assertEqual(
+            str(ParserInvalidDataTypeError("foo")),
+            "Invalid type for 'data', must be a dict or dict-like object, not 'str'"
+        )
+        self.assertEqual(str(ParserException("foo")), "foo")
+        self.assertEqual(
+            str(ParserLengthError("tags", 5, 1, 3)), "Parameter 'tags' must have a length between 1 and 3, not 5"
+        )
+        self.assertEqual(str(ParserLengthError("tags", 0, 1)), "Parameter 'tags' must have a length of at least 1, not 0")
+        self.assertEqual(
+            str(ParserLengthError("tags", 5, max_length=3)), "Parameter 'tags' must have a length of at most 3, not 5"
+        )
+        self.assertEqual(str(ParserRangeError("age", 200, 0, 150)), "Parameter 'age' must be between 0 and 150, not 200")
+        self.assertEqual(str(ParserRangeError("age", -1, 0)), "Parameter 'age' must be at least 0, not -1")
+        self.assertEqual(str(ParserRangeError("age", 2.5, maximum=1)), "Parameter 'age' must be at most 1, not 2.5")
+        self.assertEqual(
+            str(ParserPatternError("codes", "12a", r"^\d+$")),
+            "Elements of parameter 'codes' must match '^\\d+$', not '12a'"
+        )
+
+    def test_choices_truncated_in_message(self):
+
+        e = ParserInvalidChoiceError("num", -1, list(range(1000)))
+
+        self.assertIn(f"... {1000 - MAX_CHOICES_IN_MESSAGE} more", str(e))
+        self.assertEqual(len(e.choices), 1000)
+
+    def test_attributes(self):
+
+        parser = DictionaryParser()
+        parser.add_param("age", int)
+
+        with self.assertRaises(ParserTypeError) as cm:
+            parser.parse_dict({"age": "thirty"})
+
+        self.assertEqual(cm.exception.param, "age")
+        self.assertEqual(cm.exception.value, "thirty")
+        self.assertIs(cm.exception.expected, int)
+
+    def test_pickle(self):
+
+        errors = [
+            ParserTypeError("age", "thirty", int),
+            ParserDuplicateKeyError("age"),
+            ParserRequiredKeyError("age"),
+            ParserInvalidChoiceError("num", 4, [1, 2, 3]),
+            ParserInvalidKeyError("age"),
+            ParserInvalidDataTypeError([1, 2]),
+            ParserConstraintError(("end", "start"), "expected end > start"),
+            ParserLengthError("tags", 5, 1, 3),
+            ParserPatternError("codes", "12a", r"^\d+$"),
+            ParserRangeError("age", 200, 0, 150),
+        ]
+        for e in errors:
+            restored = pickle.loads(pickle.dumps(e))
+            self.assertIs(type(restored), type(e))
+            self.assertEqual(str(restored), str(e))
@@ -0,0 +1,51 @@
+from dictparse import DictionaryParser
+
+import subprocess
+import sys
+import unittest
+
+
+# Cumulative import time budget for the dictparse package, in microseconds. Generous enough not to be flaky on slow
+# CI runners, but an order of magnitude below the cost of importing distutils or typing
+IMPORT_TIME_BUDGET_US: int = 50000
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True
+    )
+
+
+class TestImport(unittest.TestCase):
+
+    def test_import_does_not_load_heavy_modules(self):
+
+        result = _run("import sys, dictparse; print(' '.join(sorted(sys.modules)))")
+        modules = set(result.stdout.split())
+
+        for name in ("distutils", "re", "typing"):
+            self.assertNotIn(name, modules)
+
+    def test_import_time_budget(self):
+
+        result = _run("import dictparse")
+        cumulative = min(
+            int(line.split("|")[1])
+            for line in result.stderr.splitlines()
+            if line.split("|")[-1].strip() == "dictparse"
+        )
+
+        self.assertLess(cumulative, IMPORT_TIME_BUDGET_US)
+
+    def test_regex_param_compiles_pattern(self):
+
+        parser = DictionaryParser()
+        parser.add_param("name", str, regex=r"^foo")
+
+        self.assertIsNotNone(parser._params["name"]._pattern)
+        self.assertEqual(parser.parse_dict({"name": "foobar"}).name, "foobar")
+        self.assertIsNone(parser.parse_dict({"name": "barfoo"}).name)
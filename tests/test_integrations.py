@@ -0,0 +1,255 @@
+from dictparse import DictionaryParser
+from dictparse.integrations import wsgi, asgi, flask
+
+from io import BytesIO
+from wsgiref.util import setup_testing_defaults
+import asyncio
+import json
+import unittest
+
+try:
+    import flask as flask_module
+except ImportError:
+    flask_module = None
+
+
+def _call_wsgi(app, method: str = "GET", query: str = "", body: bytes = b"", content_type: str = ""):
+    environ: dict = {
+        "REQUEST_METHOD": method,
+        "QUERY_STRING": query,
+        "CONTENT_TYPE": content_type,
+        "CONTENT_LENGTH": str(len(body)),
+        "wsgi.input": BytesIO(body),
+    }
+    setup_testing_defaults(environ)
+    response: dict = {}
+
+    def start_response(status, headers):
+        response["status"] = status
+        response["headers"] = headers
+
+    response["body"] = b"".join(app(environ, start_response))
+    return response
+
+
+def _call_asgi(app, query: bytes = b"", body: bytes = b"", content_type: bytes = b""):
+    scope: dict = {
+        "type": "http",
+        "method": "POST",
+        "query_string": query,
+        "headers": [(b"content-type", content_type)] if content_type else [],
+    }
+    # Split the body in two messages, as servers may do
+    messages: list = [
+        {"type": "http.request", "body": body[:3], "more_body": True},
+        {"type": "http.request", "body": body[3:], "more_body": False},
+    ]
+    sent: list = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return sent
+
+
+class TestWSGI(unittest.TestCase):
+
+    def setUp(self):
+
+        parser = DictionaryParser()
+        parser.add_param("name", str, required=True)
+        parser.add_param("age", int)
+        parser.add_param("tags", list)
+
+        @wsgi(parser)
+        def app(environ, start_response, params):
+            start_response("200 OK", [("Content-Type", "application/json")])
+            return [params.to_json()]
+
+        self.app = app
+
+    def test_json_body(self):
+        """ Parses a JSON body and passes the NameSpace to the application """
+
+        response = _call_wsgi(
+            self.app, "POST", body=b'{"name": "foo", "age": "32"}', content_type="application/json; charset=utf-8"
+        )
+        self.assertEqual(response["status"], "200 OK")
+        self.assertEqual(json.loads(response["body"]), {"name": "foo", "age": 32, "tags": None})
+
+    def test_query_args(self):
+        """ Parses the query string, keeping every value of list parameters """
+
+        response = _call_wsgi(self.app, query="name=foo&tags=a&tags=b&name=bar")
+        self.assertEqual(json.loads(response["body"]), {"name": "foo", "age": None, "tags": ["a", "b"]})
+
+    def test_form(self):
+        """ Parses a urlencoded form body """
+
+        response = _call_wsgi(
+            self.app, "POST", body=b"name=f%C3%B6o&age=3", content_type="application/x-www-form-urlencoded"
+        )
+        self.assertEqual(json.loads(response["body"]), {"name": "föo", "age": 3, "tags": None})
+
+    def test_invalid_request(self):
+        """ Responds with a 400 and a JSON error for invalid data """
+
+        response = _call_wsgi(self.app, query="age=32")
+        self.assertEqual(response["status"], "400 Bad Request")
+        self.assertEqual(json.loads(response["body"]), {"error": "Missing required parameter 'name'"})
+
+        response = _call_wsgi(self.app, "POST", body=b'["name"]', content_type="application/json")
+        self.assertEqual(response["status"], "400 Bad Request")
+
+        response = _call_wsgi(self.app, "POST", body=b"{name", content_type="application/json")
+        self.assertEqual(json.loads(response["body"]), {"error": "Invalid JSON body"})
+
+    def test_wrong_shaped_values(self):
+        """ Responds with a 400 when a value has the wrong shape """
+
+        for body in (b'{"name": "foo", "age": [1]}', b'{"name": "foo", "tags": 5}', b'{"name": "foo", "age": {}}'):
+            response = _call_wsgi(self.app, "POST", body=body, content_type="application/json")
+            self.assertEqual(response["status"], "400 Bad Request", body)
+            self.assertIn("Invalid value", json.loads(response["body"])["error"])
+
+    def test_multi_value_aliases(self):
+        """ Collects the values of aliases and other key styles of list parameters """
+
+        parser = DictionaryParser(ignore_key_style=True)
+        parser.add_param("tag_ids", list, aliases=["tags"])
+
+        @wsgi(parser)
+        def app(environ, start_response, params):
+            start_response("200 OK", [])
+            return [params.to_json()]
+
+        for query in ("tagIds=12&tagIds=3", "tags=12&tags=3", "TAG-IDS=12&tag_ids=3"):
+            response = _call_wsgi(app, query=query)
+            self.assertEqual(json.loads(response["body"]), {"tag_ids": ["12", "3"]}, query)
+
+    def test_source_and_arg(self):
+        """ Reads the source and passes the NameSpace as the given argument """
+
+        parser = DictionaryParser()
+        parser.add_param("name", str)
+        parser.add_param("age", int)
+        parser.add_param("tags", list)
+
+        @wsgi(parser, source="args", arg="query", frozen=True)
+        def app(environ, start_response, query):
+            start_response("200 OK", [])
+            return [repr(query).encode()]
+
+        response = _call_wsgi(app, "POST", query="name=foo", body=b'{"name": "bar"}', content_type="application/json")
+        self.assertEqual(response["body"], b"FrozenNameSpace(name='foo', age=None, tags=None)")
+
+    def test_invalid_source(self):
+        """ Raises a ValueError when source is not a known source """
+
+        with self.assertRaises(ValueError):
+            wsgi(DictionaryParser(), source="body")
+
+
+class TestASGI(unittest.TestCase):
+
+    def setUp(self):
+
+        parser = DictionaryParser()
+        parser.add_param("name", str, required=True)
+        parser.add_param("age", int)
+        parser.add_param("tags", list)
+
+        @asgi(parser)
+        async def app(scope, receive, send, params):
+            await send({"type": "http.response.start", "status": 200, "headers": []})
+            await send({"type": "http.response.body", "body": params.to_json()})
+
+        self.app = app
+
+    def test_json_body(self):
+        """ Parses a JSON body split over several messages """
+
+        sent = _call_asgi(self.app, body=b'{"name": "foo", "tags": ["a"]}', content_type=b"application/json")
+        self.assertEqual(sent[0]["status"], 200)
+        self.assertEqual(json.loads(sent[1]["body"]), {"name": "foo", "age": None, "tags": ["a"]})
+
+    def test_query_args(self):
+        """ Parses the query string """
+
+        sent = _call_asgi(self.app, query=b"name=foo&age=5")
+        self.assertEqual(json.loads(sent[1]["body"]), {"name": "foo", "age": 5, "tags": None})
+
+    def test_invalid_request(self):
+        """ Responds with a 400 and a JSON error for invalid data """
+
+        sent = _call_asgi(self.app, body=b'{"name": "foo", "age": "x"}', content_type=b"application/json")
+        self.assertEqual(sent[0]["status"], 400)
+        self.assertIn((b"content-type", b"application/json"), sent[0]["headers"])
+        self.assertEqual(
+            json.loads(sent[1]["body"]),
+            {"error": "Invalid value 'x' for parameter 'age', expected 'int' not 'str'"}
+        )
+
+    def test_wrong_shaped_values(self):
+        """ Responds with a 400 when a value has the wrong shape """
+
+        sent = _call_asgi(self.app, body=b'{"name": "foo", "tags": 5}', content_type=b"application/json")
+        self.assertEqual(sent[0]["status"], 400)
+
+    def test_other_scopes_passed_through(self):
+        """ Scopes other than http are passed to the application without parsing """
+
+        scopes = []
+
+        @asgi(DictionaryParser())
+        async def app(scope, receive, send, params=None):
+            scopes.append((scope["type"], params))
+
+        asyncio.run(app({"type": "lifespan"}, None, None))
+        self.assertEqual(scopes, [("lifespan", None)])
+
+
+@unittest.skipIf(flask_module is None, "Flask is not installed")
+class TestFlask(unittest.TestCase):
+
+    def setUp(self):
+
+        parser = DictionaryParser()
+        parser.add_param("name", str, required=True)
+        parser.add_param("age", int)
+        parser.add_param("tags", list)
+        app = flask_module.Flask(__name__)
+
+        @app.route("/users/<int:group>", methods=["GET", "POST"])
+        @flask(parser)
+        def create(group, params):
+            return {"group": group, **params.to_dict()}
+
+        self.client = app.test_client()
+
+    def test_json_body(self):
+        """ Parses a JSON body and passes the NameSpace to the view """
+
+        response = self.client.post("/users/1", json={"name": "foo", "age": "32"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {"group": 1, "name": "foo", "age": 32, "tags": None})
+
+    def test_query_args(self):
+        """ Parses the query string, keeping every value of list parameters """
+
+        response = self.client.get("/users/1?name=foo&tags=a&tags=b")
+        self.assertEqual(response.get_json()["tags"], ["a", "b"])
+
+    def test_invalid_request(self):
+        """ Responds with a 400 and a JSON error for invalid data """
+
+        response = self.client.post("/users/1", json={"age": 1})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json(), {"error": "Missing required parameter 'name'"})
+
+        response = self.client.post("/users/1", json={"name": "foo", "age": [1]})
+        self.assertEqual(response.status_code, 400)
@@ -1,5 +1,6 @@
-from dictparse import DictionaryParser
+from dictparse import DictionaryParser, FrozenNameSpace
 
+import pickle
 import unittest
 
 
@@ -75,4 +76,145 @@ class TestNamespace(unittest.TestCase):
         self.assertEqual(
             params.to_dict(exclude={"csrf_token"}),
             {"name": "foo", "age": 32}
-        )
\ No newline at end of file
+        )
+
+    def test_namespace_get_param_value_not_shared_between_parses(self):
+
+        parser = DictionaryParser()
+        parser.add_param("name", str)
+        first = parser.parse_dict({"name": "foo"})
+        second = parser.parse_dict({"name": "bar"})
+
+        self.assertEqual(first.get_param("name").value, "foo")
+        self.assertEqual(second.get_param("name").value, "bar")
+
+    def test_frozen_namespace(self):
+
+        parser = DictionaryParser()
+        parser.add_param("name", str)
+        parser.add_param("age", int, dest="years")
+        params = parser.parse_dict({"name": "foo", "age": "32"}, frozen=True)
+
+        self.assertIsInstance(params, FrozenNameSpace)
+        self.assertEqual(params.name, "foo")
+        self.assertEqual(params.years, 32)
+        self.assertEqual(params.get("bar", 22), 22)
+        self.assertEqual(params.to_dict(exclude=["name"]), {"years": 32})
+        with self.assertRaises(AttributeError):
+            params.foo
+
+    def test_frozen_namespace_is_immutable(self):
+
+        params = FrozenNameSpace(["name"], ["foo"])
+
+        with self.assertRaises(AttributeError):
+            params.name = "bar"
+        with self.assertRaises(AttributeError):
+            del params.name
+
+    def test_frozen_namespace_hash_and_eq(self):
+
+        parser = DictionaryParser()
+        parser.add_param("name", str)
+        first = parser.parse_dict({"name": "foo"}, frozen=True)
+        second = parser.parse_dict({"name": "foo"}, frozen=True)
+
+        self.assertIsNot(first, second)
+        self.assertEqual(first, second)
+        self.assertEqual(len({first, second}), 1)
+        self.assertNotEqual(first, parser.parse_dict({"name": "bar"}, frozen=True))
+
+    def test_frozen_namespace_pickle(self):
+
+        parser = DictionaryParser()
+        parser.add_param("name", str)
+        params = parser.parse_dict({"name": "foo"}, frozen=True)
+
+        self.assertEqual(pickle.loads(pickle.dumps(params)), params)
+
+    def test_frozen_namespace_replace(self):
+
+        params = FrozenNameSpace(["name", "age"], ["foo", 32])
+        replaced = params._replace(age=33)
+
+        self.assertEqual(params.age, 32)
+        self.assertEqual(replaced.age, 33)
+        self.assertEqual(replaced.name, "foo")
+        with self.assertRaises(ValueError):
+            params._replace(foo=1)
+
+    def test_frozen_namespace_from_namespace(self):
+
+        parser = DictionaryParser()
+        parser.add_param("name", str)
+        params = parser.parse_dict({"name": "foo"})
+
+        self.assertEqual(FrozenNameSpace.from_namespace(params), FrozenNameSpace(["name"], ["foo"]))
+
+    def test_frozen_namespace_invalid_length(self):
+
+        with self.assertRaises(ValueError):
+            FrozenNameSpace(["name", "age"], ["foo"])
+
+    def test_namespace_to_json(self):
+
+        parser = DictionaryParser()
+        parser.add_param("name", str)
+        parser.add_param("tags", set)
+        parser.add_param("age", int)
+        params = parser.parse_dict({"name": "foo", "tags": ["a"]})
+
+        self.assertEqual(params.to_json(), b'{"name":"foo","tags":["a"],"age":null}')
+        self.assertEqual(parser.parse_dict({"name": "foo"}, frozen=True).to_json(), b'{"name":"foo","tags":null,"age":null}')
+
+    def test_namespace_from_json(self):
+
+        parser = DictionaryParser()
+        parser.add_param("name", str)
+        parser.add_param("age", int, dest="years")
+        params = parser.parse_dict({"name": "foo", "age": 32})
+        restored = parser.from_json(params.to_json())
+
+        self.assertIsInstance(restored, FrozenNameSpace)
+        self.assertEqual(restored.to_dict(), params.to_dict())
+
+    def test_namespace_from_json_containers(self):
+
+        parser = DictionaryParser()
+        parser.add_param("point", tuple)
+        parser.add_param("flags", set)
+        parser.add_param("ids", list, element_type=int, array=True)
+        parser.add_param("tags", list)
+        params = parser.parse_dict({"point": [1, 2], "flags": ["a"], "ids": [1, 2], "tags": ["b"]}, frozen=True)
+        restored = parser.from_json(params.to_json())
+
+        self.assertEqual(restored, params)
+        self.assertEqual(restored.to_tuple(), ((1, 2), {"a"}, params.ids, ["b"]))
+        self.assertEqual(restored.ids.typecode, "q")
+
+        parser = DictionaryParser()
+        parser.add_param("point", tuple)
+        params = parser.parse_dict({"point": [1, 2]}, frozen=True)
+        self.assertEqual(hash(parser.from_json(params.to_json())), hash(params))
+
+    def test_namespace_to_tuple_round_trip(self):
+
+        parser = DictionaryParser()
+        parser.add_param("name", str)
+        parser.add_param("nums", tuple)
+        params = parser.parse_dict({"name": "foo", "nums": [1, 2]})
+
+        self.assertEqual(params.to_tuple(), ("foo", (1, 2)))
+        self.assertEqual(parser.from_tuple(params.to_tuple()).to_dict(), params.to_dict())
+        with self.assertRaises(ValueError):
+            parser.from_tuple(("foo",))
+
+    def test_namespace_pickle_excludes_params(self):
+
+        parser = DictionaryParser()
+        parser.add_param("name", str)
+        params = pickle.loads(pickle.dumps(parser.parse_dict({"name": "foo"})))
+
+        self.assertEqual(params.name, "foo")
+        self.assertEqual(params.to_dict(), {"name": "foo"})
+        self.assertIsNone(params.get_param("name"))
@@ -0,0 +1,145 @@
+from dictparse import DictionaryParser
+from dictparse.exceptions import ParserTypeError, ParserRangeError
+
+import unittest
+
+
+class TestNumeric(unittest.TestCase):
+
+    def test_range(self):
+
+        parser = DictionaryParser()
+        parser.add_param("age", int, minimum=0, maximum=150)
+        parser.add_param("ratio", float, minimum=0.0)
+        parser.add_param("score", float, maximum=1)
+
+        params = parser.parse_dict({"age": "32", "ratio": "0", "score": 1})
+        self.assertEqual(params.to_tuple(), (32, 0.0, 1.0))
+
+        for payload in ({"age": -1}, {"age": "151"}, {"ratio": -0.5}, {"score": "1.01"}, {"ratio": "nan"}):
+            with self.assertRaises(ParserRangeError):
+                parser.parse_dict(payload)
+
+        with self.assertRaises(ParserRangeError) as cm:
+            parser.parse_dict({"age": 200})
+        self.assertEqual((cm.exception.value, cm.exception.minimum, cm.exception.maximum), (200, 0, 150))
+
+        with self.assertRaises(ParserTypeError):
+            parser.parse_dict({"age": "thirty"})
+
+    def test_default_not_range_checked(self):
+
+        parser = DictionaryParser()
+        parser.add_param("age", int, minimum=18, default=0)
+
+        self.assertEqual(parser.parse_dict({}).age, 0)
+
+    def test_strict_int(self):
+
+        parser = DictionaryParser()
+        parser.add_param("count", int, strict_numeric=True)
+
+        for value, expected in (("42", 42), ("-7", -7), ("+3", 3), (5, 5), (3.0, 3)):
+            self.assertEqual(parser.parse_dict({"count": value}).count, expected)
+
+        for value in (" 1", "1 ", "1_000", "1.0", "٣", "0x10", 3.5, float("inf"), float("nan"), True, [1]):
+            with self.assertRaises(ParserTypeError, msg=repr(value)[:20]):
+                parser.parse_dict({"count": value})
+
+    def test_strict_float(self):
+
+        parser = DictionaryParser()
+        parser.add_param("price", float, strict_numeric=True, minimum=0)
+
+        for value, expected in (("1.5", 1.5), ("2", 2.0), (".5", 0.5), ("1e3", 1000.0), (3, 3.0), (2.25, 2.25)):
+            self.assertEqual(parser.parse_dict({"price": value}).price, expected)
+
+        for value in ("nan", "inf", "-Infinity", " 1.5", "1_0.5", "1.5.", float("inf"), float("nan"), 10 ** 400, False):
+            with self.assertRaises(ParserTypeError, msg=repr(value)[:20]):
+                parser.parse_dict({"price": value})
+
+        with self.assertRaises(ParserRangeError):
+            parser.parse_dict({"price": "-1"})
+
+    def test_non_strict_unchanged(self):
+
+        parser = DictionaryParser()
+        parser.add_param("count", int, maximum=10000)
+        parser.add_param("ratio", float, maximum=10)
+
+        params = parser.parse_dict({"count": " 1_000 ", "ratio": 2.5})
+        self.assertEqual(params.to_tuple(), (1000, 2.5))
+
+    def test_ordered_parser(self):
+
+        parser = DictionaryParser(order="adaptive")
+        parser.add_param("age", int, minimum=0)
+
+        with self.assertRaises(ParserRangeError):
+            parser.parse_dict({"age": -1})
+        self.assertEqual(parser.rejection_stats(), {"age": 1})
+
+    def test_invalid_add_param(self):
+
+        parser = DictionaryParser()
+
+        with self.assertRaises(TypeError):
+            parser.add_param("name", str, minimum=1)
+        with self.assertRaises(TypeError):
+            parser.add_param("name", str, strict_numeric=True)
+        with self.assertRaises(ValueError):
+            parser.add_param("age", int, minimum="1")
+        with self.assertRaises(ValueError):
+            parser.add_param("age", int, maximum=float("nan"))
+        with self.assertRaises(ValueError):
+            parser.add_param("age", int, minimum=2, maximum=1)
+
+    def test_schema_round_trip(self):
+
+        parser = DictionaryParser()
+        parser.add_param("age", int, minimum=0, maximum=150, strict_numeric=True)
+        schema = parser.to_json_schema()
+
+        self.assertEqual(
+            schema["properties"]["age"], {"type": "integer", "minimum": 0, "maximum": 150, "x-strict-numeric": True}
+        )
+        loaded = DictionaryParser.from_json_schema(schema)
+        with self.assertRaises(ParserTypeError):
+            loaded.parse_dict({"age": "1_0"})
+        with self.assertRaises(ParserRangeError):
+            loaded.parse_dict({"age": "151"})
+
+        schema["properties"]["age"]["minimum"] = 200
+        with self.assertRaises(ValueError):
+            DictionaryParser.from_json_schema(schema)
+
+    def test_codegen(self):
+
+        parser = DictionaryParser()
+        parser.add_param("age", int, minimum=0, maximum=150)
+        parser.add_param("count", int, strict_numeric=True)
+        parser.add_param("price", float, strict_numeric=True, minimum=0)
+        parser.add_param("ratio", float, maximum=1)
+        namespace: dict = {}
+        exec(compile(parser.to_source(), "<dictparse>", "exec"), namespace)
+        parse = namespace["parse"]
+
+        payloads = [
+            {"age": "32", "count": "+3", "price": "1e3", "ratio": "0.5"},
+            {"age": 150.0, "count": 3.0, "price": 2, "ratio": -1},
+            {},
+        ]
+        for payload in payloads:
+            self.assertEqual(parse(payload), parser.parse_dict(payload).to_dict())
+
+        rejected = [
+            {"age": -1}, {"age": "151"}, {"age": "thirty"}, {"age": [1]}, {"ratio": "nan"}, {"ratio": 1.5},
+            {"count": " 1"}, {"count": "1_000"}, {"count": 3.5}, {"count": True}, {"count": float("inf")},
+            {"price": "nan"}, {"price": "-Infinity"}, {"price": 10 ** 400}, {"price": False}, {"price": "-1"},
+        ]
+        for payload in rejected:
+            with self.assertRaises(Exception) as expected:
+                parser.parse_dict(payload)
+            with self.assertRaises(type(expected.exception), msg=repr(payload)[:40]) as cm:
+                parse(payload)
+            self.assertEqual(str(cm.exception), str(expected.exception))
@@ -0,0 +1,148 @@
+from dictparse import DictionaryParser
+from dictparse.parser import REORDER_INTERVAL
+from dictparse.exceptions import (
+    ParserException,
+    ParserTypeError,
+    ParserInvalidChoiceError,
+    ParserConstraintError
+)
+
+import unittest
+
+
+class TestOrdering(unittest.TestCase):
+
+    def test_invalid_order(self):
+        """ Raises a ValueError when order is not a known order """
+
+        with self.assertRaises(ValueError):
+            DictionaryParser(order="random")
+
+    def test_same_result_as_declared(self):
+        """ Planned orders return the same values as the declared order """
+
+        payloads = [
+            {"tags": [" a ", "b "], "age": "32", "active": "yes", "code": "123", "stage": "beta", "start": 1, "end": 2},
+            {"tags": ("x",), "age": "", "code": "12a", "stage": "alpha"},
+            {"active": 0, "start": "3"},
+            {},
+        ]
+        results = {}
+        for order in ("declared", "cost", "adaptive"):
+            parser = DictionaryParser(order=order)
+            parser.add_param("tags", list, action=lambda v: [i.strip() for i in v])
+            parser.add_param("age", int, default=18)
+            parser.add_param("active", bool)
+            parser.add_param("code", str, regex=r"^\d{3}$")
+            parser.add_param("stage", str, choices=["alpha", "beta"])
+            parser.add_param("start", int)
+            parser.add_param("end", int)
+            parser.add_constraint("end", ">", "start")
+            parser.require_if("code", "stage", "beta")
+            results[order] = [parser.parse_dict(payload, action=str) for payload in payloads]
+
+        for order in ("cost", "adaptive"):
+            for planned, declared in zip(results[order], results["declared"]):
+                self.assertEqual(planned.to_dict(), declared.to_dict())
+                self.assertEqual(planned.to_tuple(), declared.to_tuple())
+
+    def test_same_exceptions_as_declared(self):
+        """ Planned orders raise the same exceptions as the declared order """
+
+        payloads = [
+            {"age": "thirty"},
+            {"active": "maybe"},
+            {"stage": "gamma"},
+            {"start": 2, "end": 1},
+            {"stage": "beta"},
+        ]
+        parsers = []
+        for order in ("declared", "cost"):
+            parser = DictionaryParser(order=order)
+            parser.add_param("age", int)
+            parser.add_param("active", bool)
+            parser.add_param("code", str)
+            parser.add_param("stage", str, choices=["alpha", "beta"])
+            parser.add_param("start", int)
+            parser.add_param("end", int)
+            parser.add_constraint("end", ">", "start")
+            parser.require_if("code", "stage", "beta")
+            parsers.append(parser)
+
+        declared, planned = parsers
+        for payload in payloads:
+            with self.assertRaises(ParserException) as expected:
+                declared.parse_dict(payload)
+            with self.assertRaises(type(expected.exception)):
+                planned.parse_dict(payload)
+
+    def test_actions_skipped_for_rejected_payloads(self):
+        """ Actions only run for data which passes every check when the order is planned """
+
+        for order, expected in (("declared", 1), ("cost", 0)):
+            calls = []
+            parser = DictionaryParser(order=order)
+            parser.add_param("tags", list, action=lambda v: calls.append(v) or v)
+            parser.add_param("stage", str, choices=["alpha", "beta"])
+
+            with self.assertRaises(ParserInvalidChoiceError):
+                parser.parse_dict({"tags": [" a "], "stage": "gamma"})
+            self.assertEqual(len(calls), expected, order)
+
+    def test_constraint_reads_value_after_action(self):
+        """ Constraints compare the values returned by actions """
+
+        parser = DictionaryParser(order="cost")
+        parser.add_param("low", int, action=lambda v: v * 10)
+        parser.add_param("high", int)
+        parser.add_constraint("high", ">", "low")
+
+        with self.assertRaises(ParserConstraintError):
+            parser.parse_dict({"low": 1, "high": 5})
+        self.assertEqual(parser.parse_dict({"low": 1, "high": 11}).to_tuple(), (10, 11))
+
+    def test_choices_checked_after_action(self):
+        """ Choices are checked against the values returned by actions """
+
+        parser = DictionaryParser(order="cost")
+        parser.add_param("lang", str, choices=["python"], action=str.lower)
+
+        self.assertEqual(parser.parse_dict({"lang": "PYTHON"}).lang, "python")
+        with self.assertRaises(ParserInvalidChoiceError):
+            parser.parse_dict({"lang": "Bash"})
+
+    def test_adaptive_checks_rejecting_params_first(self):
+        """ The parameters which reject the most data are checked first """
+
+        parser = DictionaryParser(order="adaptive")
+        parser.add_param("stage", str, choices=["alpha", "beta"])
+        parser.add_param("age", int)
+
+        for _ in range(REORDER_INTERVAL):
+            with self.assertRaises(ParserTypeError):
+                parser.parse_dict({"stage": "alpha", "age": "thirty"})
+
+        self.assertEqual(parser.rejection_stats(), {"age": REORDER_INTERVAL})
+        with self.assertRaises(ParserTypeError):
+            parser.parse_dict({"stage": "gamma", "age": "thirty"})
+        self.assertEqual(parser.rejection_stats(), {"age": REORDER_INTERVAL + 1})
+
+    def test_cost_order_does_not_record_rejections(self):
+        """ Rejections are only recorded when the order is adaptive """
+
+        parser = DictionaryParser(order="cost")
+        parser.add_param("age", int)
+
+        with self.assertRaises(ParserTypeError):
+            parser.parse_dict({"age": "thirty"})
+        self.assertEqual(parser.rejection_stats(), {})
+
+    def test_plan_reset_by_add_param(self):
+        """ Adding a parameter resets the parse plan """
+
+        parser = DictionaryParser(order="cost")
+        parser.add_param("age", int)
+        parser.parse_dict({"age": 1})
+        parser.add_param("name", str)
+
+        self.assertEqual(parser.parse_dict({"age": 1, "name": "foo"}).to_tuple(), (1, "foo"))
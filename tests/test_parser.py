@@ -5,7 +5,8 @@ from dictparse.exceptions import (
     ParserInvalidChoiceError,
     ParserInvalidKeyError,
     ParserDuplicateKeyError,
-    ParserInvalidDataTypeError
+    ParserInvalidDataTypeError,
+    ParserConstraintError
 )
 
 from functools import partial
@@ -62,6 +63,14 @@ class TestParser(unittest.TestCase):
         with self.assertRaises(ValueError):
             parser.add_param(name="to_dict")
 
+    def test_add_param_name_illegal_name_namespace_attribute(self):
+        """ Raises a ValueError when name clashes with a NameSpace attribute """
+
+        parser = DictionaryParser()
+
+        with self.assertRaises(ValueError):
+            parser.add_param(name="_fields")
+
     def test_add_param_name_illegal_string_int(self):
         """ Raises a ValueError when name starts with an int """
 
@@ -134,6 +143,21 @@ class TestParser(unittest.TestCase):
         with self.assertRaises(ParserTypeError):
             params: NameSpace = parser.parse_dict({"name": "foo"})
 
+    def test_parser_type_error_wrong_shape(self):
+
+        for order in ("declared", "cost"):
+            parser = DictionaryParser(order=order)
+            parser.add_param("age", int)
+            parser.add_param("ratio", float, maximum=1)
+            parser.add_param("tags", list)
+            parser.add_param("stage", choices={"alpha", "beta"})
+
+            for payload in ({"age": [1]}, {"age": float("inf")}, {"ratio": {}}, {"tags": 5}):
+                with self.assertRaises(ParserTypeError, msg=f"{order} {payload}"):
+                    parser.parse_dict(payload)
+            with self.assertRaises(ParserInvalidChoiceError):
+                parser.parse_dict({"stage": ["alpha"]})
+
     def test_parser_choices_not_valid_type(self):
 
         parser = DictionaryParser()
@@ -547,4 +571,149 @@ class TestParser(unittest.TestCase):
 
         params: NameSpace = parser.parse_dict({"method_": "DELETE"}, ignore_required=["url", "name"])
 
-        self.assertEqual(params.method_, "DELETE")
\ No newline at end of file
+        self.assertEqual(params.method_, "DELETE")
+
+    def test_aliases(self):
+
+        parser = DictionaryParser()
+        parser.add_param("user_id", int, required=True, aliases=["userId", "USER_ID"])
+
+        self.assertEqual(parser.parse_dict({"userId": "1"}).user_id, 1)
+        self.assertEqual(parser.parse_dict({"USER_ID": 2}).user_id, 2)
+        self.assertEqual(parser.parse_dict({"userId": 1, "user_id": 3}).user_id, 3)
+        self.assertEqual(parser.parse_dict({"userid": 4}, ignore_required=["user_id"]).user_id, None)
+
+        with self.assertRaises(ParserRequiredKeyError):
+            parser.parse_dict({"userid": 4})
+
+    def test_aliases_strict(self):
+
+        parser = DictionaryParser()
+        parser.add_param("user_id", int, aliases=["userId"])
+
+        self.assertEqual(parser.parse_dict({"userId": 1}, strict=True).user_id, 1)
+        with self.assertRaises(ParserInvalidKeyError):
+            parser.parse_dict({"userId": 1, "foo": "bar"}, strict=True)
+
+    def test_aliases_duplicate(self):
+
+        parser = DictionaryParser()
+        parser.add_param("user_id", int, aliases=["uid"])
+
+        with self.assertRaises(ParserDuplicateKeyError):
+            parser.add_param("uid", int)
+        with self.assertRaises(ParserDuplicateKeyError):
+            parser.add_param("account_id", int, aliases=["user_id"])
+
+    def test_aliases_invalid_type(self):
+
+        parser = DictionaryParser()
+
+        with self.assertRaises(TypeError):
+            parser.add_param("user_id", int, aliases="uid")
+        with self.assertRaises(TypeError):
+            parser.add_param("user_id", int, aliases=[1])
+
+    def test_ignore_key_style(self):
+
+        parser = DictionaryParser(ignore_key_style=True)
+        parser.add_param("user_id", int, required=True)
+        parser.add_param("name", str, aliases=["full_name"])
+
+        self.assertEqual(parser.parse_dict({"userId": "1"}).user_id, 1)
+        self.assertEqual(parser.parse_dict({"USER-ID": "2"}).user_id, 2)
+        self.assertEqual(parser.parse_dict({"user_id": 3, "FullName": "foo"}).name, "foo")
+
+        with self.assertRaises(ParserDuplicateKeyError):
+            parser.add_param("userid", int)
+
+    def test_add_constraint(self):
+
+        parser = DictionaryParser()
+        parser.add_param("start", int)
+        parser.add_param("end", int)
+        parser.add_constraint("end", ">", "start")
+
+        self.assertEqual(parser.parse_dict({"start": "1", "end": "2"}).end, 2)
+        self.assertEqual(parser.parse_dict({"start": "1"}).end, None)
+
+        with self.assertRaises(ParserConstraintError) as cm:
+            parser.parse_dict({"start": "2", "end": "2"})
+        self.assertEqual(cm.exception.params, ("end", "start"))
+        self.assertEqual(str(cm.exception), "Invalid parameters 'end', 'start', expected end > start")
+
+    def test_add_constraint_invalid(self):
+
+        parser = DictionaryParser()
+        parser.add_param("start", int)
+
+        with self.assertRaises(ValueError):
+            parser.add_constraint("start", "=>", "start")
+        with self.assertRaises(ValueError):
+            parser.add_constraint("start", "<", "end")
+
+    def test_add_constraint_checked_before_later_actions(self):
+
+        calls = []
+        parser = DictionaryParser()
+        parser.add_param("start", int)
+        parser.add_param("end", int)
+        parser.add_param("body", str, action=lambda x: calls.append(x) or x)
+        parser.add_constraint("end", ">", "start")
+
+        with self.assertRaises(ParserConstraintError):
+            parser.parse_dict({"start": 2, "end": 1, "body": "foo"})
+        self.assertEqual(calls, [])
+
+    def test_require_if_value(self):
+
+        parser = DictionaryParser()
+        parser.add_param("payment_method", str, choices=["card", "cash"])
+        parser.add_param("card_number", str)
+        parser.require_if("card_number", "payment_method", "card")
+
+        self.assertEqual(parser.parse_dict({"payment_method": "cash"}).card_number, None)
+        self.assertEqual(parser.parse_dict({"payment_method": "card", "card_number": "4111"}).card_number, "4111")
+
+        with self.assertRaises(ParserRequiredKeyError):
+            parser.parse_dict({"payment_method": "card", "card_number": ""})
+
+    def test_require_if_present(self):
+
+        parser = DictionaryParser()
+        parser.add_param("username", str)
+        parser.add_param("password", str)
+        parser.require_if("password", "username")
+
+        self.assertEqual(parser.parse_dict({}).password, None)
+        with self.assertRaises(ParserRequiredKeyError):
+            parser.parse_dict({"username": "foo"})
+
+    def test_mutually_exclusive(self):
+
+        parser = DictionaryParser()
+        parser.add_param("email", str)
+        parser.add_param("phone", str)
+        parser.add_param("body", str, action=lambda x: 1 / 0)
+        parser.mutually_exclusive("email", "phone")
+
+        self.assertEqual(parser.parse_dict({"email": "a@b.c"}).email, "a@b.c")
+        self.assertEqual(parser.parse_dict({}).email, None)
+
+        with self.assertRaises(ParserConstraintError) as cm:
+            parser.parse_dict({"email": "a@b.c", "phone": "123", "body": "foo"})
+        self.assertEqual(cm.exception.params, ("email", "phone"))
+
+    def test_mutually_exclusive_required(self):
+
+        parser = DictionaryParser()
+        parser.add_param("email", str)
+        parser.add_param("phone", str)
+        parser.mutually_exclusive("email", "phone", required=True)
+
+        self.assertEqual(parser.parse_dict({"phone": "123"}).phone, "123")
+        with self.assertRaises(ParserConstraintError):
+            parser.parse_dict({"email": ""})
+
+        with self.assertRaises(ValueError):
+            parser.mutually_exclusive("email")
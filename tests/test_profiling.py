@@ -0,0 +1,96 @@
+from dictparse import DictionaryParser
+from dictparse.exceptions import ParserInvalidChoiceError
+from dictparse.profiling import ProfileReport, STAGES
+
+import sys
+import tracemalloc
+import unittest
+
+
+class TestProfiling(unittest.TestCase):
+
+    def test_profile_report(self):
+        """ Allocations are reported per stage for a workload of valid and invalid data """
+
+        parser = DictionaryParser()
+        parser.add_param("name", str, regex=r"\d+")
+        parser.add_param("age", int)
+        parser.add_param("tags", list, action=lambda x: [i.strip() for i in x])
+        parser.add_param("stage", str, choices=["alpha", "beta"])
+        # Raise first, so the exception class is not cold when profiled, as in a full test run
+        with self.assertRaises(ParserInvalidChoiceError):
+            parser.parse_dict({"stage": "gamma"})
+        workload = [{"name": 12345, "age": "32", "tags": [" a ", "b "]}] * 20 + [{"stage": "gamma"}] * 5
+        report = parser.profile(workload)
+
+        self.assertIsInstance(report, ProfileReport)
+        self.assertEqual(report.parses, 25)
+        self.assertEqual(report.rejected, {"ParserInvalidChoiceError": 5})
+        self.assertEqual(tuple(report.stages), STAGES)
+        stages = ["namespace", "action", "exception"]
+        if hasattr(tracemalloc, "reset_peak"):
+            # Before Python 3.9 only net allocations are measured, and matching a regex frees what it allocates
+            stages.append("regex")
+        for stage in stages:
+            self.assertGreater(report.stages[stage].bytes_per_parse, 0, stage)
+        self.assertAlmostEqual(report.bytes_per_parse, sum(s.allocated for s in report.stages.values()) / 25)
+        self.assertIn("rejected ParserInvalidChoiceError: 5", str(report))
+
+    def test_profile_no_exceptions(self):
+        """ Stages which do not run allocate nothing """
+
+        parser = DictionaryParser()
+        parser.add_param("name", str, regex=r"\d+")
+        parser.add_param("age", int)
+        report = parser.profile([{"age": 1}] * 5)
+
+        self.assertEqual(report.rejected, {})
+        self.assertEqual(report.stages["exception"].allocated, 0)
+        self.assertEqual(report.stages["regex"].allocated, 0)
+
+    def test_profile_exception_stage(self):
+        """ Raising an exception is charged to the exception stage """
+
+        parser = DictionaryParser()
+        parser.add_param("stage", str, choices=["alpha", "beta"])
+        for _ in range(3):
+            with self.assertRaises(ParserInvalidChoiceError):
+                parser.parse_dict({"stage": "gamma"})
+
+        report = parser.profile([{"stage": "gamma"}] * 10)
+
+        self.assertGreater(report.stages["exception"].bytes_per_parse, 0)
+
+    def test_profile_stages_attributed_by_function(self):
+        """ Cached parses are not charged to the stages they skip """
+
+        parser = DictionaryParser(cache_size=8)
+        parser.add_param("age", int, minimum=0)
+        parser.parse_dict({"age": "5000"})
+
+        report = parser.profile([{"age": "5000"}] * 5)
+
+        self.assertEqual(parser.cache_info().hits, 5)
+        for stage in ("namespace", "conversion", "regex", "action", "exception"):
+            self.assertEqual(report.stages[stage].allocated, 0, stage)
+
+    def test_profile_restores_tracing(self):
+        """ Tracing is restored after profiling """
+
+        parser = DictionaryParser()
+        parser.add_param("age", int)
+        trace = sys.gettrace()
+        parser.profile([{"age": 1}])
+
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertIs(sys.gettrace(), trace)
+
+    def test_profile_empty_workload(self):
+        """ An empty workload gives an empty report """
+
+        parser = DictionaryParser()
+        parser.add_param("age", int)
+        report = parser.profile([])
+
+        self.assertEqual(report.parses, 0)
+        self.assertEqual(report.bytes_per_parse, 0)
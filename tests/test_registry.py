@@ -0,0 +1,132 @@
+from dictparse import DictionaryParser
+from dictparse.registry import ParserRegistry
+from dictparse.exceptions import ParserRequiredKeyError
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+import unittest
+
+
+def _definition(tenant: int) -> str:
+    parser = DictionaryParser(description=f"Tenant {tenant}")
+    parser.add_param("name", str, required=True)
+    parser.add_param("age", int, default=18)
+    parser.add_param(f"field_{tenant}", str, choices=["a", "b"])
+    return json.dumps(parser.to_json_schema())
+
+
+class TestRegistry(unittest.TestCase):
+
+    def test_get(self):
+
+        registry = ParserRegistry()
+        parser = registry.get(_definition(1))
+
+        self.assertEqual(parser.parse_dict({"name": "foo", "field_1": "a"}).to_tuple(), ("foo", 18, "a"))
+        with self.assertRaises(ParserRequiredKeyError):
+            parser.parse_dict({})
+        self.assertIs(registry.get(_definition(1)), parser)
+        self.assertIs(registry.get(json.loads(_definition(1))), registry.get(json.loads(_definition(1))))
+
+        info = registry.info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (3, 1, 1))
+
+    def test_property_order_kept(self):
+        """ Parameters are added in the order of the properties of the definition """
+
+        registry = ParserRegistry()
+        parser = registry.get({"properties": {"b": {}, "a": {}}})
+
+        self.assertEqual(parser.parse_dict({"a": 1, "b": 2}).to_tuple(), (2, 1))
+
+    def test_params_shared(self):
+
+        registry = ParserRegistry()
+        parsers = [registry.get(_definition(i)) for i in range(10)]
+
+        self.assertIs(parsers[0]._params["name"], parsers[9]._params["name"])
+        self.assertIsNot(parsers[0]._params["field_0"], parsers[9]._params["field_9"])
+        info = registry.info()
+        self.assertEqual(info.param_refs, 30)
+        self.assertEqual(info.params, 12)
+        self.assertGreater(info.param_bytes, 0)
+
+        # Parsing with a shared Param does not affect the other parsers
+        self.assertEqual(parsers[0].parse_dict({"name": "foo"}).name, "foo")
+        self.assertEqual(parsers[1].parse_dict({"name": "bar"}).get_param("name").value, "bar")
+        self.assertIsNone(parsers[0]._params["name"].value)
+
+    def test_lru_eviction(self):
+
+        registry = ParserRegistry(maxsize=2, shards=1)
+        first = registry.get(_definition(1))
+        registry.get(_definition(2))
+        registry.get(_definition(1))
+        registry.get(_definition(3))
+
+        info = registry.info()
+        self.assertEqual((info.currsize, info.evictions), (2, 1))
+        self.assertIs(registry.get(_definition(1)), first)
+        self.assertEqual(registry.info().misses, 3)
+        registry.get(_definition(2))
+        self.assertEqual(registry.info().misses, 4)
+
+    def test_maxsize_not_exceeded_by_shards(self):
+
+        registry = ParserRegistry(maxsize=17)
+        self.assertEqual(sum(shard.maxsize for shard in registry._shards), 17)
+
+        for i in range(200):
+            registry.get(_definition(i))
+        self.assertLessEqual(registry.info().currsize, 17)
+
+        registry = ParserRegistry(maxsize=4, maxbytes=50, shards=16)
+        self.assertEqual(sum(shard.maxbytes for shard in registry._shards), 50)
+        self.assertEqual(len(registry._shards), 4)
+
+    def test_size_eviction(self):
+
+        registry = ParserRegistry(shards=1)
+        registry.get(_definition(1))
+        size = registry.info().currbytes
+
+        registry = ParserRegistry(maxbytes=size * 2, shards=1)
+        for i in range(5):
+            registry.get(_definition(i))
+
+        info = registry.info()
+        self.assertLessEqual(info.currbytes, size * 2)
+        self.assertEqual(info.currsize, 2)
+        self.assertEqual(info.evictions, 3)
+
+    def test_clear(self):
+
+        registry = ParserRegistry()
+        registry.get(_definition(1))
+        registry.clear()
+
+        info = registry.info()
+        self.assertEqual((info.currsize, info.currbytes, info.param_refs, info.params), (0, 0, 0, 0))
+        self.assertEqual(info.misses, 1)
+
+    def test_threads(self):
+
+        registry = ParserRegistry(maxsize=64)
+
+        def parse(i):
+            return registry.get(_definition(i % 4)).parse_dict({"name": str(i)}).name
+
+        with ThreadPoolExecutor(8) as executor:
+            self.assertEqual(list(executor.map(parse, range(200))), [str(i) for i in range(200)])
+        self.assertEqual(registry.info().currsize, 4)
+
+    def test_invalid(self):
+
+        with self.assertRaises(ValueError):
+            ParserRegistry(maxsize=0)
+        with self.assertRaises(ValueError):
+            ParserRegistry(maxbytes=0)
+        with self.assertRaises(ValueError):
+            ParserRegistry(shards=0)
+        with self.assertRaises(ValueError):
+            ParserRegistry().get('{"type": "array"}')
@@ -0,0 +1,151 @@
+from dictparse import DictionaryParser
+from dictparse.exceptions import ParserRequiredKeyError, ParserInvalidChoiceError, ParserConstraintError
+
+import json
+import unittest
+
+
+class TestSchema(unittest.TestCase):
+
+    def test_to_json_schema(self):
+        """ Each parameter is described by a JSON Schema property """
+
+        parser = DictionaryParser(description="Create a new user")
+        parser.add_param("name", str, required=True, description="The user's name")
+        parser.add_param("age", int, default=18)
+        parser.add_param("stage", str, choices=["alpha", "beta"])
+        parser.add_param("code", str, regex=r"\d{3}", dest="ref")
+        parser.add_param("tags", set)
+        parser.add_param("active", bool, aliases=["isActive"])
+        schema = parser.to_json_schema()
+
+        self.assertEqual(schema["type"], "object")
+        self.assertEqual(schema["description"], "Create a new user")
+        self.assertEqual(schema["required"], ["name"])
+        self.assertEqual(
+            schema["properties"]["name"], {"type": "string", "description": "The user's name"}
+        )
+        self.assertEqual(schema["properties"]["age"], {"type": "integer", "default": 18})
+        self.assertEqual(schema["properties"]["stage"], {"type": "string", "enum": ["alpha", "beta"]})
+        self.assertEqual(
+            schema["properties"]["code"], {"type": "string", "pattern": r"^(?:\d{3})", "x-dest": "ref"}
+        )
+        self.assertEqual(
+            schema["properties"]["tags"], {"type": "array", "x-python-type": "set", "uniqueItems": True}
+        )
+        json.dumps(schema)
+
+    def test_round_trip(self):
+        """ A parser loaded from its schema parses like the original """
+
+        parser = DictionaryParser(description="Create a new user")
+        parser.add_param("name", str, required=True, description="The user's name")
+        parser.add_param("age", int, default=18)
+        parser.add_param("stage", str, choices=["alpha", "beta"])
+        parser.add_param("code", str, regex=r"\d{3}", dest="ref")
+        parser.add_param("tags", set)
+        parser.add_param("active", bool, aliases=["isActive"])
+        loaded = DictionaryParser.from_json_schema(parser.to_json_schema())
+        payload = {"name": "foo", "age": "32", "stage": "beta", "code": "123x", "tags": ["a", "a"], "isActive": "no"}
+
+        self.assertEqual(loaded.parse_dict(payload).to_dict(), parser.parse_dict(payload).to_dict())
+        self.assertEqual(loaded.to_json_schema(), parser.to_json_schema())
+
+    def test_elements_round_trip(self):
+        """ Element and length options are kept through a schema """
+
+        parser = DictionaryParser()
+        parser.add_param("ids", list, element_type=int, min_length=1, max_length=3, array=True)
+        parser.add_param("langs", set, element_choices=["python", "bash"], element_regex="[a-z]+")
+        parser.add_param("name", str, min_length=2)
+        schema = parser.to_json_schema()
+
+        self.assertEqual(
+            schema["properties"]["ids"],
+            {"type": "array", "items": {"type": "integer"}, "minItems": 1, "maxItems": 3, "x-array": True}
+        )
+        self.assertEqual(schema["properties"]["name"], {"type": "string", "minLength": 2})
+
+        loaded = DictionaryParser.from_json_schema(schema)
+        payload = {"ids": ["1", 2], "langs": ["bash"], "name": "foo"}
+        self.assertEqual(loaded.parse_dict(payload).to_dict(), parser.parse_dict(payload).to_dict())
+        self.assertEqual(loaded.to_json_schema()["properties"]["ids"], schema["properties"]["ids"])
+
+    def test_container_choices_round_trip(self):
+        """ Choices of container parameters are kept through a schema """
+
+        parser = DictionaryParser()
+        parser.add_param("point", tuple, choices=[(0, 0), (1, 1)], default=(0, 0))
+        parser.add_param("flags", set, choices=[{"a", "b"}], default={"a", "b"})
+        loaded = DictionaryParser.from_json_schema(parser.to_json_schema())
+
+        payload = {"point": [1, 1], "flags": ["b", "a"]}
+        self.assertEqual(loaded.parse_dict(payload).to_dict(), parser.parse_dict(payload).to_dict())
+        self.assertEqual(loaded.parse_dict({}).to_dict(), {"point": (0, 0), "flags": {"a", "b"}})
+        self.assertEqual(loaded._params["point"].choices, [(0, 0), (1, 1)])
+
+    def test_from_json_schema(self):
+        """ Builds a parser from a JSON Schema document """
+
+        parser = DictionaryParser.from_json_schema(json.dumps({
+            "type": "object",
+            "properties": {
+                "method": {"type": "string", "enum": ["card", "cash"]},
+                "amount": {"type": "number", "minimum": 0},
+                "ref": {"type": "string", "pattern": "[0-9]+"},
+            },
+            "required": ["method"]
+        }))
+
+        params = parser.parse_dict({"method": "card", "amount": "1.5", "ref": "ab12"})
+        self.assertEqual(params.amount, 1.5)
+        self.assertEqual(params.ref, "ab12")
+
+        with self.assertRaises(ParserRequiredKeyError):
+            parser.parse_dict({"amount": 1})
+        with self.assertRaises(ParserInvalidChoiceError):
+            parser.parse_dict({"method": "cheque"})
+
+    def test_from_json_schema_cached_per_document(self):
+        """ Equal documents reuse the parsed parameters """
+
+        first = DictionaryParser.from_json_schema({"properties": {"a": {"type": "string"}, "b": {}}})
+        second = DictionaryParser.from_json_schema('{"properties": {"a": {"type": "string"}, "b": {}}}')
+        other = DictionaryParser.from_json_schema({"properties": {"a": {"type": "integer"}}})
+
+        self.assertIsNot(first, second)
+        self.assertIs(first._params["a"], second._params["a"])
+        self.assertIsNot(first._params["a"], other._params["a"])
+
+    def test_from_json_schema_parsers_not_shared(self):
+        """ Each call returns its own parser """
+
+        schema = {"properties": {"start": {"type": "integer"}, "end": {"type": "integer"}}}
+        first = DictionaryParser.from_json_schema(schema)
+        first.add_constraint("end", ">", "start")
+        first.add_param("name", str)
+        second = DictionaryParser.from_json_schema(schema)
+
+        self.assertEqual(second.parse_dict({"start": 2, "end": 1}).to_dict(), {"start": 2, "end": 1})
+        self.assertEqual(list(second._params), ["start", "end"])
+        with self.assertRaises(ParserConstraintError):
+            first.parse_dict({"start": 2, "end": 1})
+
+    def test_from_json_schema_invalid(self):
+        """ Raises a ValueError for schemas which cannot be loaded """
+
+        schemas = [
+            {"type": "array"},
+            {"properties": {"a": {"type": "null"}}},
+            {"properties": {"a": {"type": ["string", "null"]}}},
+            {"properties": {"a": {"type": "array", "items": {"type": ["string", "null"]}}}},
+            {"properties": {"get": {"type": "string"}}},
+            {"properties": {"a": {"x-dest": "1a"}}},
+            {"properties": {"a": {"enum": "abc"}}},
+            {"properties": {"a": {}}, "required": ["b"]},
+            {"properties": {"a": {"type": "string", "minLength": 3, "maxLength": 2}}},
+            {"properties": {"a": {"type": "array", "minItems": 3, "maxItems": 2}}},
+        ]
+        for schema in schemas:
+            with self.assertRaises(ValueError):
+                DictionaryParser.from_json_schema(schema)